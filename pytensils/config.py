@@ -2,14 +2,77 @@
 
 from __future__ import annotations
 import os
+import re
+import sys
+import glob
+import uuid
 import json
 import copy
+import stat
+import atexit
+import asyncio
+import functools
+import keyword
+import weakref
+import struct
+import mmap
+import marshal
+import hashlib
+import tempfile
+import threading
+import collections
+import collections.abc
+import contextlib
+import dataclasses
+import concurrent.futures
 import pandas as pd
-from typing import Union, Tuple
-from pytensils import logging, errors
+from typing import Union, Tuple, Callable, Iterable, Any, AsyncIterator
+from pytensils import logging, errors, utils
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Static variable(s)
+CACHE_SIZE = 128
 
 # Private static variable(s)
 _MIN_DEPTH = 2
+_CACHE = collections.OrderedDict()
+_SCHEMAS = collections.OrderedDict()
+_MISSING = object()
+_DTYPES = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'list': list,
+    'dict': dict,
+    'NoneType': type(None)
+}
+_CACHE_LOCK = threading.Lock()
+_ASYNC_LOCK = threading.Lock()
+_EXECUTOR = None
+_READS = {}
+_WRITE_LOCKS = {}
+_HANDLERS = weakref.WeakValueDictionary()
+_HANDLERS_LOCK = threading.Lock()
+_HANDLER_LOCKS = {}
+_SIDECAR_VERSION = None
+_KEY_PATTERN = re.compile(rb'\s*("(?:[^"\\]|\\.)*")\s*:\s*')
+_SEPARATOR_PATTERN = re.compile(rb'\s*([,}])')
+_TOKEN_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_SCALAR_PATTERN = re.compile(rb'[^,}\s]*')
+_EMPTY_PATTERN = re.compile(rb'\s*}')
+_SKIP_PATTERN = re.compile(
+    rb'[^"{}\[\]]*(?:(?:"[^"\\]*(?:\\.[^"\\]*)*"'
+    rb'|\[[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*\]'
+    rb'|\{[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*\})'
+    rb'[^"{}\[\]]*)*'
+)
+_CONTROL_FORMAT = '<QQQ'
+_DTYPE_PATTERN = re.compile(r'\s*([A-Za-z_][\w.]*|[\[\],|])')
 
 
 class Handler():
@@ -29,6 +92,14 @@ class Handler():
         An instance of the `pytensils.logging.Handler` class that allows
             for native 'pretty' user-logging of all `ValidationError`
             exceptions.
+    sidecar: `bool`
+        `True` or `False`, stores the parsed and validated config data
+            in a binary sidecar-file, '.{file_name}.cache', within `path`
+            when `True`, re-using it on read for as long as it is fresh.
+    lazy: `bool`
+        `True` or `False`, indexes the sections of the config-file on read
+            and parses each section only when it is first accessed
+            when `True`.
     """
 
     def __init__(
@@ -36,7 +107,9 @@ class Handler():
         path: str,
         file_name: str = 'config.json',
         create: bool = False,
-        Logging: Union[logging.Handler, None] = None
+        Logging: Union[logging.Handler, None] = None,
+        sidecar: bool = False,
+        lazy: bool = False
     ):
         """ Initializes an instance of the configuration-handler class.
 
@@ -54,6 +127,15 @@ class Handler():
             An instance of the `pytensils.logging.Handler` class that allows
                 for native 'pretty' user-logging of all `ValidationError`
                 exceptions.
+        sidecar: `bool`
+            `True` or `False`, stores the parsed and validated config data
+                in a binary sidecar-file, '.{file_name}.cache', within
+                `path` when `True`, re-using it on read for as long as it
+                is fresh.
+        lazy: `bool`
+            `True` or `False`, indexes the sections of the config-file on
+                read and parses each section only when it is first
+                accessed when `True`.
         """
 
         # Assign class variables
@@ -64,6 +146,18 @@ class Handler():
 
         # Assign private variables
         self._LOGGING = Logging
+        self._SIDECAR = sidecar
+        self._LAZY = lazy
+        self._OVERRIDES = {}
+        self._BASE = {}
+        self._SHARED = None
+        self._STAT_KEY = None
+        self._DIGEST = None
+        self._REJECTED_STAT_KEY = None
+        self._CALLBACKS = []
+        self._WATCHER = None
+        self._WATCH_STOP = threading.Event()
+        self._WATCH_LOCK = threading.Lock()
 
         # Validate the file-path
         if not os.path.isdir(path):
@@ -134,18 +228,62 @@ class Handler():
     def read(self) -> dict:
         """ Reads a '.json' config-file, updates the config data
         and returns the content as a `dict`.
+
+        The parsed and validated content is cached by the absolute
+        file-path, and is re-used for as long as the modification time,
+        size and inode of the config-file are unchanged. When `sidecar` is
+        `True`, the content is also re-used across processes from the
+        sidecar-file for as long as the config-file is unchanged.
+
+        When `lazy` is `True`, the config data is returned as a
+        `pytensils.config.LazyDict` of the sections of the config-file
+        that parses each section when it is first accessed. The index of
+        the sections is cached likewise.
         """
+        file_path = os.path.abspath(os.path.join(self.path, self.file_name))
+
+        # Return the lazily-loaded config data
+        stat_key = _return_stat_key(file_path=file_path)
+        if self._LAZY:
+            lazy_object = _return_lazy(file_path=file_path, stat_key=stat_key)
+            if lazy_object is not None:
+                self.data = self._apply_overrides(data=lazy_object)
+                self._STAT_KEY = stat_key
+                self._DIGEST = None
+                return self._apply_overrides(
+                    data=_return_lazy(file_path=file_path, stat_key=stat_key)
+                )
+
+        # Return the cached config data
+        entry = _return_cached(file_path=file_path, stat_key=stat_key)
+        if entry is None and self._SIDECAR:
+            entry = _return_sidecar(file_path=file_path, stat_key=stat_key)
+            if entry is not None:
+                _cache(
+                    file_path=file_path,
+                    stat_key=stat_key,
+                    cached=entry[0],
+                    digest=entry[1]
+                )
+        if entry is not None:
+            cached, digest = entry
+            self.data = self._apply_overrides(data=marshal.loads(cached))
+            self._STAT_KEY = stat_key
+            self._DIGEST = digest
+            return self._apply_overrides(data=marshal.loads(cached))
+
         with open(
             os.path.join(
                 self.path,
                 self.file_name
             ),
-            mode='r'
+            mode='rb'
         ) as file:
             try:
 
                 # Load `.json` config-file
-                dict_object = json.load(file)
+                document = file.read()
+                dict_object = utils.json_loads(document)
 
                 # Validate instance
                 self._validate_instance(
@@ -174,10 +312,29 @@ class Handler():
                     )
                 )
 
+                # Cache the config data
+                cached = marshal.dumps(dict_object)
+                digest = _return_digest(document=document)
+                _cache(
+                    file_path=file_path,
+                    stat_key=stat_key,
+                    cached=cached,
+                    digest=digest
+                )
+                if self._SIDECAR:
+                    _write_sidecar(
+                        file_path=file_path,
+                        stat_key=stat_key,
+                        cached=cached,
+                        digest=digest
+                    )
+
                 # Update the config data
-                self.data = copy.deepcopy(dict_object)
+                self.data = self._apply_overrides(data=marshal.loads(cached))
+                self._STAT_KEY = stat_key
+                self._DIGEST = digest
 
-                return dict_object
+                return self._apply_overrides(data=dict_object)
 
             except json.decoder.JSONDecodeError:
                 if self._LOGGING:
@@ -213,58 +370,150 @@ class Handler():
                         )
                     )
 
-    def write(self):
-        """ Writes a '.json' config-file. """
-        with open(
-            os.path.join(
-                self.path,
-                self.file_name
-            ),
-            mode='w+'
-        ) as file:
-            json.dump(
-                self.data,
-                file,
-                indent=4
+    def write(
+        self,
+        fsync: bool = False,
+        optimistic: bool = False
+    ):
+        """ Writes a '.json' config-file.
+
+        The config-file is written to a temporary file within `path` that
+        then replaces the config-file, so that readers never observe a
+        partially written config-file. The write is skipped when the
+        content is identical to the content last read or written by this
+        instance and the config-file is unchanged since.
+
+        Values overlaid by `override_from_env()` are written as their values
+        prior to the overlay, unless they were changed since.
+
+        When `optimistic` is `True`, the config-file is replaced while
+        holding an advisory lock on '.{file_name}.lock' within `path`, and
+        a `ConflictError` is raised instead when the config-file was changed
+        by another writer since it was last read or written by this
+        instance. The modification time, size and inode of the config-file,
+        or otherwise its digest, serve as its version.
+
+        Parameters
+        ----------
+        fsync : `bool`
+            `True` or `False`, flushes the config-file and its directory to
+                disk when `True`.
+        optimistic : `bool`
+            `True` or `False`, raises a `ConflictError` rather than
+                overwriting the changes of another writer when `True`.
+        """
+        file_path = os.path.abspath(os.path.join(self.path, self.file_name))
+        document = utils.json_dumps(
+            self._remove_overrides(data=self.data),
+            indent=4
+        )
+        digest = _return_digest(document=document.encode())
+
+        # Skip unchanged content
+        if digest == self._DIGEST:
+            try:
+                if _return_stat_key(file_path=file_path) == self._STAT_KEY:
+                    return None
+            except OSError:
+                pass
+
+        # Invalidate the cached config data
+        _uncache(file_path=file_path)
+
+        # Replace the config-file
+        try:
+            stat_key = _write_atomic(
+                file_path=file_path,
+                content=document,
+                fsync=fsync,
+                check=self._check_version if optimistic else None
             )
+        except errors.config.ConflictError as e:
+            if self._LOGGING:
+
+                # Logging
+                self._LOGGING.write_header(
+                    header='Configuration write'
+                )
+                self._LOGGING.write(
+                    content=str(e),
+                    level='ERROR'
+                )
+                self._LOGGING.close()
+
+                # Raise exception
+                raise errors.config.ConflictError(
+                    'Write conflict. See {%s} for more information.' % (
+                        os.path.join(
+                            self._LOGGING.path,
+                            self._LOGGING.file_name
+                        )
+                    )
+                )
+            raise
+
+        self._STAT_KEY = stat_key
+        self._DIGEST = digest
+
+    def _check_version(
+        self,
+        file_path: str
+    ):
+        """ Raises a `ConflictError` when the config-file, `file_path`, was
+        changed since it was last read or written by this instance.
+
+        Parameters
+        ----------
+        file_path : `str`
+            Absolute file-path of the config-file.
+        """
+        try:
+            stat_key = _return_stat_key(file_path=file_path)
+        except FileNotFoundError:
+            stat_key = None
+        if stat_key == self._STAT_KEY:
+            return None
+
+        # Compare the digest when the config-file was touched
+        if stat_key is not None and self._DIGEST is not None:
+            with open(file_path, 'rb') as file:
+                if _return_digest(document=file.read()) == self._DIGEST:
+                    return None
+
+        raise errors.config.ConflictError(
+            ''.join([
+                '{%s} was changed by another writer since' % (
+                    self.file_name
+                ),
+                ' it was last read. Re-read the config-file and retry.'
+            ])
+        )
 
     def validate(
         self,
-        dtypes: Union[dict, Handler],
+        dtypes: Union[dict, Handler, Schema],
     ) -> bool:
         """ Validates the config-file data against the dtypes in `dtypes`.
         Returns `True` when validation completes successfully.
 
         Parameters
         ----------
-        dtypes : Union[`dict`, `pytensils.config.Handler`]
-            Dictionary object that contains the expected
-                configuration value dtypes.
+        dtypes : Union[`dict`, `pytensils.config.Handler`,
+                `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
         """
-        assert type(dtypes) in [dict, Handler], (
+        assert type(dtypes) in [dict, Handler, Schema], (
             ''.join([
                 '{dtypes} must be either a `dict` or an instance of',
-                ' `pytensils.config.Handler`.'
+                ' `pytensils.config.Handler` or `pytensils.config.Schema`.'
             ])
         )
 
-        # Parse the config data as a dictionary
-        if isinstance(dtypes, Handler):
-            dtypes = dtypes.to_dict()
-
-        # Validate instance
-        self._validate_instance(dict_object=dtypes, parameter='dtypes')
-
-        # Validate data
-        self._validate_data(dict_object=dtypes, parameter='dtypes')
-
-        # Validate depth
-        self._validate_depth(dict_object=dtypes, parameter='dtypes')
-
         # Validate dtypes
         self._validate_dtypes(
-            dict_object=copy.deepcopy(self.data),
-            dtype_object=dtypes
+            dict_object=self.data,
+            dtype_object=self._return_schema(dtypes=dtypes)
         )
 
         # Set validation error status
@@ -272,333 +521,3745 @@ class Handler():
 
         return True
 
-    def to_dict(self) -> dict:
-        """ Returns a dictionary object of the config-file data. """
-        return copy.deepcopy(self.data)
-
-    def from_dict(
+    def override_from_env(
         self,
-        dict_object: dict,
-        dtypes: Union[dict, None] = None
-    ):
-        """ Updates the config-file data with the contents of `dict_object`
-        and validates the configuration against `dtypes` when
-        `dtypes` is not None.
+        prefix: str,
+        dtypes: Union[dict, Handler, Schema, None] = None
+    ) -> dict:
+        """ Overlays the config data with the values of the environment
+        variables named '{prefix}__{section}__{key}', matching the section
+        and key case-insensitively, and returns the overrides as a `dict`.
+
+        The environment variables are parsed once, converting each value
+        to the dtype of the key in `dtypes`, or to the dtype of the current
+        config value when `dtypes` is None, via `pytensils.utils.as_type`.
+        Each option of a union dtype is tried in order, with `None` tried
+        last, and the converted value is validated against the dtype. The
+        overrides are re-applied on every subsequent `read()`, and are
+        not written to the config-file by `write()`.
 
         Parameters
         ----------
-        dict_object : `dict`
-            Dictionary object containing configuration values.
-        dtypes : `dict`
-            Dictionary object that contains the expected
-                configuration value dtypes.
+        prefix : `str`
+            The prefix of the names of the environment variables.
+        dtypes : Union[`dict`, `pytensils.config.Handler`,
+                `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
         """
+        # Remove the previous overrides
+        if self._OVERRIDES:
+            self.data = self._remove_overrides(data=self.data)
 
-        # Validate instance
-        self._validate_instance(
-            dict_object=dict_object,
-            parameter='dict_object'
-        )
+        if dtypes is not None:
+            dtypes = self._return_schema(dtypes=dtypes).dtypes
+        else:
+            dtypes = {
+                section: {
+                    key: type(value).__name__
+                    for key, value in values.items()
+                }
+                for section, values in _return_materialized(
+                    value=self.data
+                ).items()
+                if isinstance(values, dict)
+            }
 
-        # Validate data
-        self._validate_data(
-            dict_object=dict_object,
-            parameter='dict_object'
+        # Compile the overrides
+        self._OVERRIDES = self._compile_overrides(
+            prefix=prefix,
+            dtypes=dtypes
         )
 
-        # Validate depth
-        self._validate_depth(
-            dict_object=dict_object,
-            parameter='dict_object'
-        )
+        # Apply the overrides
+        self._apply_overrides(data=self.data)
 
-        if dtypes:
+        return copy.deepcopy(self._OVERRIDES)
 
-            # Validate instance
-            self._validate_instance(dict_object=dtypes, parameter='dtypes')
+    def on_change(
+        self,
+        callback: Callable
+    ):
+        """ Registers `callback` to be called with a `dict` of the changed
+        sections, mapping each section to its new value or `None` when the
+        section was removed, whenever `poll()` re-loads the config-file.
 
-            # Validate data
-            self._validate_data(dict_object=dtypes, parameter='dtypes')
+        Parameters
+        ----------
+        callback : `Callable`
+            Function object that accepts the changed sections.
+        """
+        self._CALLBACKS.append(callback)
 
-            # Validate depth
-            self._validate_depth(dict_object=dtypes, parameter='dtypes')
+    def poll(
+        self,
+        dtypes: Union[dict, Handler, None] = None
+    ) -> dict:
+        """ Re-loads the config-file when its modification time, size or
+        inode have changed, validating the content against `dtypes` when
+        `dtypes` is not None. Returns a `dict` of the changed sections.
 
-            # Validate dtypes
-            self._validate_dtypes(dict_object=dict_object, dtype_object=dtypes)
+        Should the changed config-file be invalid, the last valid config
+        data is retained and an empty `dict` is returned.
 
-        # Retain configuration data
-        self.data = copy.deepcopy(dict_object)
+        Parameters
+        ----------
+        dtypes : Union[`dict`, `pytensils.config.Handler`]
+            Dictionary object that contains the expected
+                configuration value dtypes.
+        """
+        with self._WATCH_LOCK:
+            try:
+                stat_key = _return_stat_key(
+                    file_path=os.path.join(self.path, self.file_name)
+                )
+            except OSError:
+                return {}
 
-        # Write configuration data
-        self.write()
+            if stat_key in (self._STAT_KEY, self._REJECTED_STAT_KEY):
+                return {}
 
-        return self
+            # Read and validate the config-file without logging
+            try:
+                candidate = Handler(
+                    path=self.path,
+                    file_name=self.file_name,
+                    sidecar=self._SIDECAR,
+                    lazy=self._LAZY
+                )
+                candidate._OVERRIDES = self._OVERRIDES
+                candidate._apply_overrides(data=candidate.data)
+                if dtypes is not None:
+                    candidate.validate(dtypes=dtypes)
+            except errors.config.all():
 
-    def _validate_instance(
+                # Retain the stat of the rejected config-file separately, so
+                #   that `_STAT_KEY` remains the stat of the config-file
+                #   content whose digest is `_DIGEST`
+                self._REJECTED_STAT_KEY = stat_key
+                return {}
+
+            # Swap the config data
+            previous = self.data
+            self.data = candidate.data
+            self._BASE = candidate._BASE
+            self._STAT_KEY = candidate._STAT_KEY
+            self._DIGEST = candidate._DIGEST
+
+            changed = {
+                section: self.data.get(section)
+                for section in list(previous.keys()) + [
+                    section for section in self.data.keys()
+                    if section not in previous
+                ]
+                if previous.get(section) != self.data.get(section)
+            }
+
+        # Notify
+        if changed:
+            for callback in list(self._CALLBACKS):
+                callback(changed)
+
+        return changed
+
+    def watch(
         self,
-        dict_object: dict,
-        parameter: str
+        dtypes: Union[dict, Handler, None] = None,
+        interval: float = 1.0,
+        max_interval: float = 30.0
     ):
-        """ Validates the type instance of `dict_object`.
+        """ Starts a background thread that polls the config-file for
+        changes, see `poll()`. The polling interval doubles, up to
+        `max_interval` seconds, while the config-file is unchanged and
+        resets to `interval` seconds after each change.
 
         Parameters
         ----------
-        dict_object : `dict`
-            Dictionary object to validate.
-        parameter : 'str'
-            The name of the parameter to report in the error message.
+        dtypes : Union[`dict`, `pytensils.config.Handler`]
+            Dictionary object that contains the expected
+                configuration value dtypes.
+        interval : `float`
+            The minimum number of seconds between polls.
+        max_interval : `float`
+            The maximum number of seconds between polls.
         """
-        error_msg = 'Invalid data type {%s} for {%s}. Expected {dict}.' % (
-            type(dict_object).__name__,
-            parameter
+        if self._WATCHER is not None and self._WATCHER.is_alive():
+            raise RuntimeError(
+                '{%s} is already being watched.' % (
+                    os.path.join(self.path, self.file_name)
+                )
+            )
+
+        def watcher():
+            wait = interval
+            while not self._WATCH_STOP.wait(timeout=wait):
+                try:
+                    changed = self.poll(dtypes=dtypes)
+                except Exception as e:
+                    changed = {}
+                    if self._LOGGING:
+                        self._LOGGING.write(
+                            content='Config-file watcher error {%s: %s}.' % (
+                                type(e).__name__,
+                                str(e)
+                            ),
+                            level='ERROR'
+                        )
+                wait = interval if changed else min(wait * 2, max_interval)
+
+        self._WATCH_STOP.clear()
+        self._WATCHER = threading.Thread(
+            target=watcher,
+            name='pytensils-config-watcher',
+            daemon=True
         )
+        self._WATCHER.start()
 
-        if not isinstance(dict_object, dict):
-            if self._LOGGING:
-                self._raise_general_validation_error(error_msg=error_msg)
-            raise errors.config.ValidationError(error_msg)
+    def unwatch(self):
+        """ Stops the background thread started by `watch()`. """
+        self._WATCH_STOP.set()
+        if self._WATCHER is not None:
+            self._WATCHER.join()
+            self._WATCHER = None
 
-    def _validate_data(
+    async def aread(self) -> dict:
+        """ Reads a '.json' config-file without blocking the event loop, see
+        `read()`. The config-file is read within a worker thread, and
+        concurrent reads of the same config-file wait on a single load that
+        each then re-uses from the in-process cache.
+        """
+        file_path = os.path.abspath(os.path.join(self.path, self.file_name))
+
+        # Join the in-flight read of the config-file
+        executor = _return_executor()
+        with _ASYNC_LOCK:
+            future = _READS.get(file_path)
+            leader = future is None
+            if leader:
+                future = executor.submit(self.read)
+                _READS[file_path] = future
+        if leader:
+            future.add_done_callback(
+                functools.partial(_release_read, file_path)
+            )
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        try:
+            await asyncio.shield(asyncio.wrap_future(future))
+        except Exception:
+            pass
+
+        return await _run_in_executor(self.read)
+
+    async def awrite(
         self,
-        dict_object: dict,
-        parameter: str
+        fsync: bool = False,
+        optimistic: bool = False
     ):
-        """ Validates the data in `dict_object`.
+        """ Writes a '.json' config-file without blocking the event loop, see
+        `write()`. The config-file is written within a worker thread, and
+        concurrent writes of the same config-file are serialized.
 
         Parameters
         ----------
-        dict_object : `dict`
-            Dictionary object to validate.
-        parameter : `dict`
-            The name of the parameter to report in the error message.
+        fsync : `bool`
+            `True` or `False`, flushes the config-file and its directory to
+                disk when `True`.
+        optimistic : `bool`
+            `True` or `False`, raises a `ConflictError` rather than
+                overwriting the changes of another writer when `True`.
         """
-        error_msg = '{%s} is empty.' % (
-            parameter
+        return await _run_in_executor(
+            _call_serialized,
+            os.path.abspath(os.path.join(self.path, self.file_name)),
+            functools.partial(
+                self.write,
+                fsync=fsync,
+                optimistic=optimistic
+            )
         )
 
-        if not dict_object:
-            if self._LOGGING:
-                self._raise_general_validation_error(error_msg=error_msg)
-            else:
-                raise errors.config.ValidationError(error_msg)
-
-    def _validate_depth(
+    async def afrom_dict(
         self,
         dict_object: dict,
-        parameter: str
+        dtypes: Union[dict, Schema, None] = None,
+        optimistic: bool = False
     ):
-        """ Validates the depth of `dict_object`.
+        """ Updates the config-file data with the contents of `dict_object`
+        without blocking the event loop, see `from_dict()`. The content is
+        validated and written within a worker thread, and concurrent writes
+        of the same config-file are serialized.
 
         Parameters
         ----------
         dict_object : `dict`
-            Dictionary object to validate.
+            Dictionary object containing configuration values.
+        dtypes : Union[`dict`, `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        optimistic : `bool`
+            `True` or `False`, raises a `ConflictError` rather than
+                overwriting the changes of another writer when `True`.
         """
-        error_msg = ''.join([
-            'The parameter {%s} must be a dictionary of' % (
-                parameter
-            ),
-            ' dictionaries with a minimum depth of {%s}.' % (
-                _MIN_DEPTH
+        return await _run_in_executor(
+            _call_serialized,
+            os.path.abspath(os.path.join(self.path, self.file_name)),
+            functools.partial(
+                self.from_dict,
+                dict_object=dict_object,
+                dtypes=dtypes,
+                optimistic=optimistic
             )
-        ])
-
-        if not logging._return_dictionary_depth(
-            dict_object=dict_object
-        ) >= _MIN_DEPTH:
-            if self._LOGGING:
-                self._raise_general_validation_error(error_msg=error_msg)
-            else:
-                raise errors.config.ValidationError(error_msg)
+        )
 
-    def _validate_dtypes(
+    async def awatch(
         self,
-        dict_object: dict,
-        dtype_object: dict
-    ):
-        """ Validates `dict_object` against the dtypes in `dtype_object`.
+        dtypes: Union[dict, Handler, None] = None,
+        interval: float = 1.0,
+        max_interval: float = 30.0
+    ) -> AsyncIterator[dict]:
+        """ Polls the config-file for changes without blocking the event
+        loop, see `poll()`, yielding a `dict` of the changed sections after
+        each change. The polling interval doubles, up to `max_interval`
+        seconds, while the config-file is unchanged and resets to
+        `interval` seconds after each change.
 
         Parameters
         ----------
-        dict_object : `dict`
-            Dictionary object containing configuration values.
-        dtype_object : `dict`
+        dtypes : Union[`dict`, `pytensils.config.Handler`]
             Dictionary object that contains the expected
                 configuration value dtypes.
+        interval : `float`
+            The minimum number of seconds between polls.
+        max_interval : `float`
+            The maximum number of seconds between polls.
         """
-        error_msg = ''.join([
-            'Validation failed. The following parameter values',
-            ' are inconsistent with the expected data-types.'
-        ])
-
-        # Parse configuration dtype errors
-        error, dtype_errors = self._parse_dtype_errors_to_dict(
-            dict_object=dict_object,
-            dtype_object=dtype_object
-        )
+        wait = interval
+        while True:
+            await asyncio.sleep(wait)
+            changed = await _run_in_executor(
+                functools.partial(self.poll, dtypes=dtypes)
+            )
+            if changed:
+                wait = interval
+                yield changed
+            else:
+                wait = min(wait * 2, max_interval)
 
-        # Retain configuration dtype errors
-        if error:
-            self.validation_errors = copy.deepcopy(dtype_errors)
+    @property
+    def data(self) -> Union[dict, LazyDict]:
+        """ The config-file data. """
+        return self._DATA
 
-            # Raise configuration dtype errors
-            if self._LOGGING:
-                self._raise_dtype_validation_error(error_msg=error_msg)
-            else:
-                raise errors.config.ValidationError(
-                    ''.join([
-                        error_msg,
-                        '\n%s' % (
-                            json.dumps(dtype_errors, indent=2)
-                        )
-                    ])
-                )
+    @data.setter
+    def data(
+        self,
+        value: Union[dict, LazyDict]
+    ):
+        self._DATA = value
 
-        else:
-            self.validation_errors = None
+        # Clear the cached config values
+        self._VALUES = {}
 
-    def _raise_general_validation_error(
+    def get(
         self,
-        error_msg: str
+        path: Union[str, tuple],
+        dtype: Union[str, None] = None,
+        default=_MISSING
     ):
-        """ Reports an error string to `logging.Handler` and raises
-        a `ValidationError`.
+        """ Returns the config value at `path`, e.g. 'section.key', converted
+        to `dtype` via `pytensils.utils.as_type` when `dtype` is not None.
+        Returns `default`, when provided, should `path` not exist, otherwise
+        raises a `KeyError`.
+
+        Converted config values are cached until the config-file data is
+        re-loaded or replaced.
+
+        Parameters
+        ----------
+        path : Union[`str`, `tuple`]
+            The section, followed by any nested keys or list indices, either
+                separated by '.' or as a `tuple`.
+        dtype : `str`
+            Name of the datatype of the returned value, see
+                `pytensils.utils.as_type`.
+        default : `Any`
+            The value to return should `path` not exist.
         """
-        # Logging
-        self._LOGGING.write_header(
-            header='Configuration validation'
-        )
-        self._LOGGING.write(
-            content=error_msg,
-            level='ERROR'
+        return self._return_value(
+            keys=_return_keys(path=path),
+            dtype=dtype,
+            default=default
         )
-        self._LOGGING.close()
 
-        # Raise exception
-        raise errors.config.ValidationError(
-            ''.join([
-                'Validation failed.',
-                ' See {%s} for more information.' % (
-                    os.path.join(
-                        self._LOGGING.path,
-                        self._LOGGING.file_name
-                    )
-                )
-            ])
+    def accessor(
+        self,
+        path: Union[str, tuple],
+        dtype: Union[str, None] = None,
+        default=_MISSING
+    ) -> Callable:
+        """ Returns a function object that returns the config value at
+        `path`, see `get()`, with `path` compiled once for repeated use.
+
+        Parameters
+        ----------
+        path : Union[`str`, `tuple`]
+            The section, followed by any nested keys or list indices, either
+                separated by '.' or as a `tuple`.
+        dtype : `str`
+            Name of the datatype of the returned value, see
+                `pytensils.utils.as_type`.
+        default : `Any`
+            The value to return should `path` not exist.
+        """
+        keys = _return_keys(path=path)
+
+        def getter():
+            return self._return_value(keys=keys, dtype=dtype, default=default)
+
+        return getter
+
+    def to_dict(self) -> dict:
+        """ Returns a dictionary object of the config-file data. """
+        return copy.deepcopy(self.data)
+
+    def to_dataclass(
+        self,
+        dtypes: Union[dict, Handler, Schema],
+        name: str = 'Config'
+    ):
+        """ Validates the config-file data against the dtypes in `dtypes`
+        and returns it as an immutable instance of the frozen dataclass
+        generated from `dtypes`, see
+        `pytensils.config.Schema.make_dataclass()`, with a field per
+        section and key. Nested dictionaries and lists are wrapped as
+        read-only views. Equal `dtypes` share a compiled schema, so that the
+        dataclass of each name is generated once.
+
+        Parameters
+        ----------
+        dtypes : Union[`dict`, `pytensils.config.Handler`,
+                `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        name : `str`
+            Name of the dataclass.
+        """
+        schema = self._return_schema(dtypes=dtypes)
+
+        # Validate dtypes
+        self.validate(dtypes=schema)
+
+        return schema._bind(
+            dict_object=_return_materialized(value=self.data),
+            name=name
         )
 
-    def _raise_dtype_validation_error(
+    def view(self) -> ReadOnlyDict:
+        """ Returns a read-only view of the config-file data that wraps
+        nested dictionaries and lists on access, without copying the data.
+        Use `to_dict()` for a mutable copy.
+        """
+        return ReadOnlyDict(self.data)
+
+    def publish(
         self,
-        error_msg: str
+        name: Union[str, None] = None
+    ) -> str:
+        """ Publishes the config data to shared memory, so that other
+        processes can attach to it via `pytensils.config.SharedHandler`,
+        and returns the name of the shared memory. Publishing again
+        replaces the published config data and increments its version.
+
+        The shared memory is released by `unpublish()`, or when the Python
+        process exits.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the shared memory. A unique name is generated when
+                `name` is None.
+        """
+        if self._SHARED is None:
+            control = _create_shared_memory(
+                name=name or 'pytensils_%s' % (uuid.uuid4().hex[:12]),
+                size=struct.calcsize(_CONTROL_FORMAT)
+            )
+            self._SHARED = (control, None, 0)
+            atexit.register(self.unpublish)
+        control, previous, version = self._SHARED
+
+        # Serialize each section
+        sections = {
+            section: marshal.dumps(value)
+            for section, value in _return_materialized(
+                value=self.data
+            ).items()
+        }
+        index = {}
+        offset = 0
+        for section, document in sections.items():
+            index[section] = (offset, len(document))
+            offset += len(document)
+        header = marshal.dumps(index)
+
+        # Write the config data
+        data = _create_shared_memory(
+            name='%s_%s' % (control.name, version + 1),
+            size=struct.calcsize('<Q') + len(header) + offset
+        )
+        struct.pack_into('<Q', data.buf, 0, len(header))
+        position = struct.calcsize('<Q')
+        for document in [header] + list(sections.values()):
+            data.buf[position:position + len(document)] = document
+            position += len(document)
+
+        # Publish the version
+        struct.pack_into(
+            _CONTROL_FORMAT,
+            control.buf,
+            0,
+            version + 1,
+            *_return_tracker()
+        )
+        self._SHARED = (control, data, version + 1)
+        if previous is not None:
+            _unlink_shared_memory(shm=previous)
+
+        return control.name
+
+    def unpublish(self):
+        """ Releases the shared memory of the config data published by
+        `publish()`.
+        """
+        if self._SHARED is not None:
+            control, data, _ = self._SHARED
+            self._SHARED = None
+            for shm in [data, control]:
+                if shm is not None:
+                    _unlink_shared_memory(shm=shm)
+
+    def from_dict(
+        self,
+        dict_object: dict,
+        dtypes: Union[dict, Schema, None] = None,
+        optimistic: bool = False
     ):
-        """ Reports an error string and all invalid configuration parameters
-        to `logging.Handler` and raises a `ValidationError`.
+        """ Updates the config-file data with the contents of `dict_object`
+        and validates the configuration against `dtypes` when
+        `dtypes` is not None.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object containing configuration values.
+        dtypes : Union[`dict`, `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        optimistic : `bool`
+            `True` or `False`, raises a `ConflictError` rather than
+                overwriting the changes of another writer when `True`,
+                see `write()`.
         """
 
-        # Logging
-        self._LOGGING.write_header(
-            header='Configuration validation'
+        # Validate instance
+        self._validate_instance(
+            dict_object=dict_object,
+            parameter='dict_object'
         )
-        self._LOGGING.write(
-            content=error_msg,
-            level='ERROR'
+
+        # Validate data
+        self._validate_data(
+            dict_object=dict_object,
+            parameter='dict_object'
         )
-        self._LOGGING.write(
-            content=self._convert_dtype_errors_to_df(
-                dict_object=self.validation_errors
+
+        # Validate depth
+        self._validate_depth(
+            dict_object=dict_object,
+            parameter='dict_object'
+        )
+
+        if dtypes:
+
+            # Validate dtypes
+            self._validate_dtypes(
+                dict_object=dict_object,
+                dtype_object=self._return_schema(dtypes=dtypes)
             )
+
+        # Retain configuration data
+        previous = self.data, self._BASE
+        self.data = self._apply_overrides(data=copy.deepcopy(dict_object))
+
+        # Write configuration data, restoring the previous configuration
+        #   data when the write fails
+        try:
+            self.write(optimistic=optimistic)
+        except Exception:
+            self.data, self._BASE = previous
+            raise
+
+        return self
+
+    def diff(
+        self,
+        other: Union[dict, Handler]
+    ) -> list:
+        """ Returns the list of RFC 6902 JSON-patch operations that change the
+        config data into `other`, see `apply_patch()`.
+
+        Parameters
+        ----------
+        other : Union[`dict`, `pytensils.config.Handler`]
+            Dictionary object containing configuration values.
+        """
+        if isinstance(other, Handler):
+            other = other.data
+
+        operations = []
+        _parse_diff(
+            source=_return_materialized(value=self.data),
+            target=_return_materialized(value=other),
+            path='',
+            operations=operations
         )
-        self._LOGGING.close()
 
-        # Raise exception
-        raise errors.config.ValidationError(
-            ''.join([
-                'Validation failed.',
-                ' See {%s} for more information.' % (
-                    os.path.join(
-                        self._LOGGING.path,
-                        self._LOGGING.file_name
-                    )
+        return operations
+
+    def apply_patch(
+        self,
+        operations: list,
+        dtypes: Union[dict, Schema, None] = None,
+        optimistic: bool = False
+    ):
+        """ Updates the config-file data with the RFC 6902 JSON-patch
+        `operations`, validates the changed configuration values against
+        `dtypes` when `dtypes` is not None, and writes the config-file.
+
+        The operations are applied all or nothing. Only the nodes along the
+        changed paths are copied, and only the changed configuration values
+        are validated.
+
+        Parameters
+        ----------
+        operations : `list`
+            List of JSON-patch operations, e.g.
+                `{"op": "replace", "path": "/config/int", "value": 2}`.
+        dtypes : Union[`dict`, `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        optimistic : `bool`
+            `True` or `False`, raises a `ConflictError` rather than
+                overwriting the changes of another writer when `True`,
+                see `write()`.
+        """
+        dict_object = self._remove_overrides(data=self.data)
+
+        # Apply the operations
+        touched = []
+        for operation in operations:
+            try:
+                dict_object, paths = _return_patched(
+                    document=dict_object,
+                    operation=operation
                 )
-            ])
+            except (KeyError, IndexError, ValueError, TypeError) as e:
+                error_msg = 'Invalid patch operation {%s}. %s' % (
+                    json.dumps(operation, default=str),
+                    e.args[0] if e.args else type(e).__name__
+                )
+                if self._LOGGING:
+                    self._raise_general_validation_error(error_msg=error_msg)
+                raise errors.config.ValidationError(error_msg)
+            touched.extend(paths)
+
+        # Validate instance
+        self._validate_instance(
+            dict_object=dict_object,
+            parameter='operations'
         )
 
-    def _parse_dtype_errors_to_dict(
+        # Validate data
+        self._validate_data(
+            dict_object=dict_object,
+            parameter='operations'
+        )
+
+        # Validate depth
+        if [] in touched:
+            self._validate_depth(
+                dict_object=dict_object,
+                parameter='operations'
+            )
+
+        if dtypes:
+
+            # Validate dtypes of the changed configuration values
+            self._validate_dtypes(
+                dict_object=_return_touched(
+                    dict_object=dict_object,
+                    paths=touched
+                ),
+                dtype_object=self._return_schema(dtypes=dtypes)
+            )
+
+        # Retain configuration data
+        previous = self.data, self._BASE
+        self.data = self._apply_overrides(data=dict_object)
+
+        # Write configuration data, restoring the previous configuration
+        #   data when the write fails
+        try:
+            self.write(optimistic=optimistic)
+        except Exception:
+            self.data, self._BASE = previous
+            raise
+
+        return self
+
+    def _return_schema(
         self,
-        dict_object: dict,
-        dtype_object: dict
-    ) -> Tuple[bool, dict]:
-        """ Returns the contents of the validation-error dictionary as
-        a `pd.DataFrame`.
+        dtypes: Union[dict, Handler, Schema]
+    ) -> Schema:
+        """ Validates `dtypes` and returns it as a compiled schema.
 
         Parameters
         ----------
-        dict_object : `dict`
-            Dictionary object to parse.
-        dtype_object : `dict`
+        dtypes : Union[`dict`, `pytensils.config.Handler`,
+                `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        """
+        if isinstance(dtypes, Schema):
+            return dtypes
+
+        # Parse the config data as a dictionary
+        if isinstance(dtypes, Handler):
+            dtypes = _return_materialized(value=dtypes.data)
+
+        # Validate instance
+        self._validate_instance(dict_object=dtypes, parameter='dtypes')
+
+        # Validate data
+        self._validate_data(dict_object=dtypes, parameter='dtypes')
+
+        # Validate depth
+        self._validate_depth(dict_object=dtypes, parameter='dtypes')
+
+        return _compile_schema(dtypes=dtypes)
+
+    def _return_value(
+        self,
+        keys: tuple,
+        dtype: Union[str, None],
+        default
+    ):
+        """ Returns the config value at the compiled `keys` converted to
+        `dtype`, see `get()`.
+
+        Parameters
+        ----------
+        keys : `tuple`
+            The compiled keys, see `_return_keys()`.
+        dtype : `str`
+            Name of the datatype of the returned value.
+        default : `Any`
+            The value to return should `keys` not exist.
+        """
+        value = self._DATA
+        try:
+            for key, index in keys:
+                if index is not None and isinstance(value, list):
+                    value = value[index]
+                else:
+                    value = value[key]
+        except (KeyError, IndexError, TypeError):
+            if default is _MISSING:
+                raise KeyError('.'.join(key for key, _ in keys))
+            return default
+
+        if dtype is None or type(value).__name__.lower() == dtype.lower() or (
+            value is None and dtype.lower() == 'none'
+        ):
+            return value
+
+        # Return the cached converted config value
+        entry = self._VALUES.get((keys, dtype))
+        if entry is not None and entry[0] is value:
+            return entry[1]
+
+        try:
+            converted = utils.as_type(
+                value=value if isinstance(value, str) else str(value),
+                return_dtype=dtype
+            )
+        except (TypeError, NameError) as e:
+            raise errors.config.TypeError(
+                'Invalid config value {%s} at {%s}. %s' % (
+                    value,
+                    '.'.join(key for key, _ in keys),
+                    e.args[0] if e.args else type(e).__name__
+                )
+            )
+        self._VALUES[(keys, dtype)] = (value, converted)
+
+        return converted
+
+    def _compile_overrides(
+        self,
+        prefix: str,
+        dtypes: dict
+    ) -> dict:
+        """ Parses the environment variables named
+        '{prefix}__{section}__{key}' and returns their values, converted to
+        the dtypes in `dtypes`, as a `dict` of sections.
+
+        Parameters
+        ----------
+        prefix : `str`
+            The prefix of the names of the environment variables.
+        dtypes : `dict`
             Dictionary object that contains the expected
                 configuration value dtypes.
         """
-        dtype_errors = {}
-        error = False
-        for section in dict_object.keys():
-            if section not in dtype_object.keys():
-                dtype_object[section] = {}
-                dtype_errors[section] = {
-                    '-N/A-': 'No corresponding section found in {dtypes}.'
-                }
-            else:
-                dtype_errors[section] = {}
+        sections = {
+            section.upper(): (
+                section,
+                {key.upper(): key for key in keys}
+                if isinstance(keys, dict) else {}
+            )
+            for section, keys in dtypes.items()
+        }
+        start = '%s__' % (prefix.upper())
 
-            for key, value in dict_object[section].items():
-                if key not in dtype_object[section].keys():
-                    dtype_errors[section][key] = (
-                        'No dtype found in {dtypes}.'
+        overrides = {}
+        for name, value in os.environ.items():
+            if not name.upper().startswith(start):
+                continue
+
+            # Match the section and key
+            parts = name[len(start):].upper().split('__')
+            section, keys = sections.get(parts[0], (None, {}))
+            key = keys.get(parts[-1]) if len(parts) == 2 else None
+            if key is None:
+                error_msg = ''.join([
+                    'No corresponding section and key found in {dtypes}',
+                    ' for the environment variable {%s}.' % (name)
+                ])
+                if self._LOGGING:
+                    self._raise_general_validation_error(error_msg=error_msg)
+                raise errors.config.ValidationError(error_msg)
+
+            # Convert the value
+            dtype = _compile_dtype(dtype=dtypes[section][key])
+            try:
+                overrides.setdefault(section, {})[key] = _return_override(
+                    value=value,
+                    dtype=dtype
+                )
+            except TypeError:
+                error_msg = ''.join([
+                    'Invalid value {%s} for the environment variable' % (
+                        value
+                    ),
+                    ' {%s}. Expected {%s}.' % (
+                        name,
+                        _return_dtype_name(dtype=dtype)
                     )
-                    error = True
+                ])
+                if self._LOGGING:
+                    self._raise_general_validation_error(error_msg=error_msg)
+                raise errors.config.ValidationError(error_msg)
+
+        return overrides
+
+    def _apply_overrides(
+        self,
+        data: Union[dict, LazyDict]
+    ) -> Union[dict, LazyDict]:
+        """ Overlays `data` with the compiled environment variable
+        overrides and returns `data`, retaining the overlaid values of
+        `data` for `_remove_overrides()`.
+
+        Parameters
+        ----------
+        data : Union[`dict`, `pytensils.config.LazyDict`]
+            Config data to overlay.
+        """
+        base = {}
+        for section, values in self._OVERRIDES.items():
+
+            # Retain the overlaid section, when not a `dict`, or otherwise
+            #   the overlaid values of the section
+            if not isinstance(data.get(section), dict):
+                base[section] = (
+                    copy.deepcopy(data[section]) if section in data
+                    else _MISSING
+                )
+                data[section] = {}
+            else:
+                base[section] = {
+                    key: copy.deepcopy(data[section][key])
+                    for key in values
+                    if key in data[section]
+                }
+            data[section].update(copy.deepcopy(values))
+        self._BASE = base
+        return data
+
+    def _remove_overrides(
+        self,
+        data: Union[dict, LazyDict]
+    ) -> dict:
+        """ Returns a copy of `data` as a `dict` with the values overlaid by
+        `_apply_overrides()` restored, leaving values that were changed
+        since as-is.
+
+        Parameters
+        ----------
+        data : Union[`dict`, `pytensils.config.LazyDict`]
+            Config data to restore.
+        """
+        dict_object = dict(_return_materialized(value=data))
+        for section, values in self._OVERRIDES.items():
+            if not isinstance(dict_object.get(section), dict):
+                continue
+            base = self._BASE.get(section, {})
+
+            # Restore the overlaid section
+            if not isinstance(base, dict):
+                if dict_object[section] != values:
+                    continue
+                if base is _MISSING:
+                    del dict_object[section]
                 else:
-                    if type(value).__name__ != dtype_object[section][key]:
-                        dtype_errors[section][key] = (
-                            'Invalid dtype {%s}. Expected {%s}.' % (
-                                type(value).__name__,
-                                dtype_object[section][key]
-                            )
-                        )
-                        error = True
-                    else:
-                        pass
+                    dict_object[section] = copy.deepcopy(base)
+                continue
 
-        return (error, dtype_errors)
+            # Restore the overlaid values of the section
+            dict_object[section] = dict(dict_object[section])
+            for key, value in values.items():
+                if key not in dict_object[section]:
+                    continue
+                if dict_object[section][key] != value:
+                    continue
+                if base.get(key, _MISSING) is _MISSING:
+                    del dict_object[section][key]
+                else:
+                    dict_object[section][key] = copy.deepcopy(base[key])
+        return dict_object
 
-    def _convert_dtype_errors_to_df(
+    def _validate_instance(
         self,
-        dict_object: dict
-    ) -> pd.DataFrame:
-        """ Returns the contents of the validation-error dictionary as
-        a `pd.DataFrame`.
+        dict_object: dict,
+        parameter: str
+    ):
+        """ Validates the type instance of `dict_object`.
 
         Parameters
         ----------
         dict_object : `dict`
-            Dictionary object to convert.
+            Dictionary object to validate.
+        parameter : 'str'
+            The name of the parameter to report in the error message.
         """
-        df = pd.DataFrame()
-        for key in dict_object.keys():
-            df = pd.concat(
-                [
-                    df,
-                    pd.DataFrame.from_dict(
-                        {
-                            'Section': [key] * len(
-                                dict_object[key].values()
-                            ),
-                            'Key': dict_object[key].keys(),
-                            'Error': dict_object[key].values()
-                        }
-                    )
-                ],
-                axis=0,
-                ignore_index=True
-            )
+        error_msg = 'Invalid data type {%s} for {%s}. Expected {dict}.' % (
+            type(dict_object).__name__,
+            parameter
+        )
 
-        return df
+        if not isinstance(dict_object, dict):
+            if self._LOGGING:
+                self._raise_general_validation_error(error_msg=error_msg)
+            raise errors.config.ValidationError(error_msg)
+
+    def _validate_data(
+        self,
+        dict_object: dict,
+        parameter: str
+    ):
+        """ Validates the data in `dict_object`.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object to validate.
+        parameter : `dict`
+            The name of the parameter to report in the error message.
+        """
+        error_msg = '{%s} is empty.' % (
+            parameter
+        )
+
+        if not dict_object:
+            if self._LOGGING:
+                self._raise_general_validation_error(error_msg=error_msg)
+            else:
+                raise errors.config.ValidationError(error_msg)
+
+    def _validate_depth(
+        self,
+        dict_object: dict,
+        parameter: str
+    ):
+        """ Validates the depth of `dict_object`.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object to validate.
+        """
+        error_msg = ''.join([
+            'The parameter {%s} must be a dictionary of' % (
+                parameter
+            ),
+            ' dictionaries with a minimum depth of {%s}.' % (
+                _MIN_DEPTH
+            )
+        ])
+
+        if not logging._return_dictionary_depth(
+            dict_object=dict_object
+        ) >= _MIN_DEPTH:
+            if self._LOGGING:
+                self._raise_general_validation_error(error_msg=error_msg)
+            else:
+                raise errors.config.ValidationError(error_msg)
+
+    def _validate_dtypes(
+        self,
+        dict_object: dict,
+        dtype_object: Union[dict, Schema]
+    ):
+        """ Validates `dict_object` against the dtypes in `dtype_object`.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object containing configuration values.
+        dtype_object : Union[`dict`, `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        """
+        error_msg = ''.join([
+            'Validation failed. The following parameter values',
+            ' are inconsistent with the expected data-types.'
+        ])
+
+        # Parse configuration dtype errors
+        error, dtype_errors = self._parse_dtype_errors_to_dict(
+            dict_object=dict_object,
+            dtype_object=dtype_object
+        )
+
+        # Retain configuration dtype errors
+        if error:
+            self.validation_errors = dtype_errors
+
+            # Raise configuration dtype errors
+            if self._LOGGING:
+                self._raise_dtype_validation_error(error_msg=error_msg)
+            else:
+                raise errors.config.ValidationError(
+                    ''.join([
+                        error_msg,
+                        '\n%s' % (
+                            json.dumps(dtype_errors, indent=2)
+                        )
+                    ])
+                )
+
+        else:
+            self.validation_errors = None
+
+    def _raise_general_validation_error(
+        self,
+        error_msg: str
+    ):
+        """ Reports an error string to `logging.Handler` and raises
+        a `ValidationError`.
+        """
+        # Logging
+        self._LOGGING.write_header(
+            header='Configuration validation'
+        )
+        self._LOGGING.write(
+            content=error_msg,
+            level='ERROR'
+        )
+        self._LOGGING.close()
+
+        # Raise exception
+        raise errors.config.ValidationError(
+            ''.join([
+                'Validation failed.',
+                ' See {%s} for more information.' % (
+                    os.path.join(
+                        self._LOGGING.path,
+                        self._LOGGING.file_name
+                    )
+                )
+            ])
+        )
+
+    def _raise_dtype_validation_error(
+        self,
+        error_msg: str
+    ):
+        """ Reports an error string and all invalid configuration parameters
+        to `logging.Handler` and raises a `ValidationError`.
+        """
+
+        # Logging
+        self._LOGGING.write_header(
+            header='Configuration validation'
+        )
+        self._LOGGING.write(
+            content=error_msg,
+            level='ERROR'
+        )
+        self._LOGGING.write(
+            content=self._convert_dtype_errors_to_df(
+                dict_object=self.validation_errors
+            )
+        )
+        self._LOGGING.close()
+
+        # Raise exception
+        raise errors.config.ValidationError(
+            ''.join([
+                'Validation failed.',
+                ' See {%s} for more information.' % (
+                    os.path.join(
+                        self._LOGGING.path,
+                        self._LOGGING.file_name
+                    )
+                )
+            ])
+        )
+
+    def _parse_dtype_errors_to_dict(
+        self,
+        dict_object: dict,
+        dtype_object: Union[dict, Schema]
+    ) -> Tuple[bool, dict]:
+        """ Returns the contents of the validation-error dictionary as
+        a `pd.DataFrame`.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object to parse.
+        dtype_object : Union[`dict`, `pytensils.config.Schema`]
+            Dictionary object, or compiled schema, that contains the
+                expected configuration value dtypes.
+        """
+        if not isinstance(dtype_object, Schema):
+            dtype_object = _compile_schema(dtypes=dtype_object)
+
+        return dtype_object._parse(dict_object=dict_object)
+
+    def _convert_dtype_errors_to_df(
+        self,
+        dict_object: dict
+    ) -> pd.DataFrame:
+        """ Returns the contents of the validation-error dictionary as
+        a `pd.DataFrame`.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object to convert.
+        """
+        return pd.DataFrame(
+            [
+                (section, key, error)
+                for section, keys in dict_object.items()
+                for key, error in keys.items()
+            ],
+            columns=['Section', 'Key', 'Error']
+        )
+
+
+class Schema():
+    """ A `class` that represents a compiled dtype-schema, which maps the
+    keys of each section directly to the expected type objects so that
+    many configurations can be validated against the same dtypes.
+
+    Parameters
+    ----------
+    dtypes : Union[`dict`, `pytensils.config.Handler`]
+        Dictionary object that contains the expected
+            configuration value dtypes.
+    """
+
+    def __init__(
+        self,
+        dtypes: Union[dict, Handler]
+    ):
+        """ Initializes an instance of the compiled dtype-schema class.
+
+        Parameters
+        ----------
+        dtypes : Union[`dict`, `pytensils.config.Handler`]
+            Dictionary object that contains the expected
+                configuration value dtypes.
+        """
+
+        # Parse the config data as a dictionary
+        if isinstance(dtypes, Handler):
+            dtypes = _return_materialized(value=dtypes.data)
+
+        # Validate dtypes
+        if not isinstance(dtypes, dict):
+            raise errors.config.ValidationError(
+                'Invalid data type {%s} for {dtypes}. Expected {dict}.' % (
+                    type(dtypes).__name__
+                )
+            )
+        if not dtypes:
+            raise errors.config.ValidationError('{dtypes} is empty.')
+        if not logging._return_dictionary_depth(
+            dict_object=dtypes
+        ) >= _MIN_DEPTH:
+            raise errors.config.ValidationError(
+                ''.join([
+                    'The parameter {dtypes} must be a dictionary of',
+                    ' dictionaries with a minimum depth of {%s}.' % (
+                        _MIN_DEPTH
+                    )
+                ])
+            )
+
+        self._compile(dtypes=dtypes)
+
+    def validate(
+        self,
+        dict_object: Union[dict, Handler]
+    ) -> Union[dict, None]:
+        """ Validates `dict_object` against the compiled dtypes. Returns
+        `None` when validation completes successfully, otherwise returns
+        the validation-error dictionary, see
+        `pytensils.config.Handler.validation_errors`.
+
+        Parameters
+        ----------
+        dict_object : Union[`dict`, `pytensils.config.Handler`]
+            Dictionary object containing configuration values.
+        """
+        if isinstance(dict_object, Handler):
+            dict_object = dict_object.data
+
+        error, dtype_errors = self._parse(dict_object=dict_object)
+
+        return dtype_errors if error else None
+
+    def __getstate__(self) -> dict:
+        """ Returns the state of the compiled dtype-schema without the
+        generated dataclasses, which cannot be pickled.
+        """
+        state = self.__dict__.copy()
+        del state['_DATACLASSES']
+        return state
+
+    def __setstate__(
+        self,
+        state: dict
+    ):
+        """ Restores the state of the compiled dtype-schema.
+
+        Parameters
+        ----------
+        state : `dict`
+            State of the compiled dtype-schema.
+        """
+        self.__dict__.update(state)
+        self._DATACLASSES = {}
+
+    def _compile(
+        self,
+        dtypes: dict
+    ):
+        """ Compiles the dtypes in `dtypes`.
+
+        Parameters
+        ----------
+        dtypes : `dict`
+            Dictionary object that contains the expected
+                configuration value dtypes.
+        """
+        self.dtypes = dtypes
+        self._TYPES = {
+            section: {
+                key: _compile_dtype(dtype=dtype)
+                for key, dtype in keys.items()
+            } if isinstance(keys, dict) else {}
+            for section, keys in dtypes.items()
+        }
+        self._DATACLASSES = {}
+
+    def make_dataclass(
+        self,
+        name: str = 'Config'
+    ) -> type:
+        """ Returns a frozen dataclass, `name`, with a field per section,
+        where each section is itself a frozen dataclass with a field per
+        key. The dataclasses use `__slots__` and are generated once per
+        `name`.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the dataclass.
+        """
+        if name in self._DATACLASSES:
+            return self._DATACLASSES[name]
+
+        sections = []
+        for section, types in self._TYPES.items():
+            section_class = _make_dataclass(
+                name=_return_class_name(name=section),
+                fields=[
+                    (key, dtype if isinstance(dtype, type) else Any)
+                    for key, dtype in types.items()
+                ]
+            )
+            sections.append((section, section_class))
+
+        self._DATACLASSES[name] = _make_dataclass(name=name, fields=sections)
+
+        return self._DATACLASSES[name]
+
+    def _bind(
+        self,
+        dict_object: dict,
+        name: str = 'Config'
+    ):
+        """ Returns `dict_object` as an instance of the dataclass `name`,
+        see `make_dataclass()`, with nested dictionaries and lists wrapped
+        as read-only views.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object containing configuration values.
+        name : `str`
+            Name of the dataclass.
+        """
+        root_class = self.make_dataclass(name=name)
+
+        # Validate missing configuration values
+        missing = []
+        for section, types in self._TYPES.items():
+            if not isinstance(dict_object.get(section), dict):
+                missing.append(section)
+                continue
+            missing.extend(
+                '%s.%s' % (section, key) for key in types
+                if key not in dict_object[section]
+            )
+        if missing:
+            raise errors.config.ValidationError(
+                'Missing configuration values {%s}.' % (', '.join(missing))
+            )
+
+        return root_class(**{
+            field.name: field.type(**{
+                key: _return_read_only(value=dict_object[field.name][key])
+                for key in self._TYPES[field.name]
+            })
+            for field in dataclasses.fields(root_class)
+        })
+
+    def _parse(
+        self,
+        dict_object: dict
+    ) -> Tuple[bool, dict]:
+        """ Returns whether `dict_object` contains any dtype errors along
+        with the validation-error dictionary.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object to parse.
+        """
+        dtype_errors = {}
+        error = False
+        for section, values in dict_object.items():
+            types = self._TYPES.get(section)
+            if types is None:
+                types = {}
+                section_errors = {
+                    '-N/A-': 'No corresponding section found in {dtypes}.'
+                }
+            else:
+                section_errors = {}
+            dtype_errors[section] = section_errors
+
+            if not isinstance(values, dict):
+                section_errors['-N/A-'] = (
+                    'Invalid section dtype {%s}. Expected {dict}.' % (
+                        type(values).__name__
+                    )
+                )
+                error = True
+                continue
+
+            for key, value in values.items():
+                expected = types.get(key, _MISSING)
+                if expected is _MISSING:
+                    section_errors[key] = 'No dtype found in {dtypes}.'
+                    error = True
+                elif type(value) is expected:
+                    continue
+                elif isinstance(expected, (dict, _Generic)):
+                    nested_errors = {}
+                    _parse_value_errors(
+                        value=value,
+                        dtype=expected,
+                        key=key,
+                        dtype_errors=nested_errors
+                    )
+                    if nested_errors:
+                        section_errors.update(nested_errors)
+                        error = True
+                elif type(value).__name__ != expected:
+                    section_errors[key] = (
+                        'Invalid dtype {%s}. Expected {%s}.' % (
+                            type(value).__name__,
+                            self.dtypes[section][key]
+                        )
+                    )
+                    error = True
+
+        return (error, dtype_errors)
+
+
+class _Generic():
+    """ A `class` that represents a compiled generic dtype, e.g.
+    'list[float]', 'dict[str, int]' or 'int | None'.
+
+    Parameters
+    ----------
+    origin : `str`
+        One of 'list', 'dict', 'union' or 'any'.
+    args : `tuple`
+        The compiled dtypes of the elements, keys and values, or options.
+    """
+
+    __slots__ = ('origin', 'args', 'name', '_TYPES')
+
+    def __init__(
+        self,
+        origin: str,
+        args: tuple = ()
+    ):
+        self.origin = origin
+        self.args = args
+
+        # Name the dtype
+        if origin == 'any':
+            self.name = 'Any'
+        elif origin == 'union':
+            self.name = ' | '.join(
+                _return_dtype_name(dtype=arg) for arg in args
+            )
+        else:
+            self.name = '%s[%s]' % (
+                origin,
+                ', '.join(_return_dtype_name(dtype=arg) for arg in args)
+            )
+
+        # Retain the type objects of the options of a union of types
+        self._TYPES = None
+        if origin == 'union' and all(isinstance(arg, type) for arg in args):
+            self._TYPES = frozenset(args)
+
+
+class LayeredHandler():
+    """ A `class` that represents a stack of configuration-handlers, whose
+    config data is deep-merged in order, so that the values of each layer
+    override the values of the layers before it.
+
+    Parameters
+    ----------
+    layers : `list`
+        List of `pytensils.config.Handler` objects, from the lowest to the
+            highest priority.
+    """
+
+    def __init__(
+        self,
+        layers: list
+    ):
+        """ Initializes an instance of the layered configuration-handler
+        class.
+
+        Parameters
+        ----------
+        layers : `list`
+            List of `pytensils.config.Handler` objects, from the lowest to
+                the highest priority.
+        """
+        assert layers and all(
+            isinstance(layer, Handler) for layer in layers
+        ), '{layers} must be a list of `pytensils.config.Handler` objects.'
+
+        # Assign class variables
+        self.layers = list(layers)
+        self.data = {}
+
+        # Assign private variables
+        self._MERGES = []
+        self._SOURCES = {}
+        self._STAT_KEYS = []
+
+        # Merge the layers
+        self._merge(start=0)
+
+    def read(self) -> dict:
+        """ Re-loads the layers whose config-file modification time, size
+        or inode have changed, re-merges the layers from the first changed
+        layer onwards and returns the merged config data.
+
+        The merged config data of the unchanged layers before the first
+        changed layer is cached and re-used.
+        """
+        start = None
+        for index, layer in enumerate(self.layers):
+
+            # Re-load the changed config-file
+            try:
+                stat_key = _return_stat_key(
+                    file_path=os.path.join(layer.path, layer.file_name)
+                )
+            except OSError:
+                stat_key = layer._STAT_KEY
+            if stat_key != layer._STAT_KEY:
+                layer.read()
+
+            if start is None and layer._STAT_KEY != self._STAT_KEYS[index]:
+                start = index
+
+        if start is not None:
+            self._merge(start=start)
+
+        return self.data
+
+    def origin(
+        self,
+        *keys: str
+    ) -> Handler:
+        """ Returns the layer that the merged config value at `keys` came
+        from. Raises a `KeyError` when `keys` does not exist.
+
+        Parameters
+        ----------
+        keys : `str`
+            The section, followed by any nested keys, of the config value.
+        """
+        if not keys:
+            raise KeyError(keys)
+
+        value = self.data
+        for key in keys:
+            if not isinstance(value, dict):
+                raise KeyError(keys)
+            value = value[key]
+
+        return self.layers[self._SOURCES[keys]]
+
+    def to_dict(self) -> dict:
+        """ Returns a dictionary object of the merged config data. """
+        return copy.deepcopy(self.data)
+
+    def view(self) -> ReadOnlyDict:
+        """ Returns a read-only view of the merged config data. """
+        return ReadOnlyDict(self.data)
+
+    def _merge(
+        self,
+        start: int
+    ):
+        """ Re-merges the layers from the layer at index `start` onwards,
+        re-using the cached merged config data of the layers before it.
+
+        Parameters
+        ----------
+        start : `int`
+            Index of the first layer to merge.
+        """
+        del self._MERGES[start:]
+        del self._STAT_KEYS[start:]
+        if self._MERGES:
+            data, sources = self._MERGES[-1]
+        else:
+            data, sources = ({}, {})
+
+        for index in range(start, len(self.layers)):
+            sources = dict(sources)
+            data = _return_merged(
+                base=data,
+                overlay=_return_materialized(value=self.layers[index].data),
+                sources=sources,
+                index=index,
+                path=()
+            )
+            self._MERGES.append((data, sources))
+            self._STAT_KEYS.append(self.layers[index]._STAT_KEY)
+
+        self.data = data
+        self._SOURCES = sources
+
+
+class ReadOnlyDict(collections.abc.Mapping):
+    """ A `class` that represents a read-only view of a dictionary.
+
+    Parameters
+    ----------
+    dict_object : `dict`
+        Dictionary object to view.
+    """
+
+    __slots__ = ('_DATA',)
+
+    def __init__(
+        self,
+        dict_object: dict
+    ):
+        """ Initializes an instance of the read-only dictionary class.
+
+        Parameters
+        ----------
+        dict_object : `dict`
+            Dictionary object to view.
+        """
+        self._DATA = dict_object
+
+    def __getitem__(self, key):
+        return _return_read_only(value=self._DATA[key])
+
+    def __iter__(self):
+        return iter(self._DATA)
+
+    def __len__(self) -> int:
+        return len(self._DATA)
+
+    def __contains__(self, key) -> bool:
+        return key in self._DATA
+
+    def __eq__(self, other) -> bool:
+        return self._DATA == _return_unwrapped(value=other)
+
+    def __repr__(self) -> str:
+        return 'ReadOnlyDict(%r)' % (self._DATA)
+
+    __hash__ = None
+
+    def to_dict(self) -> dict:
+        """ Returns a dictionary object copy of the viewed data. """
+        return copy.deepcopy(self._DATA)
+
+
+class ReadOnlyList(collections.abc.Sequence):
+    """ A `class` that represents a read-only view of a list.
+
+    Parameters
+    ----------
+    list_object : `list`
+        List object to view.
+    """
+
+    __slots__ = ('_DATA',)
+
+    def __init__(
+        self,
+        list_object: list
+    ):
+        """ Initializes an instance of the read-only list class.
+
+        Parameters
+        ----------
+        list_object : `list`
+            List object to view.
+        """
+        self._DATA = list_object
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReadOnlyList(self._DATA[index])
+        return _return_read_only(value=self._DATA[index])
+
+    def __iter__(self):
+        return map(_return_read_only, self._DATA)
+
+    def __len__(self) -> int:
+        return len(self._DATA)
+
+    def __eq__(self, other) -> bool:
+        other = _return_unwrapped(value=other)
+        if isinstance(other, tuple):
+            other = list(other)
+        return self._DATA == other
+
+    def __repr__(self) -> str:
+        return 'ReadOnlyList(%r)' % (self._DATA)
+
+    __hash__ = None
+
+    def to_list(self) -> list:
+        """ Returns a list object copy of the viewed data. """
+        return copy.deepcopy(self._DATA)
+
+
+class SharedHandler():
+    """ A `class` that represents a read-only configuration-handler of the
+    config data published to shared memory by
+    `pytensils.config.Handler.publish()`.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the shared memory.
+    """
+
+    def __init__(
+        self,
+        name: str
+    ):
+        """ Initializes an instance of the shared configuration-handler
+        class.
+
+        Parameters
+        ----------
+        name : `str`
+            Name of the shared memory.
+        """
+
+        # Assign class variables
+        self.name = name
+        self.version = None
+        self.data = {}
+
+        # Attach to the shared memory
+        try:
+            self._CONTROL = _attach_shared_memory(name=name, tracker=None)
+        except FileNotFoundError:
+            raise errors.config.FileNotFoundError(
+                '{%s} is not a published config.' % (name)
+            )
+        _, *tracker = struct.unpack_from(_CONTROL_FORMAT, self._CONTROL.buf, 0)
+        _untrack_shared_memory(shm=self._CONTROL, tracker=tuple(tracker))
+
+        self.read()
+
+    def read(self) -> LazyDict:
+        """ Re-attaches to the published config data when a new version has
+        been published and returns the config data as a
+        `pytensils.config.LazyDict`, whose sections are de-serialized from
+        shared memory when they are first accessed.
+        """
+        while True:
+            version, *tracker = struct.unpack_from(
+                _CONTROL_FORMAT,
+                self._CONTROL.buf,
+                0
+            )
+            if version == self.version:
+                return self.data
+
+            try:
+                shm = _attach_shared_memory(
+                    name='%s_%s' % (self.name, version),
+                    tracker=tuple(tracker)
+                )
+            except FileNotFoundError:
+
+                # Retry when a newer version was published meanwhile
+                if struct.unpack_from(
+                    '<Q', self._CONTROL.buf, 0
+                )[0] != version:
+                    continue
+                raise errors.config.FileNotFoundError(
+                    '{%s} is no longer published.' % (self.name)
+                )
+
+            # Index the sections
+            size = struct.unpack_from('<Q', shm.buf, 0)[0]
+            start = struct.calcsize('<Q') + size
+            index = marshal.loads(shm.buf[struct.calcsize('<Q'):start])
+
+            self.data = LazyDict(
+                document=_SharedDocument(shm=shm),
+                index={
+                    section: slice(start + offset, start + offset + length)
+                    for section, (offset, length) in index.items()
+                },
+                file_name=self.name,
+                loads=marshal.loads
+            )
+            self.version = version
+
+            return self.data
+
+    def to_dict(self) -> dict:
+        """ Returns a dictionary object of the config data. """
+        return copy.deepcopy(self.data)
+
+    def view(self) -> ReadOnlyDict:
+        """ Returns a read-only view of the config data. """
+        return ReadOnlyDict(self.data)
+
+    def close(self):
+        """ Detaches from the shared memory. """
+        self.data = {}
+        self._CONTROL.close()
+
+
+class _SharedDocument():
+    """ A `class` that represents the config data within shared memory,
+    keeping the shared memory attached for as long as it is referenced.
+
+    Parameters
+    ----------
+    shm : `multiprocessing.shared_memory.SharedMemory`
+        Shared memory of the config data.
+    """
+
+    __slots__ = ('_SHM',)
+
+    def __init__(
+        self,
+        shm
+    ):
+        self._SHM = shm
+
+    def __getitem__(self, index: slice) -> bytes:
+        return bytes(self._SHM.buf[index])
+
+
+class LazyDict(collections.abc.MutableMapping):
+    """ A `class` that represents the sections of a config-file, parsing
+    each section when it is first accessed.
+
+    Parameters
+    ----------
+    document : `mmap.mmap`
+        Memory-map of the config-file, or any object that returns the
+            serialized sections when sliced.
+    index : `dict`
+        Dictionary object that maps each section to the `slice` of
+            `document` that contains its value.
+    file_name : `str`
+        File name of the '.json' config-file.
+    loads : `Callable`
+        Function object that de-serializes a section.
+    """
+
+    __slots__ = ('_DOCUMENT', '_DATA', '_FILE_NAME', '_LOADS')
+
+    def __init__(
+        self,
+        document: mmap.mmap,
+        index: dict,
+        file_name: str,
+        loads: Callable = utils.json_loads
+    ):
+        """ Initializes an instance of the lazy dictionary class.
+
+        Parameters
+        ----------
+        document : `mmap.mmap`
+            Memory-map of the config-file, or any object that returns the
+                serialized sections when sliced.
+        index : `dict`
+            Dictionary object that maps each section to the `slice` of
+                `document` that contains its value.
+        file_name : `str`
+            File name of the '.json' config-file.
+        loads : `Callable`
+            Function object that de-serializes a section.
+        """
+        self._DOCUMENT = document
+        self._DATA = index
+        self._FILE_NAME = file_name
+        self._LOADS = loads
+
+    def __getitem__(self, key):
+        value = self._DATA[key]
+        if isinstance(value, slice):
+            try:
+                value = self._LOADS(self._DOCUMENT[value])
+            except ValueError:
+                raise errors.config.TypeError(
+                    "{%s} is not a valid '.json' config-file." % (
+                        self._FILE_NAME
+                    )
+                )
+            self._DATA[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._DATA[key] = value
+
+    def __delitem__(self, key):
+        del self._DATA[key]
+
+    def __iter__(self):
+        return iter(self._DATA)
+
+    def __len__(self) -> int:
+        return len(self._DATA)
+
+    def __contains__(self, key) -> bool:
+        return key in self._DATA
+
+    def __repr__(self) -> str:
+        return 'LazyDict(%r)' % (
+            [
+                key for key, value in self._DATA.items()
+                if not isinstance(value, slice)
+            ]
+        )
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return copy.deepcopy(self.to_dict(), memo)
+
+    def is_loaded(
+        self,
+        key: str
+    ) -> bool:
+        """ Returns `True` when the section, `key`, has been parsed.
+
+        Parameters
+        ----------
+        key : `str`
+            Name of the section.
+        """
+        return not isinstance(self._DATA[key], slice)
+
+    def to_dict(self) -> dict:
+        """ Parses all sections and returns them as a dictionary object. """
+        return {key: self[key] for key in self}
+
+
+def validate_files(
+    path: str,
+    dtypes: Union[dict, Handler, Schema],
+    max_workers: Union[int, None] = None,
+    processes: bool = False
+) -> pd.DataFrame:
+    """ Validates all '.json' config-files within `path` against the
+    dtypes in `dtypes` and returns a report as a `pd.DataFrame`, with one
+    row per config-file containing the validation status, the number of
+    errors and the errors. Unlike `pytensils.config.Handler`, invalid
+    config-files are reported rather than raised.
+
+    The validation status is one of 'ok', 'read error', 'parse error',
+    'structure error' or 'dtype error'.
+
+    Parameters
+    ----------
+    path : `str`
+        Directory path to the folder that contains the '.json'
+            config-files, or a glob pattern of the config-files.
+    dtypes : Union[`dict`, `pytensils.config.Handler`,
+            `pytensils.config.Schema`]
+        Dictionary object, or compiled schema, that contains the
+            expected configuration value dtypes.
+    max_workers : `int`
+        The maximum number of worker threads, or processes.
+    processes : `bool`
+        `True` or `False`, validates the config-files within a process pool
+            rather than a thread pool when `True`.
+    """
+
+    # Compile the dtypes
+    schema = dtypes if isinstance(dtypes, Schema) else Schema(dtypes=dtypes)
+
+    # Retrieve the config-files
+    if os.path.isdir(path):
+        path = os.path.join(path, '*.json')
+    file_paths = sorted(
+        file_path for file_path in glob.glob(path)
+        if os.path.isfile(file_path)
+    )
+
+    # Validate
+    executor = (
+        concurrent.futures.ProcessPoolExecutor if processes
+        else concurrent.futures.ThreadPoolExecutor
+    )
+    with executor(max_workers=max_workers) as pool:
+        reports = list(
+            pool.map(
+                _validate_file,
+                file_paths,
+                [schema] * len(file_paths),
+                chunksize=max(
+                    1,
+                    len(file_paths) // (
+                        (max_workers or os.cpu_count() or 1) * 4
+                    )
+                )
+            )
+        )
+
+    return pd.DataFrame.from_records(
+        reports,
+        columns=['File', 'Status', 'Errors', 'Error']
+    )
+
+
+def clear_cache():
+    """ Clears the process-wide cache of parsed and validated config data
+    and of compiled schemas.
+    """
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _SCHEMAS.clear()
+
+
+def get_handler(
+    path: str,
+    file_name: str = 'config.json'
+) -> Handler:
+    """ Returns the process-wide instance of `pytensils.config.Handler` of
+    the '.json' config-file, `file_name`, within `path`, creating it on
+    first use. The instance is shared by the absolute file-path for as
+    long as it is referenced, and its config data is re-loaded in place,
+    see `poll()`, whenever the config-file has changed since.
+
+    Parameters
+    ----------
+    path : `str`
+        Directory path to the folder that contains the `file_name` of the
+            '.json' config-file.
+    file_name : `str`
+        File name of the '.json' config-file.
+    """
+    file_path = os.path.abspath(os.path.join(path, file_name))
+
+    with _HANDLERS_LOCK:
+        Config = _HANDLERS.get(file_path)
+        lock = _HANDLER_LOCKS.setdefault(file_path, threading.Lock())
+
+    # Create the shared instance while holding the creation-lock of the
+    #   config-file only, so that the instances of other config-files are
+    #   created concurrently
+    if Config is None:
+        with lock:
+            with _HANDLERS_LOCK:
+                Config = _HANDLERS.get(file_path)
+            if Config is None:
+                candidate = Handler(
+                    path=os.path.dirname(file_path),
+                    file_name=os.path.basename(file_path)
+                )
+                with _HANDLERS_LOCK:
+                    Config = _HANDLERS.setdefault(file_path, candidate)
+                return Config
+
+    # Re-load the changed config-file
+    Config.poll()
+
+    return Config
+
+
+def _return_stat_key(
+    file_path: str
+) -> tuple:
+    """ Returns the modification time, size and inode of `file_path`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        File-path of the config-file.
+    """
+    stat = os.stat(file_path)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _return_cached(
+    file_path: Union[str, tuple],
+    stat_key: tuple
+) -> Union[Tuple[bytes, str], None]:
+    """ Returns the cached config data of `file_path` as `marshal` bytes,
+    along with the digest of the config-file, when the cached `stat_key`
+    is unchanged.
+
+    Parameters
+    ----------
+    file_path : Union[`str`, `tuple`]
+        Absolute file-path of the config-file, or `(file_path, 'index')`
+            for the section index of the config-file, see `_cache()`.
+    stat_key : `tuple`
+        The modification time, size and inode of the config-file.
+    """
+    with _CACHE_LOCK:
+        entry = _CACHE.get(file_path)
+        if entry is None or entry[0] != stat_key:
+            return None
+        _CACHE.move_to_end(file_path)
+        return entry[1:]
+
+
+def _cache(
+    file_path: Union[str, tuple],
+    stat_key: tuple,
+    cached: Union[bytes, tuple],
+    digest: Union[str, None]
+):
+    """ Caches the config data of `file_path`, evicting the least recently
+    used config data beyond `CACHE_SIZE` entries.
+
+    Parameters
+    ----------
+    file_path : Union[`str`, `tuple`]
+        Absolute file-path of the config-file, or `(file_path, 'index')`
+            for the section index of the config-file.
+    stat_key : `tuple`
+        The modification time, size and inode of the config-file.
+    cached : Union[`bytes`, `tuple`]
+        The config data as `marshal` bytes, or the memory-map and section
+            index of the config-file.
+    digest : `str`
+        The digest of the config-file.
+    """
+    with _CACHE_LOCK:
+        _CACHE[file_path] = (stat_key, cached, digest)
+        _CACHE.move_to_end(file_path)
+        while len(_CACHE) > max(CACHE_SIZE, 0):
+            _CACHE.popitem(last=False)
+
+
+def _uncache(
+    file_path: str
+):
+    """ Removes the cached config data of `file_path`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    """
+    with _CACHE_LOCK:
+        _CACHE.pop(file_path, None)
+        _CACHE.pop((file_path, 'index'), None)
+
+
+def _return_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """ Returns the process-wide thread pool of the asynchronous read and
+    write methods of `pytensils.config.Handler`.
+    """
+    global _EXECUTOR
+
+    with _ASYNC_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix='pytensils-config'
+            )
+        return _EXECUTOR
+
+
+async def _run_in_executor(
+    function: Callable,
+    *args
+):
+    """ Calls `function` with `args` within the process-wide thread pool
+    and returns the result without blocking the event loop.
+
+    Parameters
+    ----------
+    function : `Callable`
+        Function object to call.
+    """
+    return await asyncio.wrap_future(
+        _return_executor().submit(function, *args)
+    )
+
+
+def _release_read(
+    file_path: str,
+    future: concurrent.futures.Future
+):
+    """ Removes the completed in-flight read, `future`, of `file_path`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    future : `concurrent.futures.Future`
+        The completed read of the config-file.
+    """
+    with _ASYNC_LOCK:
+        if _READS.get(file_path) is future:
+            del _READS[file_path]
+
+
+def _call_serialized(
+    file_path: str,
+    function: Callable
+):
+    """ Calls `function` while holding the write-lock of `file_path`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    function : `Callable`
+        Function object that writes the config-file.
+    """
+    with _ASYNC_LOCK:
+        lock = _WRITE_LOCKS.setdefault(file_path, threading.Lock())
+    with lock:
+        return function()
+
+
+def _return_read_only(value):
+    """ Returns `value` wrapped as a read-only view when `value` is a
+    `dict` or a `list`.
+
+    Parameters
+    ----------
+    value : `Any`
+        Config value to wrap.
+    """
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+def _return_unwrapped(value):
+    """ Returns the data viewed by a read-only view, or `value` otherwise.
+
+    Parameters
+    ----------
+    value : `Any`
+        Config value to unwrap.
+    """
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList)):
+        return value._DATA
+    return value
+
+
+def _compile_schema(
+    dtypes: dict
+) -> Schema:
+    """ Returns `dtypes` as a compiled schema, without validating `dtypes`.
+    Compiled schemas are cached by the content of `dtypes`, evicting the
+    least recently used schema beyond `CACHE_SIZE` entries, so that equal
+    dtypes share the dataclasses generated from them.
+
+    Parameters
+    ----------
+    dtypes : `dict`
+        Dictionary object that contains the expected
+            configuration value dtypes.
+    """
+    try:
+        key = _return_frozen(value=dtypes)
+        hash(key)
+    except TypeError:
+        key = None
+
+    # Return the cached schema
+    if key is not None:
+        with _CACHE_LOCK:
+            schema = _SCHEMAS.get(key)
+            if schema is not None:
+                _SCHEMAS.move_to_end(key)
+                return schema
+
+    schema = Schema.__new__(Schema)
+    schema._compile(dtypes=copy.deepcopy(dtypes))
+
+    # Cache the schema
+    if key is not None:
+        with _CACHE_LOCK:
+            schema = _SCHEMAS.setdefault(key, schema)
+            _SCHEMAS.move_to_end(key)
+            while len(_SCHEMAS) > max(CACHE_SIZE, 0):
+                _SCHEMAS.popitem(last=False)
+
+    return schema
+
+
+def _return_frozen(value: Any) -> Any:
+    """ Returns `value` with every dictionary object converted into a
+    `tuple` of `(key, value)` pairs, in order.
+
+    Parameters
+    ----------
+    value : `Any`
+        Value to convert.
+    """
+    if isinstance(value, dict):
+        return tuple(
+            (key, _return_frozen(value=item)) for key, item in value.items()
+        )
+    return value
+
+
+def _validate_file(
+    file_path: str,
+    schema: Schema
+) -> dict:
+    """ Validates the config-file, `file_path`, against `schema` and returns
+    the validation status, the number of errors and the errors as a `dict`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        File-path of the config-file.
+    schema : `pytensils.config.Schema`
+        Compiled schema that contains the expected configuration value
+            dtypes.
+    """
+    report = {'File': file_path, 'Status': 'ok', 'Errors': 0, 'Error': None}
+    try:
+        dtype_errors = schema.validate(
+            dict_object=Handler(
+                path=os.path.dirname(file_path),
+                file_name=os.path.basename(file_path)
+            )
+        )
+    except (errors.config.TypeError, UnicodeDecodeError) as e:
+        report.update({'Status': 'parse error', 'Errors': 1, 'Error': str(e)})
+    except OSError as e:
+        report.update({'Status': 'read error', 'Errors': 1, 'Error': str(e)})
+    except errors.config.ValidationError as e:
+        report.update(
+            {'Status': 'structure error', 'Errors': 1, 'Error': str(e)}
+        )
+    else:
+        if dtype_errors:
+            report.update(
+                {
+                    'Status': 'dtype error',
+                    'Errors': sum(
+                        len(keys) for keys in dtype_errors.values()
+                    ),
+                    'Error': dtype_errors
+                }
+            )
+
+    return report
+
+
+def _return_digest(
+    document: bytes
+) -> str:
+    """ Returns the digest of the content of a config-file.
+
+    Parameters
+    ----------
+    document : `bytes`
+        Content of the config-file.
+    """
+    return hashlib.blake2b(document, digest_size=16).hexdigest()
+
+
+def _return_file_mode(
+    file_path: str
+) -> Union[int, None]:
+    """ Returns the permissions of `file_path`, or `None` when `file_path`
+    does not exist.
+
+    Parameters
+    ----------
+    file_path : `str`
+        File-path of the config-file.
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        return None
+
+
+def _fsync_directory(
+    path: str
+):
+    """ Flushes the directory entries of `path` to disk.
+
+    Parameters
+    ----------
+    path : `str`
+        Directory path to flush.
+    """
+    if os.name == 'nt':  # pragma: no cover
+        return None
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _write_atomic(
+    file_path: str,
+    content: Union[str, bytes],
+    fsync: bool = False,
+    check: Union[Callable, None] = None
+) -> tuple:
+    """ Writes `content` to a temporary file alongside `file_path` that then
+    replaces `file_path`, retaining the permissions of `file_path`, and
+    returns the modification time, size and inode of the written file.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the file to write.
+    content : Union[`str`, `bytes`]
+        Content of the file.
+    fsync : `bool`
+        `True` or `False`, flushes the file and its directory to
+            disk when `True`.
+    check : `Callable`
+        Function object that accepts `file_path` and raises an exception
+            to abort the write. When not None, `check` is called, and the
+            file is replaced, while holding the lock on `file_path`, see
+            `_lock()`.
+    """
+
+    # Write to a temporary file, created with the default permissions of a
+    #   new file under the current umask when `file_path` does not exist
+    mode = _return_file_mode(file_path=file_path)
+    if mode is None:
+        temp_path = os.path.join(
+            os.path.dirname(file_path),
+            '.%s.%s.tmp' % (os.path.basename(file_path), uuid.uuid4().hex)
+        )
+        descriptor = os.open(
+            temp_path,
+            os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0),
+            0o666
+        )
+    else:
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path),
+            prefix='.%s.' % (os.path.basename(file_path)),
+            suffix='.tmp'
+        )
+    try:
+        with os.fdopen(
+            descriptor,
+            mode='wb' if isinstance(content, bytes) else 'w'
+        ) as file:
+            file.write(content)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+
+        # Retain the permissions of the file
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        stat_key = _return_stat_key(file_path=temp_path)
+
+        # Replace the file
+        with (
+            _lock(file_path=file_path) if check is not None
+            else contextlib.nullcontext()
+        ):
+            if check is not None:
+                check(file_path)
+            os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if fsync:
+        _fsync_directory(path=os.path.dirname(file_path))
+
+    return stat_key
+
+
+@contextlib.contextmanager
+def _lock(
+    file_path: str
+):
+    """ Holds an exclusive advisory lock on '.{file_name}.lock' alongside
+    `file_path` for the duration of the context.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the locked file.
+    """
+    descriptor = os.open(
+        os.path.join(
+            os.path.dirname(file_path),
+            '.%s.lock' % (os.path.basename(file_path))
+        ),
+        os.O_RDWR | os.O_CREAT,
+        0o666
+    )
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(descriptor)
+
+
+def _return_sidecar_path(
+    file_path: str
+) -> str:
+    """ Returns the file-path of the sidecar-file of `file_path`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    """
+    return os.path.join(
+        os.path.dirname(file_path),
+        '.%s.cache' % (os.path.basename(file_path))
+    )
+
+
+def _return_sidecar_version() -> tuple:
+    """ Returns the versions of pytensils, Python and `marshal` that the
+    content of a sidecar-file depends on.
+    """
+    global _SIDECAR_VERSION
+
+    if _SIDECAR_VERSION is None:
+        try:
+            import importlib.metadata
+            version = importlib.metadata.version('pytensils')
+        except Exception:
+            version = None
+        _SIDECAR_VERSION = (version, sys.version, marshal.version)
+
+    return _SIDECAR_VERSION
+
+
+def _return_sidecar(
+    file_path: str,
+    stat_key: tuple
+) -> Union[Tuple[bytes, str], None]:
+    """ Returns the config data of `file_path` stored within its sidecar-file
+    as `marshal` bytes, along with the digest of the config-file, when the
+    sidecar-file is fresh.
+
+    The sidecar-file is fresh when it was written by the same versions of
+    pytensils and Python, and the modification time and size, or otherwise
+    the digest, of the config-file are unchanged.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    stat_key : `tuple`
+        The modification time, size and inode of the config-file.
+    """
+    try:
+        with open(_return_sidecar_path(file_path=file_path), 'rb') as file:
+            version, file_key, digest = marshal.load(file)
+            if version != _return_sidecar_version():
+                return None
+
+            # Compare the digest when the config-file was touched
+            if tuple(file_key) != stat_key[:2]:
+                with open(file_path, 'rb') as config_file:
+                    if _return_digest(document=config_file.read()) != digest:
+                        return None
+
+            return (file.read(), digest)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_sidecar(
+    file_path: str,
+    stat_key: tuple,
+    cached: bytes,
+    digest: str
+):
+    """ Writes the config data of `file_path` to its sidecar-file, ignoring
+    any failure to write.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    stat_key : `tuple`
+        The modification time, size and inode of the config-file.
+    cached : `bytes`
+        The config data as `marshal` bytes.
+    digest : `str`
+        The digest of the config-file.
+    """
+    try:
+        _write_atomic(
+            file_path=_return_sidecar_path(file_path=file_path),
+            content=b''.join([
+                marshal.dumps(
+                    (_return_sidecar_version(), stat_key[:2], digest)
+                ),
+                cached
+            ])
+        )
+    except OSError:
+        pass
+
+
+def _return_materialized(value):
+    """ Returns `value` as a dictionary object when `value` is a
+    `pytensils.config.LazyDict`, or `value` otherwise.
+
+    Parameters
+    ----------
+    value : `Any`
+        Config data to materialize.
+    """
+    if isinstance(value, LazyDict):
+        return value.to_dict()
+    return value
+
+
+def _return_lazy(
+    file_path: str,
+    stat_key: tuple
+) -> Union[LazyDict, None]:
+    """ Indexes the sections of the config-file, `file_path`, and returns
+    the sections as a `pytensils.config.LazyDict`. Returns `None` when the
+    config-file cannot be indexed, or when the config-file is not a
+    dictionary of dictionaries, so that the config-file is read and
+    validated in full instead.
+
+    The memory-map and index of the config-file are cached alongside the
+    config data, and are re-used for as long as `stat_key` is unchanged.
+
+    Parameters
+    ----------
+    file_path : `str`
+        Absolute file-path of the config-file.
+    stat_key : `tuple`
+        The modification time, size and inode of the config-file.
+    """
+    entry = _return_cached(file_path=(file_path, 'index'), stat_key=stat_key)
+    if entry is not None:
+        document, index = entry[0]
+    else:
+        try:
+            with open(file_path, 'rb') as file:
+                document = mmap.mmap(
+                    file.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+                )
+        except (OSError, ValueError):
+            return None
+
+        index = _return_section_index(document=document)
+        if not index or not any(
+            document[value.start:value.start + 1] == b'{'
+            for value in index.values()
+        ):
+            document.close()
+            return None
+
+        # Cache the index of the config-file
+        _cache(
+            file_path=(file_path, 'index'),
+            stat_key=stat_key,
+            cached=(document, index),
+            digest=None
+        )
+
+    return LazyDict(
+        document=document,
+        index=dict(index),
+        file_name=os.path.basename(file_path)
+    )
+
+
+def _return_section_index(
+    document: mmap.mmap
+) -> Union[dict, None]:
+    """ Returns a dictionary object that maps each section of the
+    '.json' `document` to the `slice` of `document` that contains its value,
+    or `None` when `document` is not a '.json' object.
+
+    Parameters
+    ----------
+    document : `mmap.mmap`
+        Memory-map of the config-file.
+    """
+    start = _TOKEN_PATTERN.search(document)
+    if start is None or start.group() != b'{' or document[
+        :start.start()
+    ].strip():
+        return None
+
+    index = {}
+    position = start.end()
+    empty = _EMPTY_PATTERN.match(document, position)
+    if empty is not None:
+        return index if not document[empty.end():].strip() else None
+
+    while True:
+
+        # Parse the section name
+        key = _KEY_PATTERN.match(document, position)
+        if key is None:
+            return None
+        try:
+            section = json.loads(key.group(1))
+        except ValueError:
+            return None
+        position = key.end()
+
+        # Locate the end of the section value
+        first = document[position:position + 1]
+        if first in (b'{', b'['):
+            end = _return_value_end(document=document, position=position)
+            if end is None:
+                return None
+        elif first == b'"':
+            token = _TOKEN_PATTERN.match(document, position)
+            if token is None:
+                return None
+            end = token.end()
+        else:
+            end = _SCALAR_PATTERN.match(document, position).end()
+        index[section] = slice(position, end)
+
+        # Parse the separator
+        separator = _SEPARATOR_PATTERN.match(document, end)
+        if separator is None:
+            return None
+        position = separator.end()
+        if separator.group(1) == b'}':
+            if document[position:].strip():
+                return None
+            return index
+
+
+def _return_value_end(
+    document: mmap.mmap,
+    position: int
+) -> Union[int, None]:
+    """ Returns the end offset of the '.json' object or array that begins
+    at `position` within `document`, or `None` when it is not terminated.
+    Strings, and objects or arrays that contain no other objects or arrays,
+    are skipped by a single regular-expression match, so that only the
+    brackets of nested objects or arrays are counted.
+
+    Parameters
+    ----------
+    document : `mmap.mmap`
+        Memory-map of the config-file.
+    position : `int`
+        The offset of the opening bracket within `document`.
+    """
+    depth = 1
+    position += 1
+    while depth:
+        position = _SKIP_PATTERN.match(document, position).end()
+        bracket = document[position:position + 1]
+        if bracket in (b'{', b'['):
+            depth += 1
+        elif bracket in (b'}', b']'):
+            depth -= 1
+        else:
+            return None
+        position += 1
+    return position
+
+
+def _return_merged(
+    base: dict,
+    overlay: dict,
+    sources: dict,
+    index: int,
+    path: tuple
+) -> dict:
+    """ Returns `overlay` deep-merged into `base`, without modifying either,
+    recording the layer `index` of each merged config value in `sources`.
+
+    Parameters
+    ----------
+    base : `dict`
+        Dictionary object of the lower priority config values.
+    overlay : `dict`
+        Dictionary object of the higher priority config values.
+    sources : `dict`
+        Dictionary object that maps the keys of each config value to the
+            index of the layer that it came from.
+    index : `int`
+        Index of the layer of `overlay`.
+    path : `tuple`
+        The keys of `base` and `overlay`.
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        keys = path + (key,)
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _return_merged(
+                base=merged[key],
+                overlay=value,
+                sources=sources,
+                index=index,
+                path=keys
+            )
+        else:
+            merged[key] = value
+            _record_sources(
+                value=value,
+                sources=sources,
+                index=index,
+                path=keys
+            )
+        sources[keys] = index
+
+    return merged
+
+
+def _record_sources(
+    value,
+    sources: dict,
+    index: int,
+    path: tuple
+):
+    """ Records the layer `index` of `value` and of all nested config values
+    of `value` in `sources`.
+
+    Parameters
+    ----------
+    value : `Any`
+        Config value.
+    sources : `dict`
+        Dictionary object that maps the keys of each config value to the
+            index of the layer that it came from.
+    index : `int`
+        Index of the layer of `value`.
+    path : `tuple`
+        The keys of `value`.
+    """
+    sources[path] = index
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _record_sources(
+                value=item,
+                sources=sources,
+                index=index,
+                path=path + (key,)
+            )
+
+
+def _create_shared_memory(
+    name: str,
+    size: int
+):
+    """ Creates and returns shared memory of `size` bytes named `name`.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the shared memory.
+    size : `int`
+        Size of the shared memory in bytes.
+    """
+    from multiprocessing import shared_memory
+
+    return shared_memory.SharedMemory(
+        name=name,
+        create=True,
+        size=max(size, 1)
+    )
+
+
+def _attach_shared_memory(
+    name: str,
+    tracker: Union[tuple, None]
+):
+    """ Attaches to and returns the shared memory named `name`, see
+    `_untrack_shared_memory()`.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the shared memory.
+    tracker : Union[`tuple`, None]
+        The identity of the resource tracker of the publishing process,
+            see `_return_tracker()`, or None to untrack the shared memory
+            later.
+    """
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if tracker is not None:
+        _untrack_shared_memory(shm=shm, tracker=tracker)
+    return shm
+
+
+def _untrack_shared_memory(
+    shm,
+    tracker: tuple
+):
+    """ Unregisters `shm` from the resource tracker of the process, unless
+    the resource tracker is shared with the publishing process, which is
+    the case for its child processes.
+
+    Prior to Python 3.13, attaching registers the shared memory with the
+    resource tracker of the process, which unlinks it when the process
+    exits.
+
+    Parameters
+    ----------
+    shm : `multiprocessing.shared_memory.SharedMemory`
+        Shared memory to unregister.
+    tracker : `tuple`
+        The identity of the resource tracker of the publishing process,
+            see `_return_tracker()`.
+    """
+    if (
+        os.name != 'nt'
+        and sys.version_info < (3, 13)
+        and _return_tracker() != tracker
+    ):
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def _return_tracker() -> tuple:
+    """ Returns the device and inode of the pipe to the resource tracker of
+    the process, which identify the resource tracker across processes.
+    """
+    if os.name == 'nt' or sys.version_info >= (3, 13):
+        return (0, 0)
+
+    from multiprocessing import resource_tracker
+
+    stat_result = os.fstat(resource_tracker.getfd())
+    return (stat_result.st_dev, stat_result.st_ino)
+
+
+def _unlink_shared_memory(shm):
+    """ Detaches from and unlinks `shm`.
+
+    Parameters
+    ----------
+    shm : `multiprocessing.shared_memory.SharedMemory`
+        Shared memory to unlink.
+    """
+    try:
+        shm.close()
+    except BufferError:
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _parse_diff(
+    source,
+    target,
+    path: str,
+    operations: list
+):
+    """ Appends the JSON-patch operations that change `source` into `target`
+    to `operations`.
+
+    Parameters
+    ----------
+    source : `Any`
+        Config value to change.
+    target : `Any`
+        Changed config value.
+    path : `str`
+        JSON-pointer of `source` and `target`.
+    operations : `list`
+        List of JSON-patch operations.
+    """
+    if isinstance(source, dict) and isinstance(target, dict):
+        for key in source:
+            if key not in target:
+                operations.append(
+                    {'op': 'remove', 'path': _return_pointer(path, key)}
+                )
+        for key, value in target.items():
+            if key not in source:
+                operations.append(
+                    {
+                        'op': 'add',
+                        'path': _return_pointer(path, key),
+                        'value': copy.deepcopy(value)
+                    }
+                )
+            else:
+                _parse_diff(
+                    source=source[key],
+                    target=value,
+                    path=_return_pointer(path, key),
+                    operations=operations
+                )
+    elif not _is_identical(source, target):
+        operations.append(
+            {'op': 'replace', 'path': path, 'value': copy.deepcopy(target)}
+        )
+
+
+def _is_identical(
+    value,
+    other
+) -> bool:
+    """ Returns `True` when `value` and `other` are equal and of the same
+    dtypes, e.g. `1` is not identical to `1.0` or `True`.
+
+    Parameters
+    ----------
+    value : `Any`
+        Config value to compare.
+    other : `Any`
+        Config value to compare.
+    """
+    if type(value) is not type(other):
+        return False
+    if isinstance(value, dict):
+        return value.keys() == other.keys() and all(
+            _is_identical(item, other[key]) for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return len(value) == len(other) and all(
+            _is_identical(item, other_item)
+            for item, other_item in zip(value, other)
+        )
+    return value == other
+
+
+def _return_pointer(
+    path: str,
+    key: str
+) -> str:
+    """ Returns the JSON-pointer of `key` within the JSON-pointer `path`.
+
+    Parameters
+    ----------
+    path : `str`
+        JSON-pointer.
+    key : `str`
+        Key to append.
+    """
+    return '%s/%s' % (
+        path,
+        str(key).replace('~', '~0').replace('/', '~1')
+    )
+
+
+def _return_tokens(
+    path: str
+) -> list:
+    """ Returns the keys of the JSON-pointer `path`.
+
+    Parameters
+    ----------
+    path : `str`
+        JSON-pointer.
+    """
+    if not isinstance(path, str) or (path and not path.startswith('/')):
+        raise ValueError('Invalid JSON-pointer {%s}.' % (path))
+    return [
+        token.replace('~1', '/').replace('~0', '~')
+        for token in path.split('/')[1:]
+    ]
+
+
+def _return_index(
+    node: list,
+    token: str,
+    insert: bool = False
+) -> int:
+    """ Returns the list index of `token` within `node`.
+
+    Parameters
+    ----------
+    node : `list`
+        List object.
+    token : `str`
+        Key of the JSON-pointer.
+    insert : `bool`
+        `True` or `False`, allows the index after the last item of `node`
+            when `True`.
+    """
+    if insert and token == '-':
+        return len(node)
+    if not token.isdigit() or (len(token) > 1 and token.startswith('0')):
+        raise IndexError('Invalid list index {%s}.' % (token))
+    index = int(token)
+    if index > len(node) or (index == len(node) and not insert):
+        raise IndexError('List index {%s} out of range.' % (token))
+    return index
+
+
+def _return_value(
+    document,
+    tokens: list
+):
+    """ Returns the config value of `document` at `tokens`.
+
+    Parameters
+    ----------
+    document : `Any`
+        Config data.
+    tokens : `list`
+        Keys of the JSON-pointer.
+    """
+    for token in tokens:
+        if isinstance(document, dict):
+            if token not in document:
+                raise KeyError('Path {%s} not found.' % (token))
+            document = document[token]
+        elif isinstance(document, list):
+            document = document[_return_index(node=document, token=token)]
+        else:
+            raise KeyError('Path {%s} not found.' % (token))
+    return document
+
+
+def _return_updated(
+    document,
+    tokens: list,
+    update: Callable
+):
+    """ Returns a copy of `document` with `update` applied to the parent of
+    `tokens`, copying only the nodes along `tokens`.
+
+    Parameters
+    ----------
+    document : `Any`
+        Config data.
+    tokens : `list`
+        Keys of the JSON-pointer.
+    update : `Callable`
+        Function object that accepts a copy of the parent node and the last
+            key of `tokens` and updates the parent node.
+    """
+    if isinstance(document, dict):
+        node = dict(document)
+    elif isinstance(document, list):
+        node = list(document)
+    else:
+        raise KeyError('Path {%s} not found.' % (tokens[0]))
+
+    if len(tokens) == 1:
+        update(node, tokens[0])
+        return node
+
+    if isinstance(node, dict):
+        if tokens[0] not in node:
+            raise KeyError('Path {%s} not found.' % (tokens[0]))
+        key = tokens[0]
+    else:
+        key = _return_index(node=node, token=tokens[0])
+    node[key] = _return_updated(
+        document=node[key],
+        tokens=tokens[1:],
+        update=update
+    )
+    return node
+
+
+def _return_added(
+    document,
+    tokens: list,
+    value
+):
+    """ Returns a copy of `document` with `value` added at `tokens`.
+
+    Parameters
+    ----------
+    document : `Any`
+        Config data.
+    tokens : `list`
+        Keys of the JSON-pointer.
+    value : `Any`
+        Config value to add.
+    """
+    if not tokens:
+        return value
+
+    def update(node, token):
+        if isinstance(node, dict):
+            node[token] = value
+        else:
+            node.insert(
+                _return_index(node=node, token=token, insert=True),
+                value
+            )
+
+    return _return_updated(document=document, tokens=tokens, update=update)
+
+
+def _return_removed(
+    document,
+    tokens: list
+):
+    """ Returns a copy of `document` with the config value at `tokens`
+    removed.
+
+    Parameters
+    ----------
+    document : `Any`
+        Config data.
+    tokens : `list`
+        Keys of the JSON-pointer.
+    """
+    if not tokens:
+        raise ValueError('The root cannot be removed.')
+
+    def update(node, token):
+        if isinstance(node, dict):
+            if token not in node:
+                raise KeyError('Path {%s} not found.' % (token))
+            del node[token]
+        else:
+            del node[_return_index(node=node, token=token)]
+
+    return _return_updated(document=document, tokens=tokens, update=update)
+
+
+def _return_patched(
+    document,
+    operation: dict
+) -> Tuple[dict, list]:
+    """ Returns a copy of `document` with the JSON-patch `operation` applied,
+    along with the keys of the changed paths.
+
+    Parameters
+    ----------
+    document : `Any`
+        Config data.
+    operation : `dict`
+        JSON-patch operation.
+    """
+    op = operation['op']
+    tokens = _return_tokens(path=operation['path'])
+
+    if op == 'add':
+        return (
+            _return_added(
+                document=document,
+                tokens=tokens,
+                value=copy.deepcopy(operation['value'])
+            ),
+            [tokens]
+        )
+    if op == 'remove':
+        return (_return_removed(document=document, tokens=tokens), [tokens])
+    if op == 'replace':
+        value = copy.deepcopy(operation['value'])
+        if not tokens:
+            return (value, [tokens])
+
+        def update(node, token):
+            if isinstance(node, dict):
+                if token not in node:
+                    raise KeyError('Path {%s} not found.' % (token))
+                node[token] = value
+            else:
+                node[_return_index(node=node, token=token)] = value
+
+        return (
+            _return_updated(document=document, tokens=tokens, update=update),
+            [tokens]
+        )
+    if op in ('move', 'copy'):
+        source = _return_tokens(path=operation['from'])
+        value = _return_value(document=document, tokens=source)
+        if op == 'move':
+            if tokens[:len(source)] == source and tokens != source:
+                raise ValueError(
+                    'A value cannot be moved into one of its children.'
+                )
+            document = _return_removed(document=document, tokens=source)
+            return (
+                _return_added(document=document, tokens=tokens, value=value),
+                [source, tokens]
+            )
+        return (
+            _return_added(
+                document=document,
+                tokens=tokens,
+                value=copy.deepcopy(value)
+            ),
+            [tokens]
+        )
+    if op == 'test':
+        if not _is_identical(
+            _return_value(document=document, tokens=tokens),
+            operation['value']
+        ):
+            raise ValueError('Test of {%s} failed.' % (operation['path']))
+        return (document, [])
+
+    raise ValueError('Invalid operation {%s}.' % (op))
+
+
+def _return_touched(
+    dict_object: dict,
+    paths: list
+) -> dict:
+    """ Returns the sections and keys of `dict_object` that are changed by
+    the keys of the JSON-pointers in `paths`.
+
+    Parameters
+    ----------
+    dict_object : `dict`
+        Dictionary object containing configuration values.
+    paths : `list`
+        List of the keys of JSON-pointers.
+    """
+    if [] in paths:
+        return dict_object
+
+    touched = {}
+    for tokens in paths:
+        section = tokens[0]
+        if section not in dict_object:
+            continue
+        values = dict_object[section]
+        if len(tokens) == 1 or not isinstance(values, dict):
+            touched[section] = values
+        elif touched.get(section) is not values and tokens[1] in values:
+            touched.setdefault(section, {})[tokens[1]] = values[tokens[1]]
+
+    return touched
+
+
+def _return_keys(
+    path: Union[str, tuple]
+) -> tuple:
+    """ Returns the keys of `path` along with their list indices, or `None`
+    when a key is not a list index.
+
+    Parameters
+    ----------
+    path : Union[`str`, `tuple`]
+        The section, followed by any nested keys or list indices, either
+            separated by '.' or as a `tuple`.
+    """
+    if isinstance(path, str):
+        path = path.split('.')
+    return tuple(
+        (
+            str(key),
+            int(key) if isinstance(key, int) or str(key).isdigit() else None
+        )
+        for key in path
+    )
+
+
+def _make_dataclass(
+    name: str,
+    fields: list
+) -> type:
+    """ Returns a frozen dataclass, `name`, that uses `__slots__`.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the dataclass.
+    fields : `list`
+        List of the names and types of the fields.
+    """
+    invalid = [
+        field for field, _ in fields
+        if not str(field).isidentifier() or keyword.iskeyword(field)
+    ]
+    if invalid:
+        raise errors.config.ValidationError(
+            'Invalid field names {%s} for the dataclass {%s}.' % (
+                ', '.join(str(field) for field in invalid),
+                name
+            )
+        )
+
+    return dataclasses.make_dataclass(
+        name,
+        fields,
+        namespace={'__slots__': tuple(field for field, _ in fields)},
+        frozen=True
+    )
+
+
+def _return_class_name(
+    name: str
+) -> str:
+    """ Returns the section `name` as a class name, e.g. 'db_settings' as
+    'DbSettings'.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the section.
+    """
+    class_name = ''.join(
+        part[:1].upper() + part[1:]
+        for part in re.split(r'[^0-9a-zA-Z]+', str(name))
+    )
+    if not class_name.isidentifier():
+        class_name = 'Section%s' % (class_name)
+    return class_name
+
+
+def _compile_dtype(
+    dtype: Union[str, type, dict, Any]
+) -> Union[str, type, dict, _Generic]:
+    """ Returns `dtype` compiled into a type object, a dictionary of
+    compiled dtypes or a compiled generic dtype. Names of unknown dtypes are
+    returned as is.
+
+    Parameters
+    ----------
+    dtype : Union[`str`, `type`, `dict`, `Any`]
+        The name of the dtype, e.g. 'int', 'list[float]', 'dict[str, int]'
+            or 'int | None', a type object, a generic alias, e.g.
+            `typing.List[float]`, or a dictionary of nested dtypes.
+    """
+    if isinstance(dtype, dict):
+        return {
+            key: _compile_dtype(dtype=value) for key, value in dtype.items()
+        }
+    if getattr(dtype, '__origin__', None) is not None:
+        dtype = str(dtype).replace('typing.', '')
+    if not isinstance(dtype, str):
+        return dtype
+    if dtype in _DTYPES:
+        return _DTYPES[dtype]
+
+    # Parse the name of the dtype
+    tokens = []
+    position = 0
+    while dtype[position:].strip():
+        match = _DTYPE_PATTERN.match(dtype, position)
+        if match is None:
+            raise errors.config.ValidationError(
+                'Invalid dtype {%s}.' % (dtype)
+            )
+        tokens.append(match.group(1))
+        position = match.end()
+
+    try:
+        compiled, position = _parse_dtype(tokens=tokens, position=0)
+    except IndexError:
+        compiled, position = (None, 0)
+    if compiled is None or position != len(tokens):
+        raise errors.config.ValidationError('Invalid dtype {%s}.' % (dtype))
+
+    return compiled
+
+
+def _parse_dtype(
+    tokens: list,
+    position: int
+) -> Tuple[Union[str, type, _Generic, None], int]:
+    """ Parses the union of dtypes within `tokens` from `position` and
+    returns the compiled dtype, or `None` when invalid, along with the
+    position after the union.
+
+    Parameters
+    ----------
+    tokens : `list`
+        List of the tokens of the name of a dtype.
+    position : `int`
+        Position of the first token of the union.
+    """
+    options = []
+    while True:
+        name = tokens[position]
+        position += 1
+
+        # Parse the arguments
+        args = []
+        if position < len(tokens) and tokens[position] == '[':
+            while True:
+                arg, position = _parse_dtype(
+                    tokens=tokens,
+                    position=position + 1
+                )
+                if arg is None:
+                    return (None, position)
+                args.append(arg)
+                if tokens[position] == ']':
+                    position += 1
+                    break
+                if tokens[position] != ',':
+                    return (None, position)
+
+        # Compile the option
+        origin = name.lower()
+        if origin in ('list', 'dict') and args:
+            if len(args) != (1 if origin == 'list' else 2):
+                return (None, position)
+            options.append(_Generic(origin=origin, args=tuple(args)))
+        elif origin == 'optional' and len(args) == 1:
+            options.extend([args[0], type(None)])
+        elif origin == 'union' and args:
+            options.extend(args)
+        elif origin == 'any' and not args:
+            options.append(_Generic(origin='any'))
+        elif origin in ('none', 'nonetype') and not args:
+            options.append(type(None))
+        elif not args and (name[:1].isalpha() or name[:1] == '_'):
+            options.append(_DTYPES.get(origin, _DTYPES.get(name, name)))
+        else:
+            return (None, position)
+
+        if position < len(tokens) and tokens[position] == '|':
+            position += 1
+            continue
+        break
+
+    # Flatten nested unions
+    flattened = []
+    for option in options:
+        if isinstance(option, _Generic) and option.origin == 'union':
+            flattened.extend(option.args)
+        elif option not in flattened:
+            flattened.append(option)
+
+    if len(flattened) == 1:
+        return (flattened[0], position)
+    return (_Generic(origin='union', args=tuple(flattened)), position)
+
+
+def _return_dtype_name(
+    dtype: Union[str, type, dict, _Generic]
+) -> str:
+    """ Returns the name of the compiled dtype, `dtype`.
+
+    Parameters
+    ----------
+    dtype : Union[`str`, `type`, `dict`, `_Generic`]
+        Compiled dtype.
+    """
+    if isinstance(dtype, _Generic):
+        return dtype.name
+    if isinstance(dtype, dict):
+        return 'dict'
+    if dtype is type(None):
+        return 'None'
+    if isinstance(dtype, type):
+        return dtype.__name__
+    return str(dtype)
+
+
+def _return_override(
+    value: str,
+    dtype: Union[str, type, dict, _Generic]
+) -> Any:
+    """ Returns the value of an environment variable, `value`, converted to
+    the compiled dtype, `dtype`, via `pytensils.utils.as_type`. Each option
+    of a union is tried in order, with `None` tried last, and the converted
+    value is validated against `dtype`. Raises a `TypeError` when `value`
+    cannot be converted to a valid value.
+
+    Parameters
+    ----------
+    value : `str`
+        The value of the environment variable.
+    dtype : Union[`str`, `type`, `dict`, `_Generic`]
+        Compiled dtype.
+    """
+    options = [dtype]
+    if isinstance(dtype, _Generic) and dtype.origin == 'union':
+        options = sorted(dtype.args, key=lambda arg: arg is type(None))
+
+    for option in options:
+
+        # Convert the value to the base dtype of the option
+        if option is type(None):
+            return_dtype = 'none'
+        elif isinstance(option, dict):
+            return_dtype = 'dict'
+        elif isinstance(option, _Generic):
+            return_dtype = option.origin if option.origin in (
+                'list', 'dict'
+            ) else 'str'
+        else:
+            return_dtype = _return_dtype_name(dtype=option)
+        try:
+            converted = utils.as_type(value=value, return_dtype=return_dtype)
+        except (TypeError, NameError, SyntaxError):
+            continue
+
+        # Validate the converted value
+        dtype_errors = {}
+        _parse_value_errors(
+            value=converted,
+            dtype=dtype,
+            key='value',
+            dtype_errors=dtype_errors
+        )
+        if not dtype_errors:
+            return converted
+
+    raise TypeError(
+        '{%s} value cannot be converted to {%s}.' % (
+            value,
+            _return_dtype_name(dtype=dtype)
+        )
+    )
+
+
+def _return_types(
+    dtype: Union[str, type, dict, _Generic]
+) -> Union[frozenset, None]:
+    """ Returns the type objects that satisfy the compiled dtype, `dtype`,
+    or `None` when `dtype` cannot be checked by type objects alone.
+
+    Parameters
+    ----------
+    dtype : Union[`str`, `type`, `dict`, `_Generic`]
+        Compiled dtype.
+    """
+    if isinstance(dtype, type):
+        return frozenset([dtype])
+    if isinstance(dtype, _Generic):
+        return dtype._TYPES
+    return None
+
+
+def _parse_value_errors(
+    value,
+    dtype: Union[str, type, dict, _Generic],
+    key: str,
+    dtype_errors: dict
+):
+    """ Adds the dtype errors of `value` against the compiled dtype, `dtype`,
+    to `dtype_errors`, reporting the errors of nested values by their dotted
+    keys, e.g. 'thresholds.3'.
+
+    Parameters
+    ----------
+    value : `Any`
+        Config value to validate.
+    dtype : Union[`str`, `type`, `dict`, `_Generic`]
+        Compiled dtype.
+    key : `str`
+        The dotted key of `value`.
+    dtype_errors : `dict`
+        Dictionary object of the dtype errors.
+    """
+    if isinstance(dtype, _Generic):
+        if dtype.origin == 'any':
+            return None
+
+        if dtype.origin == 'union':
+            if dtype._TYPES is not None:
+                if type(value) in dtype._TYPES:
+                    return None
+            else:
+                for option in dtype.args:
+                    option_errors = {}
+                    _parse_value_errors(
+                        value=value,
+                        dtype=option,
+                        key=key,
+                        dtype_errors=option_errors
+                    )
+                    if not option_errors:
+                        return None
+
+        elif type(value) is list and dtype.origin == 'list':
+            _parse_items_errors(
+                items=enumerate(value),
+                values=value,
+                dtype=dtype.args[0],
+                key=key,
+                dtype_errors=dtype_errors
+            )
+            return None
+
+        elif type(value) is dict and dtype.origin == 'dict':
+            _parse_items_errors(
+                items=((item, item) for item in value),
+                values=value.keys(),
+                dtype=dtype.args[0],
+                key=key,
+                dtype_errors=dtype_errors
+            )
+            _parse_items_errors(
+                items=value.items(),
+                values=value.values(),
+                dtype=dtype.args[1],
+                key=key,
+                dtype_errors=dtype_errors
+            )
+            return None
+
+    elif isinstance(dtype, dict):
+        if type(value) is dict:
+            for nested_key, nested_value in value.items():
+                nested_dtype = dtype.get(nested_key, _MISSING)
+                if nested_dtype is _MISSING:
+                    dtype_errors['%s.%s' % (key, nested_key)] = (
+                        'No dtype found in {dtypes}.'
+                    )
+                else:
+                    _parse_value_errors(
+                        value=nested_value,
+                        dtype=nested_dtype,
+                        key='%s.%s' % (key, nested_key),
+                        dtype_errors=dtype_errors
+                    )
+            return None
+
+    elif type(value) is dtype or type(value).__name__ == dtype:
+        return None
+
+    dtype_errors[key] = 'Invalid dtype {%s}. Expected {%s}.' % (
+        type(value).__name__,
+        _return_dtype_name(dtype=dtype)
+    )
+
+
+def _parse_items_errors(
+    items: Iterable,
+    values: Iterable,
+    dtype: Union[str, type, dict, _Generic],
+    key: str,
+    dtype_errors: dict
+):
+    """ Adds the dtype errors of the items of a list or dictionary to
+    `dtype_errors`, checking the types of all `values` at once when `dtype`
+    can be checked by type objects alone.
+
+    Parameters
+    ----------
+    items : `Iterable`
+        The keys, or indices, and values of the items.
+    values : `Iterable`
+        The values of the items to validate.
+    dtype : Union[`str`, `type`, `dict`, `_Generic`]
+        Compiled dtype of the items.
+    key : `str`
+        The dotted key of the list or dictionary.
+    dtype_errors : `dict`
+        Dictionary object of the dtype errors.
+    """
+    types = _return_types(dtype=dtype)
+    if types is not None and set(map(type, values)) <= types:
+        return None
+
+    for item_key, value in items:
+        if types is not None and type(value) in types:
+            continue
+        _parse_value_errors(
+            value=value,
+            dtype=dtype,
+            key='%s.%s' % (key, item_key),
+            dtype_errors=dtype_errors
+        )
@@ -17,6 +17,9 @@ class config:
     class ValidationError(Exception):
         pass
 
+    class ConflictError(Exception):
+        pass
+
     # Define static function(s)
     def all() -> tuple:
         """ Returns a list of all config-related exceptions.
@@ -25,7 +28,8 @@ class config:
             config.OSError,
             config.FileNotFoundError,
             config.TypeError,
-            config.ValidationError
+            config.ValidationError,
+            config.ConflictError
         )
 
     def raise_exception(
@@ -50,6 +54,8 @@ class config:
             raise config.TypeError(msg)
         elif isinstance(exception, config.ValidationError):
             raise config.ValidationError(msg)
+        elif isinstance(exception, config.ConflictError):
+            raise config.ConflictError(msg)
         else:
             raise NotImplementedError(
                 'The exception {%s} is not implemented for `pytensils.config`.'
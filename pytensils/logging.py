@@ -1,15 +1,26 @@
 """ Pretty user-logging """
 
+from __future__ import annotations
 import os
+import re
+import time
+import heapq
+import collections
+import json
+import atexit
+import sqlite3
+import threading
+import concurrent.futures
 import textwrap
 import tabulate
 import inspect
 import datetime as dt
 import pytz
 import logging
+import numpy as np
 import pandas as pd
 from pytensils import errors
-from typing import Union, Callable
+from typing import Union, Callable, Iterable, Iterator, Any
 
 # Static variable(s)
 INDENT = 4
@@ -18,6 +29,16 @@ TIMEZONE = 'America/New_York'
 
 # Private static variable(s)
 _MAX_DEPTH = 1
+_START_TIME_PATTERN = re.compile(
+    r'Start time\s+: (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})$'
+)
+_END_TIME_PATTERN = re.compile(r'End time\s+: (\d{2}:\d{2}:\d{2}\.\d{6})$')
+_RUN_TIME_PATTERN = re.compile(r'Run time\s+: (.+)$')
+_EXCEPTION_PATTERN = re.compile(r'Exception\s+: (\S+)$')
+_CHUNK_SIZE = 1024 * 1024
+_TAIL_SIZE = 8192
+_HEAD_SIZE = 64
+_REGISTRY_LEVELS = ['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG']
 
 # Setup CPython logging
 pytensils = logging.getLogger('pytensils')
@@ -60,6 +81,9 @@ class Handler():
     debug_console: `bool`
         `True` or `False`, outputs the logging content to the console
             output when `True` using `logging.debug()`.
+    registry: `pytensils.logging.Registry`
+        An instance of the `pytensils.logging.Registry` class that records
+            the run-information of the job when the log is closed.
     """
 
     def __init__(
@@ -69,7 +93,8 @@ class Handler():
         description: str = 'Environment information summary.',
         metadata: dict = {},
         create: bool = True,
-        debug_console: bool = False
+        debug_console: bool = False,
+        registry: Union[Registry, None] = None
     ):
         """ Initializes an instance of the logging-handler class.
 
@@ -91,18 +116,27 @@ class Handler():
         debug_console: `bool`
             `True` or `False`, outputs the logging content to the console
                 output when `True` using `logging.debug()`.
+        registry: `pytensils.logging.Registry`
+            An instance of the `pytensils.logging.Registry` class that
+                records the run-information of the job when the log is
+                closed.
         """
 
         # Assign class variables
         self.path = path
         self.file_name = file_name
         self.debug_console = debug_console
+        self.metadata = dict(metadata)
 
         # Assign private class variables
         self._INDENT = INDENT
         self._LINE_LENGTH = LINE_LENGTH
         self._TIMEZONE = TIMEZONE
         self._START_TIME = dt.datetime.now(tz=pytz.timezone(TIMEZONE))
+        self._END_TIME = None
+        self._EXCEPTION = None
+        self._COUNTS = {}
+        self._REGISTRY = registry
 
         # Validate the file-path
         if not os.path.isdir(path):
@@ -213,14 +247,20 @@ class Handler():
 
     def write(
         self,
-        content: Union[str, list, dict, pd.DataFrame],
+        content: Union[str, list, dict, pd.DataFrame, np.ndarray, Iterator],
         level: str = 'NOTSET'
     ):
         """ Writes `content` to the log-file with the `level` scope.
 
+        Iterators and generators are written item-by-item as a list,
+        `np.ndarray` objects are summarized by `np.array2string()`, and any
+        object that supports the DataFrame interchange protocol is written
+        as a dataframe.
+
         Parameters
         ----------
-        content : [`str`, `list`, `dict`, `pd.DataFrame`]
+        content : [`str`, `list`, `dict`, `pd.DataFrame`, `np.ndarray`,
+                `Iterator`]
             The object to be written to the log-file.
         level : `str`
             Any level available by `logging`.
@@ -241,6 +281,10 @@ class Handler():
         # Retrive level substring
         substring = _return_level_substring(level=level)
 
+        # Count messages
+        if level != 'NOTSET':
+            self._COUNTS[level] = self._COUNTS.get(level, 0) + 1
+
         # Write
         with open(os.path.join(self.path, self.file_name), 'a+') as log:
 
@@ -281,6 +325,36 @@ class Handler():
                     )
                 )
 
+            # `np.ndarray`
+            elif isinstance(content, np.ndarray):
+                log.write(
+                    self._pretty_array(
+                        array=content
+                    )
+                )
+
+            # `Iterator`, written item-by-item
+            elif isinstance(content, Iterator):
+                log.write(
+                    self._pretty_str(
+                        string=''
+                    )
+                )
+                for item in content:
+                    log.write(
+                        self._pretty_list_item(
+                            item=item
+                        )
+                    )
+
+            # DataFrame interchange protocol
+            elif hasattr(content, '__dataframe__'):
+                log.write(
+                    self._pretty_df(
+                        df=_return_interchange_df(df_object=content)
+                    )
+                )
+
             else:
                 raise TypeError(
                     'Invalid content datatype {%s}.' % (
@@ -288,6 +362,42 @@ class Handler():
                     )
                 )
 
+    def progress(
+        self,
+        iterable: Union[Iterable, None] = None,
+        total: Union[int, None] = None,
+        every_seconds: Union[float, None] = 10.0,
+        every_n: Union[int, None] = None,
+        description: str = 'Progress'
+    ) -> Progress:
+        """ Returns a throttled progress-tracker that writes a throughput
+        and ETA status message to the log-file at most once every
+        `every_seconds` seconds and / or every `every_n` iterations.
+
+        Parameters
+        ----------
+        iterable : `Iterable`
+            Optional iterable object to track. Iterating over the returned
+                progress-tracker yields the items of `iterable`.
+        total : `int`
+            The expected number of iterations. Defaults to `len(iterable)`
+                when available.
+        every_seconds : `float`
+            The minimum number of seconds between status messages.
+        every_n : `int`
+            The number of iterations between status messages.
+        description : `str`
+            The prefix of each status message.
+        """
+        return Progress(
+            Logging=self,
+            iterable=iterable,
+            total=total,
+            every_seconds=every_seconds,
+            every_n=every_n,
+            description=description
+        )
+
     def close(
         self
     ):
@@ -307,6 +417,7 @@ class Handler():
 
         # Write run-time parameters
         end_time = dt.datetime.now(tz=pytz.timezone(TIMEZONE))
+        self._END_TIME = end_time
         self.write(
             content={
                 'Start time': self._START_TIME.strftime('%H:%M:%S.%f'),
@@ -321,6 +432,9 @@ class Handler():
             content=''.join(['-'*(self._LINE_LENGTH-self._INDENT-1), '\n'])
         )
 
+        # Record the run
+        self._record()
+
     def close_on_exception(
         self,
         func: Callable
@@ -339,6 +453,16 @@ class Handler():
 
             # Raise all `pytensils` exceptions
             except errors.config.all() as e:
+
+                # Re-record the run that was closed by `pytensils.config`,
+                #   or record the run that was not closed as of now
+                self._EXCEPTION = type(e).__name__
+                self._record(
+                    end_time=self._END_TIME or dt.datetime.now(
+                        tz=pytz.timezone(TIMEZONE)
+                    )
+                )
+
                 errors.config.raise_exception(
                     msg=(
                         'See {%s} for more information.' % (
@@ -381,11 +505,37 @@ class Handler():
                         'Exception': type(e).__name__
                     }
                 )
+                self._EXCEPTION = type(e).__name__
                 self.close()
                 raise e
             return result
         return wrapper
 
+    def _record(
+        self,
+        end_time: Union[dt.datetime, None] = None
+    ):
+        """ Records the run-information of the job within the registry.
+
+        Parameters
+        ----------
+        end_time : `dt.datetime`
+            The end time of the job. Defaults to the time the log was
+                closed.
+        """
+        end_time = end_time or self._END_TIME
+        if self._REGISTRY is None or end_time is None:
+            return None
+
+        self._REGISTRY.record(
+            log_path=os.path.abspath(os.path.join(self.path, self.file_name)),
+            metadata=self.metadata,
+            start_time=self._START_TIME,
+            end_time=end_time,
+            counts=self._COUNTS,
+            exception=self._EXCEPTION
+        )
+
     def _pretty_header(
         self,
         header: str,
@@ -528,24 +678,39 @@ class Handler():
                 )
             ]
             + [
-                self._pretty_str(
-                    string=''.join([
-                        ' '*self._INDENT,
-                        '- ',
-                        self._pretty_textwrap(
-                            string=str(item),
-                            width=(
-                                self._LINE_LENGTH
-                                - self._INDENT
-                                - self._INDENT
-                                - 3
-                            )
-                        )
-                    ])
+                self._pretty_list_item(
+                    item=item
                 ) for item in list_object
             ]
         )
 
+    def _pretty_list_item(
+        self,
+        item: Any
+    ) -> str:
+        """ Returns a 'pretty' formatted list item.
+
+        Parameters
+        ----------
+        item : `Any`
+            List item to `pretty` format.
+        """
+        return self._pretty_str(
+            string=''.join([
+                ' '*self._INDENT,
+                '- ',
+                self._pretty_textwrap(
+                    string=str(item),
+                    width=(
+                        self._LINE_LENGTH
+                        - self._INDENT
+                        - self._INDENT
+                        - 3
+                    )
+                )
+            ])
+        )
+
     def _pretty_dict(
         self,
         dict_object: dict
@@ -633,6 +798,44 @@ class Handler():
             ]
         )
 
+    def _pretty_array(
+        self,
+        array: np.ndarray
+    ) -> str:
+        """ Returns a 'pretty' formatted array, summarizing the edges of
+        arrays that exceed the `np.get_printoptions()` threshold.
+
+        Parameters
+        ----------
+        array : `np.ndarray`
+            Array to 'pretty' format.
+        """
+
+        # Prettify array
+        return ''.join(
+            [
+                self._pretty_str(
+                    string=''
+                )
+            ]
+            + [
+                self._pretty_str(
+                    string=''.join([
+                        ' '*self._INDENT,
+                        line
+                    ])
+                ) for line in np.array2string(
+                    array,
+                    max_line_width=(
+                        self._LINE_LENGTH
+                        - self._INDENT
+                        - self._INDENT
+                        - 1
+                    )
+                ).split('\n')
+            ]
+        )
+
     def _validate_depth(
         self,
         dict_object: dict
@@ -679,6 +882,735 @@ class Handler():
             )
 
 
+class Progress():
+    """ A `class` that represents a throttled progress-tracker.
+
+    Parameters
+    ----------
+    Logging : `pytensils.logging.Handler`
+        An instance of the `pytensils.logging.Handler` class that receives
+            the progress status messages.
+    iterable : `Iterable`
+        Optional iterable object to track.
+    total : `int`
+        The expected number of iterations.
+    every_seconds : `float`
+        The minimum number of seconds between status messages.
+    every_n : `int`
+        The number of iterations between status messages.
+    description : `str`
+        The prefix of each status message.
+    """
+
+    def __init__(
+        self,
+        Logging: Handler,
+        iterable: Union[Iterable, None] = None,
+        total: Union[int, None] = None,
+        every_seconds: Union[float, None] = 10.0,
+        every_n: Union[int, None] = None,
+        description: str = 'Progress'
+    ):
+        """ Initializes an instance of the progress-tracker class.
+
+        Parameters
+        ----------
+        Logging : `pytensils.logging.Handler`
+            An instance of the `pytensils.logging.Handler` class that
+                receives the progress status messages.
+        iterable : `Iterable`
+            Optional iterable object to track.
+        total : `int`
+            The expected number of iterations.
+        every_seconds : `float`
+            The minimum number of seconds between status messages.
+        every_n : `int`
+            The number of iterations between status messages.
+        description : `str`
+            The prefix of each status message.
+        """
+
+        # Validate the reporting interval(s)
+        if not every_seconds and not every_n:
+            raise ValueError(
+                'Either {every_seconds} or {every_n} must be provided.'
+            )
+
+        # Default the total to the length of the iterable
+        if total is None and iterable is not None:
+            try:
+                total = len(iterable)
+            except TypeError:
+                total = None
+
+        # Assign class variables
+        self.count = 0
+        self.total = total
+        self.description = description
+
+        # Assign private class variables
+        self._LOGGING = Logging
+        self._ITERABLE = iterable
+        self._EVERY_SECONDS = every_seconds
+        self._EVERY_N = every_n
+        self._START = time.perf_counter()
+        self._LAST_TIME = self._START
+        self._LAST_COUNT = 0
+        self._CLOSED = False
+
+        # The count-based reporting threshold and the count at which the
+        #   clock is next consulted. Only `count` is compared against
+        #   `_NEXT_CHECK` per iteration, so the clock is read once per
+        #   stride of iterations rather than once per iteration.
+        self._NEXT_REPORT = every_n if every_n else None
+        self._NEXT_CHECK = every_n if every_n else 1
+        self._STRIDE = 1
+        self._CHECK_TIME = self._START
+        self._CHECK_COUNT = 0
+
+        # Force a clock check once a reporting interval has elapsed, so that
+        #   time-based status messages are written when throughput drops
+        self._STOP = threading.Event()
+        self._WATCHER = None
+        if every_seconds:
+            self._WATCHER = threading.Thread(
+                target=self._watch,
+                name='pytensils-progress-watcher',
+                daemon=True
+            )
+            self._WATCHER.start()
+
+    def __iter__(self) -> Iterator:
+        """ Yields the items of the tracked iterable, counting each item. """
+        if self._ITERABLE is None:
+            raise TypeError('The progress-tracker has no iterable to track.')
+
+        count = self.count
+        try:
+            for item in self._ITERABLE:
+                yield item
+                count += 1
+                if count >= self._NEXT_CHECK:
+                    self.count = count
+                    self._check()
+        finally:
+            self.count = count
+
+            # Write the final summary
+            self.close()
+
+    def __enter__(self) -> Progress:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def update(
+        self,
+        n: int = 1
+    ):
+        """ Increments the iteration count by `n`, writing a status message
+        when a reporting interval has elapsed.
+
+        Parameters
+        ----------
+        n : `int`
+            The number of completed iterations.
+        """
+        self.count += n
+        if self.count >= self._NEXT_CHECK:
+            self._check()
+
+    def close(self):
+        """ Writes the final progress summary to the log-file. """
+        if self._CLOSED:
+            return None
+        self._CLOSED = True
+        self._STOP.set()
+
+        elapsed = time.perf_counter() - self._START
+        self._LOGGING.write(
+            content='%s: completed %s%s in %s at %s/s.' % (
+                self.description,
+                '{:,}'.format(self.count),
+                (
+                    ' / %s' % '{:,}'.format(self.total)
+                    if self.total is not None else ''
+                ),
+                _format_seconds(seconds=elapsed),
+                '{:,.1f}'.format(self.count / elapsed if elapsed else 0.0)
+            ),
+            level='INFO'
+        )
+
+    def _check(self):
+        """ Writes a status message when a reporting interval has elapsed
+        and schedules the next check.
+        """
+        now = time.perf_counter()
+
+        # Report
+        if (
+            (self._NEXT_REPORT and self.count >= self._NEXT_REPORT)
+            or (
+                self._EVERY_SECONDS
+                and now - self._LAST_TIME >= self._EVERY_SECONDS
+            )
+        ):
+            self._report(now=now)
+            if self._NEXT_REPORT:
+                self._NEXT_REPORT = self.count + self._EVERY_N
+
+        # Schedule the next clock check at roughly a tenth of the reporting
+        #   interval, based on the rate since the last check, at most
+        #   doubling the stride per check
+        stride = None
+        if self._EVERY_SECONDS:
+            elapsed = now - self._CHECK_TIME
+            rate = (
+                (self.count - self._CHECK_COUNT) / elapsed
+                if elapsed > 0 else 0.0
+            )
+            stride = max(
+                1,
+                min(int(rate * self._EVERY_SECONDS / 10), self._STRIDE * 2)
+            )
+            self._STRIDE = stride
+            self._CHECK_TIME = now
+            self._CHECK_COUNT = self.count
+        if self._NEXT_REPORT:
+            remaining = self._NEXT_REPORT - self.count
+            stride = min(stride, remaining) if stride else remaining
+        self._NEXT_CHECK = self.count + stride
+
+    def _watch(self):
+        """ Forces a check on the next iteration whenever a reporting
+        interval has elapsed since the last status message, until the
+        progress-tracker is closed.
+        """
+        while not self._STOP.wait(
+            timeout=max(
+                self._LAST_TIME + self._EVERY_SECONDS - time.perf_counter(),
+                self._EVERY_SECONDS / 10
+            )
+        ):
+            if time.perf_counter() - self._LAST_TIME >= self._EVERY_SECONDS:
+                self._NEXT_CHECK = 0
+
+    def _report(
+        self,
+        now: float
+    ):
+        """ Writes a throughput and ETA status message to the log-file.
+
+        Parameters
+        ----------
+        now : `float`
+            The current `time.perf_counter()` value.
+        """
+        elapsed = now - self._START
+        rate = (
+            (self.count - self._LAST_COUNT) / (now - self._LAST_TIME)
+            if now > self._LAST_TIME else 0.0
+        )
+
+        # Format the status message
+        if self.total:
+            eta = (
+                _format_seconds(seconds=(self.total - self.count) / rate)
+                if rate else '-N/A-'
+            )
+            status = '%s: %s / %s (%.1f%%) at %s/s, ETA %s.' % (
+                self.description,
+                '{:,}'.format(self.count),
+                '{:,}'.format(self.total),
+                100 * self.count / self.total,
+                '{:,.1f}'.format(rate),
+                eta
+            )
+        else:
+            status = '%s: %s after %s at %s/s.' % (
+                self.description,
+                '{:,}'.format(self.count),
+                _format_seconds(seconds=elapsed),
+                '{:,.1f}'.format(rate)
+            )
+
+        self._LOGGING.write(content=status, level='INFO')
+
+        # Retain the reporting window
+        self._LAST_TIME = now
+        self._LAST_COUNT = self.count
+
+
+class Registry():
+    """ A `class` that represents a SQLite run-registry.
+
+    Parameters
+    ----------
+    path : `str`
+        Directory path to the folder that contains the `file_name` of the
+            SQLite database.
+    file_name : `str`
+        File name of the SQLite database.
+    batch_size : `int`
+        The number of buffered runs that triggers a write to the database.
+    max_delay : `float`
+        The maximum number of seconds that a run is buffered before it is
+            written to the database by a background timer, re-tried every
+            `max_delay` seconds while the database is locked.
+    timeout : `float`
+        The maximum number of seconds to wait for a locked database before
+            deferring the write.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        file_name: str = 'runs.db',
+        batch_size: int = 32,
+        max_delay: float = 5.0,
+        timeout: float = 0.1
+    ):
+        """ Initializes an instance of the run-registry class.
+
+        Parameters
+        ----------
+        path : `str`
+            Directory path to the folder that contains the `file_name` of the
+                SQLite database.
+        file_name : `str`
+            File name of the SQLite database.
+        batch_size : `int`
+            The number of buffered runs that triggers a write to the
+                database.
+        max_delay : `float`
+            The maximum number of seconds that a run is buffered before it
+                is written to the database by a background timer, re-tried
+                every `max_delay` seconds while the database is locked.
+        timeout : `float`
+            The maximum number of seconds to wait for a locked database
+                before deferring the write.
+        """
+
+        # Assign class variables
+        self.path = path
+        self.file_name = file_name
+
+        # Assign private class variables
+        self._BATCH_SIZE = batch_size
+        self._MAX_DELAY = max_delay
+        self._TIMEOUT = timeout
+        self._BUFFER = []
+        self._BUFFER_TIME = None
+        self._TIMER = None
+        self._LOCK = threading.Lock()
+
+        # Validate the file-path
+        if not os.path.isdir(path):
+            raise OSError('{%s} does not exist.' % (path))
+
+        # Create the schema
+        with self._connect(timeout=max(timeout, 5.0)) as connection:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                '''
+                CREATE TABLE IF NOT EXISTS runs (
+                    log_path TEXT NOT NULL,
+                    metadata TEXT,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT,
+                    run_time REAL,
+                    critical INTEGER,
+                    error INTEGER,
+                    warning INTEGER,
+                    info INTEGER,
+                    debug INTEGER,
+                    exception TEXT,
+                    status TEXT,
+                    UNIQUE (log_path, start_time)
+                )
+                '''
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS runs_start_time'
+                ' ON runs (start_time)'
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS runs_status'
+                ' ON runs (status, start_time)'
+            )
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS runs_run_time ON runs (run_time)'
+            )
+        connection.close()
+
+        # Write all buffered runs on exit
+        atexit.register(self._flush_on_exit)
+
+    def record(
+        self,
+        log_path: str,
+        metadata: dict,
+        start_time: dt.datetime,
+        end_time: dt.datetime,
+        counts: dict,
+        exception: Union[str, None] = None
+    ):
+        """ Buffers the run-information of a job, writing all buffered runs
+        to the database once `batch_size` runs are buffered or, within a
+        background timer, once the oldest run has been buffered for
+        `max_delay` seconds. A run recorded again with the same `log_path`
+        and `start_time` replaces the prior run.
+
+        Parameters
+        ----------
+        log_path : `str`
+            File-path of the log-file of the job.
+        metadata : `dict`
+            Environment parameters of the job.
+        start_time : `dt.datetime`
+            The start time of the job.
+        end_time : `dt.datetime`
+            The end time of the job.
+        counts : `dict`
+            The number of messages by level.
+        exception : `str`
+            The name of the unhandled exception raised by the job, if any.
+        """
+        row = (
+            log_path,
+            json.dumps(metadata, default=str),
+            start_time.isoformat(sep=' '),
+            end_time.isoformat(sep=' '),
+            (end_time - start_time).total_seconds(),
+            *[counts.get(level, 0) for level in _REGISTRY_LEVELS],
+            exception,
+            'failed' if exception else 'succeeded'
+        )
+
+        with self._LOCK:
+            self._BUFFER.append(row)
+            if self._BUFFER_TIME is None:
+                self._BUFFER_TIME = time.monotonic()
+            flush = (
+                len(self._BUFFER) >= self._BATCH_SIZE
+                or time.monotonic() - self._BUFFER_TIME >= self._MAX_DELAY
+            )
+            if not flush:
+                self._schedule()
+
+        if flush:
+            self.flush()
+
+    def flush(
+        self,
+        timeout: Union[float, None] = None
+    ) -> bool:
+        """ Writes all buffered runs to the database in a single
+        transaction. Returns `False` and retains the buffered runs when the
+        database remains locked for longer than `timeout` seconds.
+
+        Parameters
+        ----------
+        timeout : `float`
+            The maximum number of seconds to wait for a locked database.
+                Defaults to the `timeout` of the run-registry.
+        """
+        with self._LOCK:
+            rows, self._BUFFER = self._BUFFER, []
+            self._BUFFER_TIME = None
+
+        if not rows:
+            return True
+
+        try:
+            with self._connect(
+                timeout=self._TIMEOUT if timeout is None else timeout
+            ) as connection:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO runs VALUES (%s)' % (
+                        ', '.join(['?'] * len(rows[0]))
+                    ),
+                    rows
+                )
+            connection.close()
+        except sqlite3.OperationalError:
+
+            # Retain the buffered runs for the next write
+            with self._LOCK:
+                self._BUFFER = rows + self._BUFFER
+                self._BUFFER_TIME = time.monotonic()
+                self._schedule()
+            return False
+
+        return True
+
+    def _schedule(self):
+        """ Starts a background timer that writes the buffered runs once the
+        oldest run has been buffered for `max_delay` seconds, unless a timer
+        is already running. Must be called while holding the lock.
+        """
+        if self._TIMER is not None or not self._BUFFER:
+            return None
+
+        self._TIMER = threading.Timer(
+            max(self._BUFFER_TIME + self._MAX_DELAY - time.monotonic(), 0),
+            self._flush_on_timer
+        )
+        self._TIMER.daemon = True
+        self._TIMER.start()
+
+    def _flush_on_timer(self):
+        """ Writes the buffered runs when the background timer elapses. """
+        with self._LOCK:
+            self._TIMER = None
+        self.flush()
+
+    def _flush_on_exit(self):
+        """ Writes the buffered runs on exit, waiting up to 5 seconds for a
+        locked database, and reports any runs that could not be written.
+        """
+        with self._LOCK:
+            if self._TIMER is not None:
+                self._TIMER.cancel()
+                self._TIMER = None
+
+        if not self.flush(timeout=max(self._TIMEOUT, 5.0)):
+            pytensils.warning(
+                '%s run(s) could not be written to {%s}.' % (
+                    len(self._BUFFER),
+                    os.path.join(self.path, self.file_name)
+                )
+            )
+
+    def query(
+        self,
+        sql: str = 'SELECT * FROM runs ORDER BY start_time',
+        parameters: tuple = ()
+    ) -> pd.DataFrame:
+        """ Writes all buffered runs and returns the result of `sql` as a
+        `pd.DataFrame`.
+
+        Parameters
+        ----------
+        sql : `str`
+            SQL query against the `runs` table.
+        parameters : `tuple`
+            Parameters of the SQL query.
+        """
+        self.flush()
+        connection = self._connect(timeout=max(self._TIMEOUT, 5.0))
+        try:
+            return pd.read_sql_query(sql, connection, params=parameters)
+        finally:
+            connection.close()
+
+    def _connect(
+        self,
+        timeout: float
+    ) -> sqlite3.Connection:
+        """ Returns a connection to the database.
+
+        Parameters
+        ----------
+        timeout : `float`
+            The maximum number of seconds to wait for a locked database.
+        """
+        return sqlite3.connect(
+            os.path.join(self.path, self.file_name),
+            timeout=timeout
+        )
+
+
+# Log-file function(s)
+def merge(
+    paths: list,
+    path: str,
+    file_name: str = 'merged.log',
+    tags: Union[list, None] = None
+) -> str:
+    """ Merges the log-files in `paths` into a single log-file, `file_name`
+    within `path`, ordering the blocks of all log-files by time and
+    tagging the header of each block with the tag of its log-file. Returns
+    the file-path of the merged log-file.
+
+    The log-files are streamed block-by-block through a heap-based k-way
+    merge, so only the first lines of the current block of each log-file
+    are held in memory.
+    Blocks are timed by the 'Start time' of the 'Run information' block and
+    the 'End time' of the 'Run time' block, with all other blocks inheriting
+    the time of the preceding block within the same log-file.
+
+    Parameters
+    ----------
+    paths : `list`
+        List of file-paths of the log-files to merge.
+    path : `str`
+        Directory path to the folder that will contain the merged log-file.
+    file_name : `str`
+        File name of the merged log-file.
+    tags : `list`
+        List of tags, one for each log-file in `paths`. Defaults to the
+            file names of the log-files without the extension.
+    """
+
+    # Validate the file-path
+    if not os.path.isdir(path):
+        raise OSError('{%s} does not exist.' % (path))
+
+    # Validate the log-files
+    for log_path in paths:
+        if not os.path.isfile(log_path):
+            raise FileNotFoundError('{%s} does not exist.' % (log_path))
+
+    # Validate the tags
+    if tags is None:
+        tags = [
+            os.path.splitext(os.path.basename(log_path))[0]
+            for log_path in paths
+        ]
+    elif len(tags) != len(paths):
+        raise ValueError(
+            'The number of tags {%s} does not match the number of'
+            ' log-files {%s}.' % (len(tags), len(paths))
+        )
+
+    # Merge
+    logs = [open(log_path, 'r') for log_path in paths]
+    try:
+        with open(os.path.join(path, file_name), 'w') as merged:
+            previous = None
+            for _, _, _, lines, body in heapq.merge(
+                *[
+                    _return_timed_blocks(log=log, tag=tag, index=index)
+                    for index, (log, tag) in enumerate(zip(logs, tags))
+                ]
+            ):
+
+                # Separate blocks that begin with a header without a divider
+                if (
+                    previous is not None
+                    and len(lines) > 1
+                    and _is_header(line=lines[0], underline=lines[1])
+                ):
+                    if _is_divider(line=previous):
+                        merged.write(''.join([' '*INDENT, '\n']))
+                    else:
+                        merged.write(
+                            ''.join([
+                                ' '*INDENT, '\n',
+                                ' '*INDENT,
+                                '-'*(LINE_LENGTH-INDENT-1), '\n',
+                                ' '*INDENT, '\n'
+                            ])
+                        )
+
+                # Collapse consecutive dividers
+                elif (
+                    previous is not None
+                    and _is_divider(line=previous)
+                    and len(lines) > 1
+                    and not lines[0].strip()
+                    and _is_divider(line=lines[1])
+                ):
+                    lines = lines[2:]
+
+                # Stream the block
+                merged.writelines(lines)
+                if lines:
+                    previous = lines[-1]
+                for line in body:
+                    merged.write(line)
+                    previous = line
+    finally:
+        for log in logs:
+            log.close()
+
+    return os.path.join(path, file_name)
+
+
+def summarize(
+    path: str,
+    extension: str = '.log',
+    max_workers: Union[int, None] = None
+) -> pd.DataFrame:
+    """ Returns a summary of all log-files within `path` as a
+    `pd.DataFrame`, with one row per log-file containing the start time,
+    end time and run time of the run, the number of critical, error and
+    warning messages, the unhandled exception, if any, and the metadata
+    from the 'Run information' block.
+
+    Only the 'Run information' block at the head and the 'Run time' block
+    at the tail of each log-file are parsed, while the messages are counted
+    by scanning the raw bytes. The log-files are summarized in parallel
+    within a process pool.
+
+    Parameters
+    ----------
+    path : `str`
+        Directory path to the folder that contains the log-files.
+    extension : `str`
+        File extension of the log-files.
+    max_workers : `int`
+        The maximum number of worker processes. Summarizes the log-files
+            within the current process when `1`.
+    """
+
+    # Validate the file-path
+    if not os.path.isdir(path):
+        raise OSError('{%s} does not exist.' % (path))
+
+    # Scan the directory
+    with os.scandir(path) as entries:
+        file_paths = sorted(
+            entry.path for entry in entries
+            if entry.name.endswith(extension) and entry.is_file()
+        )
+
+    # Summarize
+    if max_workers == 1 or len(file_paths) < 2:
+        summaries = [
+            _return_log_summary(file_path=file_path)
+            for file_path in file_paths
+        ]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            summaries = list(
+                executor.map(
+                    _return_log_summary,
+                    file_paths,
+                    chunksize=max(
+                        1,
+                        len(file_paths) // (
+                            (max_workers or os.cpu_count() or 1) * 4
+                        )
+                    )
+                )
+            )
+
+    return pd.DataFrame.from_records(
+        summaries,
+        columns=list(
+            dict.fromkeys(
+                [
+                    'File',
+                    'Start time',
+                    'End time',
+                    'Run time',
+                    'Critical',
+                    'Error',
+                    'Warning',
+                    'Exception'
+                ]
+                + [key for summary in summaries for key in summary.keys()]
+            )
+        )
+    )
+
+
 def _validate_level(level: str):
     """ Validates the `level` scope for logging.
 
@@ -704,6 +1636,32 @@ def _validate_level(level: str):
         )
 
 
+def _return_interchange_df(
+    df_object: Any
+) -> pd.DataFrame:
+    """ Returns an object that supports the DataFrame interchange protocol
+    as a `pd.DataFrame`, without copying the data when possible.
+
+    Parameters
+    ----------
+    df_object : `Any`
+        Object that implements `__dataframe__()`.
+    """
+    try:
+        from pandas.api.interchange import from_dataframe
+    except ImportError:
+        raise TypeError(
+            'Invalid content datatype {%s}. The DataFrame interchange'
+            ' protocol requires `pandas>=1.5.0`.' % (
+                type(df_object).__name__
+            )
+        )
+    try:
+        return from_dataframe(df_object, allow_copy=False)
+    except RuntimeError:
+        return from_dataframe(df_object, allow_copy=True)
+
+
 def _return_level_substring(level: str):
     """ Returns the substring corresponding to level.
 
@@ -742,3 +1700,312 @@ def _return_dictionary_depth(
         if i == "{":
             counter += 1
     return counter
+
+
+def _format_seconds(
+    seconds: float
+) -> str:
+    """ Returns a number of seconds formatted as 'hh:mm:ss'.
+
+    Parameters
+    ----------
+    seconds : `float`
+        Number of seconds to format.
+    """
+    return str(dt.timedelta(seconds=round(max(seconds, 0))))
+
+
+def _is_divider(
+    line: str
+) -> bool:
+    """ Returns `True` when `line` is a divider or an underline.
+
+    Parameters
+    ----------
+    line : `str`
+        Line of a log-file.
+    """
+    line = line.strip()
+    return bool(line) and not line.strip('-')
+
+
+def _is_header(
+    line: str,
+    underline: str
+) -> bool:
+    """ Returns `True` when `line` followed by `underline` is a header.
+
+    Parameters
+    ----------
+    line : `str`
+        Line of a log-file.
+    underline : `str`
+        The line of the log-file that follows `line`.
+    """
+    header = line.rstrip('\n')[INDENT:]
+    return (
+        line.startswith(' '*INDENT)
+        and bool(header.strip())
+        and not header.startswith(' ')
+        and not _is_divider(line=header)
+        and underline.rstrip('\n') == ''.join([' '*INDENT, '-'*len(header)])
+    )
+
+
+def _return_marked_lines(
+    log: Iterable
+) -> Iterator:
+    """ Yields the lines of a log-file as `(line, start)` tuples, where
+    `start` is `True` for the first line of each block. A block begins with
+    a header along with its preceding divider.
+
+    Parameters
+    ----------
+    log : `Iterable`
+        Open log-file, or any iterable of lines.
+    """
+    buffer = collections.deque()
+    length = 0
+    for line in log:
+        buffer.append([line, length == 0])
+        length += 1
+
+        # Split the block before a header and its preceding divider
+        if len(buffer) > 1 and _is_header(line=buffer[-2][0], underline=line):
+            split = len(buffer) - 2
+            offset = length - len(buffer)
+            if (
+                offset + split >= 3
+                and not buffer[split-1][0].strip()
+                and _is_divider(line=buffer[split-2][0])
+                and not buffer[split-3][0].strip()
+            ):
+                split -= 3
+            if offset + split:
+                buffer[split][1] = True
+                length = len(buffer) - split
+
+        # Retain only the lines that may precede a header
+        while len(buffer) > 4:
+            yield tuple(buffer.popleft())
+
+    while buffer:
+        yield tuple(buffer.popleft())
+
+
+def _return_blocks(
+    log: Iterable
+) -> Iterator:
+    """ Yields the blocks of a log-file as `(head, body)` tuples, where
+    `head` is a list of up to the first `_HEAD_SIZE` lines of the block and
+    `body` is an iterator of its remaining lines. Each block begins with a
+    header along with its preceding divider. The `body` of a block is
+    only valid until the next block is retrieved.
+
+    Parameters
+    ----------
+    log : `Iterable`
+        Open log-file, or any iterable of lines.
+    """
+    lines = _return_marked_lines(log=log)
+    pending = [next(lines, None)]
+
+    def body():
+        while pending[0] is not None and not pending[0][1]:
+            yield pending[0][0]
+            pending[0] = next(lines, None)
+
+    while pending[0] is not None:
+        head = [pending[0][0]]
+        pending[0] = next(lines, None)
+        while (
+            len(head) < _HEAD_SIZE
+            and pending[0] is not None
+            and not pending[0][1]
+        ):
+            head.append(pending[0][0])
+            pending[0] = next(lines, None)
+
+        remainder = body()
+        yield (head, remainder)
+
+        # Skip the unread lines of the block
+        for _ in remainder:
+            pass
+
+
+def _return_timed_blocks(
+    log: Iterable,
+    tag: str,
+    index: int
+) -> Iterator:
+    """ Yields the tagged blocks of a log-file as `(time, index, sequence,
+    head, body)` tuples in non-decreasing order of time, see
+    `_return_blocks()`. Blocks are timed by the first `_HEAD_SIZE` lines of
+    each block.
+
+    Parameters
+    ----------
+    log : `Iterable`
+        Open log-file, or any iterable of lines.
+    tag : `str`
+        The tag to prefix to the header of each block.
+    index : `int`
+        The index of the log-file, used to break ties between log-files.
+    """
+    timestamp = dt.datetime.min
+    start = None
+    for sequence, (lines, body) in enumerate(_return_blocks(log=log)):
+
+        # Retrieve the time of the block
+        for line in lines:
+            if 'time' not in line:
+                continue
+            match = _START_TIME_PATTERN.search(line.rstrip('\n'))
+            if match:
+                start = dt.datetime.strptime(
+                    match.group(1),
+                    '%Y-%m-%d %H:%M:%S'
+                )
+                timestamp = max(timestamp, start)
+                continue
+            match = _END_TIME_PATTERN.search(line.rstrip('\n'))
+            if match and start is not None:
+                timestamp = max(
+                    timestamp,
+                    _return_end_time(start=start, end=match.group(1))
+                )
+
+        # Tag the header of the block
+        for position in range(len(lines) - 1):
+            if _is_header(line=lines[position], underline=lines[position+1]):
+                header = ''.join([
+                    '[%s] ' % (tag),
+                    lines[position].rstrip('\n')[INDENT:]
+                ])
+                lines[position] = ''.join([' '*INDENT, header, '\n'])
+                lines[position+1] = ''.join(
+                    [' '*INDENT, '-'*len(header), '\n']
+                )
+                break
+
+        yield (timestamp, index, sequence, lines, body)
+
+
+def _return_end_time(
+    start: dt.datetime,
+    end: str
+) -> dt.datetime:
+    """ Returns the 'hh:mm:ss.ffffff' `end` time as the first date-time on
+    or after `start`.
+
+    Parameters
+    ----------
+    start : `dt.datetime`
+        The start date-time of the run.
+    end : `str`
+        The end time of the run.
+    """
+    end = dt.datetime.combine(
+        start.date(),
+        dt.datetime.strptime(end, '%H:%M:%S.%f').time()
+    )
+    if end < start:
+        end += dt.timedelta(days=1)
+    return end
+
+
+def _return_log_summary(
+    file_path: str
+) -> dict:
+    """ Returns the run information, run time and message counts of the
+    log-file, `file_path`, as a `dict`.
+
+    Parameters
+    ----------
+    file_path : `str`
+        File-path of the log-file.
+    """
+    summary = {
+        'File': file_path,
+        'Start time': None,
+        'End time': None,
+        'Run time': None,
+        'Critical': 0,
+        'Error': 0,
+        'Warning': 0,
+        'Exception': None
+    }
+    metadata_pattern = re.compile(
+        r'^ {%s}(\S.*?) {%s,}: (.*)$' % (2*INDENT, INDENT)
+    )
+
+    # Parse the 'Run information' block
+    with open(file_path, 'r') as log:
+        for index, line in enumerate(log):
+            line = line.rstrip('\n')
+            if index > 1 and _is_divider(line=line):
+                break
+            match = metadata_pattern.match(line)
+            if match:
+                if match.group(1) == 'Start time':
+                    try:
+                        summary['Start time'] = dt.datetime.strptime(
+                            match.group(2),
+                            '%Y-%m-%d %H:%M:%S'
+                        )
+                    except ValueError:
+                        pass
+                else:
+                    summary[match.group(1)] = match.group(2)
+
+    # Count the messages
+    patterns = {
+        level: ''.join([
+            '\n', '*'*(INDENT-1), ' ', level.upper(), ': '
+        ]).encode()
+        for level in ['Critical', 'Error', 'Warning']
+    }
+    tails = dict.fromkeys(patterns.keys(), b'')
+    with open(file_path, 'rb') as log:
+        while True:
+            chunk = log.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            for level, pattern in patterns.items():
+                buffer = b''.join([tails[level], chunk])
+                summary[level] += buffer.count(pattern)
+                tails[level] = buffer[-(len(pattern)-1):]
+
+        # Retrieve the tail of the log-file
+        log.seek(max(0, log.tell() - _TAIL_SIZE))
+        tail = log.read().decode(errors='replace').split('\n')
+
+    # Parse the last 'Run time' block
+    for index in range(len(tail) - 2, -1, -1):
+        if (
+            _is_header(line=tail[index], underline=tail[index+1])
+            and tail[index].strip() == 'Run time'
+        ):
+            for line in tail[index+2:]:
+                match = _END_TIME_PATTERN.search(line)
+                if match and summary['Start time'] is not None:
+                    summary['End time'] = _return_end_time(
+                        start=summary['Start time'],
+                        end=match.group(1)
+                    )
+                match = _RUN_TIME_PATTERN.search(line)
+                if match:
+                    summary['Run time'] = pd.to_timedelta(
+                        match.group(1).strip(),
+                        errors='coerce'
+                    )
+            break
+
+    # Parse the unhandled exception
+    for line in tail:
+        match = _EXCEPTION_PATTERN.search(line)
+        if match:
+            summary['Exception'] = match.group(1)
+
+    return summary
@@ -4,9 +4,31 @@ import os
 import ast
 import json
 import datetime
-from typing import Union
+from typing import Union, Any
 from typing_extensions import Literal
 
+# Optional JSON backend(s)
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+# Static variable(s)
+JSON_BACKEND = (
+    'orjson' if orjson else
+    'simdjson' if simdjson else
+    'ujson' if ujson else
+    'json'
+)
+
 
 # Directory management function(s)
 def generate_output_directory(
@@ -122,7 +144,7 @@ def as_type(
             or (return_dtype.strip().upper() == 'DICT')
         ):
             try:
-                return json.loads(value)
+                return json_loads(value)
             except json.decoder.JSONDecodeError:
                 raise TypeError(
                     ' '.join([
@@ -151,3 +173,121 @@ def as_type(
                 )
             ])
         )
+
+
+# JSON function(s)
+def json_loads(
+    value: Union[str, bytes]
+) -> Any:
+    """ Returns the JSON document, `value`, parsed by the `JSON_BACKEND`.
+
+    Documents that the `JSON_BACKEND` rejects are re-parsed by the standard
+    library `json` module, so that the accepted documents, e.g., `NaN` or
+    arbitrarily large integers, and the raised `json.JSONDecodeError` are
+    identical for all backends.
+
+    Parameters
+    ----------
+    value : Union[`str`, `bytes`]
+        JSON document to parse.
+    """
+    if JSON_BACKEND == 'orjson' and orjson:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    elif JSON_BACKEND == 'simdjson' and simdjson:
+        try:
+            return simdjson.loads(value)
+        except ValueError:
+            pass
+    elif JSON_BACKEND == 'ujson' and ujson:
+        try:
+            return ujson.loads(value)
+        except ValueError:
+            pass
+    elif JSON_BACKEND != 'json':
+        raise NameError('Invalid JSON backend {%s}.' % (JSON_BACKEND))
+
+    return json.loads(value)
+
+
+def json_dumps(
+    obj: Any,
+    indent: int = 4
+) -> str:
+    """ Returns `obj` serialized as a JSON document by the `JSON_BACKEND`,
+    byte-for-byte identical to `json.dumps(obj, indent=indent)`.
+
+    Only `orjson` is used for serialization, and only when the document
+    does not contain any value that `orjson` formats differently than the
+    standard library `json` module, e.g., non-ASCII strings or floats in
+    exponent notation.
+
+    Parameters
+    ----------
+    obj : `Any`
+        Object to serialize.
+    indent : `int`
+        The number of space-characters per level of indentation.
+    """
+    if (
+        JSON_BACKEND == 'orjson'
+        and orjson
+        and isinstance(indent, int)
+        and indent > 0
+        and _is_orjson_compatible(obj=obj)
+    ):
+        try:
+            document = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            document = None
+
+        # Fall back on non-ASCII and DEL characters, which `json` escapes
+        #   and `orjson` does not
+        if (
+            document is not None
+            and document.isascii()
+            and b'\x7f' not in document
+        ):
+
+            # Re-indent from 2 to `indent` space-characters per level, from
+            #   the deepest level up. Newlines and control-characters are
+            #   always escaped within JSON strings, so every newline is
+            #   followed by indentation.
+            depth = 1
+            while b''.join([b'\n', b'  '*(depth+1)]) in document:
+                depth += 1
+            for level in range(depth, 0, -1):
+                document = document.replace(
+                    b''.join([b'\n', b'  '*level]),
+                    b''.join([b'\n', b'\x01'*level])
+                )
+            return document.replace(b'\x01', b' '*indent).decode()
+
+    return json.dumps(obj, indent=indent)
+
+
+def _is_orjson_compatible(
+    obj: Any
+) -> bool:
+    """ Returns `True` when `orjson` formats every float within `obj`
+    identically to the standard library `json` module.
+
+    Parameters
+    ----------
+    obj : `Any`
+        Object to inspect.
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        dtype = type(value)
+        if dtype is dict:
+            stack.extend(value.values())
+        elif dtype is list or dtype is tuple:
+            stack.extend(value)
+        elif dtype is float:
+            if not (value == 0 or 1e-4 <= abs(value) < 1e16):
+                return False
+    return True
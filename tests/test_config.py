@@ -11,6 +11,7 @@ Tests methods within `pytensils.config`.
 
 import os
 import pytest
+import dataclasses
 from pytensils import config, logging, errors
 
 PATH = os.path.join(
@@ -337,3 +338,1397 @@ def test_write_success(tmp_path):
             "list": ["A", "B", "C"]
         }
     }
+
+
+def test_read_cache_success(tmp_path):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"config": {"int": 1}})
+
+    # Read
+    first = temp.read()
+    first['config']['int'] = 2
+    assert temp.read() == {"config": {"int": 1}}
+    assert os.path.join(tmp_path, 'config_temp.json') in config._CACHE
+
+    # Modify the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 10}}')
+
+    assert temp.read() == {"config": {"int": 10}}
+    assert temp.data == {"config": {"int": 10}}
+
+
+def test_read_cache_size_success(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'CACHE_SIZE', 1)
+    config.clear_cache()
+
+    # Read
+    _ = config.Handler(path=PATH, file_name='config.json')
+    _ = config.Handler(path=PATH, file_name='dtypes.json')
+
+    assert list(config._CACHE.keys()) == [
+        os.path.abspath(os.path.join(PATH, 'dtypes.json'))
+    ]
+
+    # Clear
+    config.clear_cache()
+
+    assert not config._CACHE
+
+
+def test_get_handler_success(tmp_path):
+    import gc
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+
+    # Share
+    first = config.get_handler(path=tmp_path, file_name='config_temp.json')
+    second = config.get_handler(
+        path=os.path.join(tmp_path, '.'),
+        file_name='config_temp.json'
+    )
+    assert first is second
+    assert first.data == {"config": {"int": 1}}
+
+    # Modify the config-file
+    changes = []
+    first.on_change(callback=changes.append)
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 10}}')
+
+    assert config.get_handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ) is first
+    assert second.data == {"config": {"int": 10}}
+    assert changes == [{"config": {"int": 10}}]
+
+    # Release
+    del first, second
+    gc.collect()
+    assert os.path.join(tmp_path, 'config_temp.json') not in config._HANDLERS
+
+
+def test_get_handler_concurrent_success(tmp_path, monkeypatch):
+    import threading
+
+    # Output content to the config-files
+    for file_name in ['a.json', 'b.json']:
+        with open(os.path.join(tmp_path, file_name), 'w') as file:
+            file.write('{"config": {"int": 1}}')
+
+    # Slow down the creation of the instance of 'a.json'
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowHandler(config.Handler):
+        def __init__(self, *args, **kwargs):
+            if kwargs.get('file_name') == 'a.json':
+                started.set()
+                release.wait(timeout=10)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(config, 'Handler', SlowHandler)
+
+    # Create the instances concurrently
+    shared = []
+    threads = [
+        threading.Thread(
+            target=lambda: shared.append(
+                config.get_handler(path=tmp_path, file_name='a.json')
+            )
+        )
+        for _ in range(2)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        assert started.wait(timeout=10)
+        other = threading.Thread(
+            target=config.get_handler,
+            kwargs={'path': tmp_path, 'file_name': 'b.json'}
+        )
+        other.start()
+        other.join(timeout=5)
+        assert not other.is_alive()
+    finally:
+        release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert len(shared) == 2
+    assert shared[0] is shared[1]
+
+
+def test_get_handler_filenotfounderror(tmp_path):
+    with pytest.raises(errors.config.FileNotFoundError):
+        config.get_handler(path=tmp_path, file_name='config_temp.json')
+    assert os.path.join(tmp_path, 'config_temp.json') not in config._HANDLERS
+
+
+def test_poll_success(tmp_path):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"a": {"int": 1}, "b": {"int": 1}})
+    temp.read()
+
+    # Register a callback
+    changes = []
+    temp.on_change(callback=changes.append)
+
+    # Poll
+    assert temp.poll() == {}
+
+    # Modify the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"a": {"int": 1}, "c": {"int": 3}}')
+
+    assert temp.poll(dtypes={"a": {"int": "int"}, "c": {"int": "int"}}) == {
+        "b": None,
+        "c": {"int": 3}
+    }
+    assert temp.data == {"a": {"int": 1}, "c": {"int": 3}}
+    assert changes == [{"b": None, "c": {"int": 3}}]
+
+
+def test_poll_invalid_success(tmp_path):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"a": {"int": 1}})
+    temp.read()
+
+    # Modify the config-file with an invalid dtype
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"a": {"int": "1"}}')
+
+    assert temp.poll(dtypes={"a": {"int": "int"}}) == {}
+    assert temp.data == {"a": {"int": 1}}
+
+    # Modify the config-file with invalid json
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"a": ')
+
+    assert temp.poll() == {}
+    assert temp.data == {"a": {"int": 1}}
+
+
+def test_poll_invalid_write_success(tmp_path):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"a": {"int": 1}})
+    temp.read()
+
+    # Modify the config-file with invalid json
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{not json')
+
+    assert temp.poll() == {}
+    assert temp.poll() == {}
+
+    # Write the last valid config data
+    temp.write()
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"a": {"int": 1}}
+
+
+def test_watch_success(tmp_path):
+    import threading
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"a": {"int": 1}})
+    temp.read()
+
+    # Register a callback
+    event = threading.Event()
+    temp.on_change(callback=lambda changed: event.set())
+
+    # Watch
+    temp.watch(interval=0.01, max_interval=0.05)
+    with pytest.raises(RuntimeError):
+        temp.watch()
+
+    # Modify the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"a": {"int": 10}}')
+
+    try:
+        assert event.wait(timeout=5)
+        assert temp.data == {"a": {"int": 10}}
+    finally:
+        temp.unwatch()
+
+
+def test_aread_success(tmp_path, monkeypatch):
+    import time
+    import asyncio
+    from pytensils import utils
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    first = config.Handler(path=tmp_path, file_name='config_temp.json')
+    second = config.Handler(path=tmp_path, file_name='config_temp.json')
+    config.clear_cache()
+
+    # Count the loads
+    loads = []
+    json_loads = utils.json_loads
+
+    def counted(document):
+        loads.append(document)
+        time.sleep(0.05)
+        return json_loads(document)
+
+    monkeypatch.setattr(utils, 'json_loads', counted)
+
+    async def main():
+        return await asyncio.gather(
+            first.aread(),
+            second.aread(),
+            first.aread()
+        )
+
+    assert asyncio.run(main()) == [{"config": {"int": 1}}] * 3
+    assert len(loads) == 1
+    assert second.data == {"config": {"int": 1}}
+    assert config._READS == {}
+
+
+def test_aread_typeerror(tmp_path):
+    import asyncio
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    temp = config.Handler(path=tmp_path, file_name='config_temp.json')
+
+    # Output invalid json to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": ')
+
+    async def main():
+        return await asyncio.gather(
+            temp.aread(),
+            temp.aread(),
+            return_exceptions=True
+        )
+
+    assert [
+        type(result) for result in asyncio.run(main())
+    ] == [errors.config.TypeError] * 2
+
+
+def test_awrite_success(tmp_path, monkeypatch):
+    import time
+    import asyncio
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    handlers = [
+        config.Handler(path=tmp_path, file_name='config_temp.json')
+        for _ in range(4)
+    ]
+
+    # Track the concurrent writes
+    active = []
+    concurrent = []
+    write_atomic = config._write_atomic
+
+    def tracked(**kwargs):
+        active.append(None)
+        concurrent.append(len(active))
+        time.sleep(0.01)
+        try:
+            return write_atomic(**kwargs)
+        finally:
+            active.pop()
+
+    monkeypatch.setattr(config, '_write_atomic', tracked)
+
+    async def main():
+        for i, handler in enumerate(handlers[1:]):
+            handler.data['config']['int'] = i + 2
+        await asyncio.gather(
+            handlers[0].afrom_dict(
+                dict_object={"config": {"int": 10}},
+                dtypes={"config": {"int": "int"}}
+            ),
+            *[handler.awrite() for handler in handlers[1:]]
+        )
+
+    asyncio.run(main())
+    assert max(concurrent) == 1
+    assert len(concurrent) == 4
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data['config']['int'] in [2, 3, 4, 10]
+
+
+def test_awatch_success(tmp_path):
+    import asyncio
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"a": {"int": 1}}')
+    temp = config.Handler(path=tmp_path, file_name='config_temp.json')
+
+    async def main():
+        watcher = temp.awatch(interval=0.01, max_interval=0.05)
+        try:
+
+            # Modify the config-file
+            with open(
+                os.path.join(tmp_path, 'config_temp.json'), 'w'
+            ) as file:
+                file.write('{"a": {"int": 10}}')
+
+            return await asyncio.wait_for(watcher.__anext__(), timeout=5)
+        finally:
+            await watcher.aclose()
+
+    assert asyncio.run(main()) == {"a": {"int": 10}}
+    assert temp.data == {"a": {"int": 10}}
+
+
+def test_view_success(CONFIG_FIXTURE: config.Handler):
+    view = CONFIG_FIXTURE.view()
+
+    assert view == CONFIG_FIXTURE.data
+    assert view['config']['list'] == ['A', 'B', 'C']
+    assert view['config']['list'][1:] == ('B', 'C')
+    assert list(view['config']['list']) == ['A', 'B', 'C']
+    assert view['config']._DATA is CONFIG_FIXTURE.data['config']
+    assert isinstance(view['config'], config.ReadOnlyDict)
+    assert isinstance(view['config']['list'], config.ReadOnlyList)
+    assert view.to_dict() == CONFIG_FIXTURE.data
+    assert view['config']['list'].to_list() == ['A', 'B', 'C']
+
+
+def test_view_typeerror(CONFIG_FIXTURE: config.Handler):
+    view = CONFIG_FIXTURE.view()
+
+    with pytest.raises(TypeError):
+        view['config']['str'] = 'DEF'
+    with pytest.raises(TypeError):
+        view['config']['list'][0] = 'Z'
+    with pytest.raises(AttributeError):
+        view['config']['list'].append('D')
+
+
+def test_validate_dtypes_unchanged(
+    CONFIG_VALIDATION_ERROR_FIXTURE: config.Handler,
+    DTYPES_FIXTURE: config.Handler
+):
+    dtypes = DTYPES_FIXTURE.to_dict()
+    with pytest.raises(errors.config.ValidationError):
+        CONFIG_VALIDATION_ERROR_FIXTURE.validate(dtypes=dtypes)
+    assert dtypes == DTYPES_FIXTURE.data
+
+
+def test_schema_success(
+    CONFIG_FIXTURE: config.Handler,
+    CONFIG_VALIDATION_ERROR_FIXTURE: config.Handler,
+    DTYPES_FIXTURE: config.Handler
+):
+    schema = config.Schema(dtypes=DTYPES_FIXTURE)
+
+    assert schema.validate(dict_object=CONFIG_FIXTURE) is None
+    assert CONFIG_FIXTURE.validate(dtypes=schema)
+    assert schema.validate(
+        dict_object=CONFIG_VALIDATION_ERROR_FIXTURE.data
+    ) == {
+        "config": {
+            "str": "Invalid dtype {bool}. Expected {str}.",
+            "bool": "Invalid dtype {int}. Expected {bool}.",
+            "int": "Invalid dtype {float}. Expected {int}.",
+            "float": "Invalid dtype {list}. Expected {float}.",
+            "list": "Invalid dtype {dict}. Expected {list}.",
+            "dict": "Invalid dtype {str}. Expected {dict}.",
+            "unknown": "No dtype found in {dtypes}."
+        },
+        "not-in-dtypes": {
+            "-N/A-": "No corresponding section found in {dtypes}."
+        }
+    }
+
+
+def test_schema_validationerror(
+    CONFIG_VALIDATION_ERROR_FIXTURE: config.Handler,
+    DTYPES_FIXTURE: config.Handler
+):
+    schema = config.Schema(dtypes=DTYPES_FIXTURE.to_dict())
+
+    with pytest.raises(errors.config.ValidationError):
+        CONFIG_VALIDATION_ERROR_FIXTURE.validate(dtypes=schema)
+    with pytest.raises(errors.config.ValidationError):
+        config.Schema(dtypes=['A', 'B', 'C'])
+    with pytest.raises(errors.config.ValidationError):
+        config.Schema(dtypes={})
+    with pytest.raises(errors.config.ValidationError):
+        config.Schema(dtypes={'A': 'str'})
+
+
+@pytest.mark.parametrize('processes', [False, True])
+def test_validate_files_success(
+    tmp_path,
+    DTYPES_FIXTURE: config.Handler,
+    processes: bool
+):
+
+    # Output content to the config-files
+    with open(os.path.join(tmp_path, 'a.json'), 'w') as file:
+        file.write('{"config": {"str": "ABC", "int": 1}}')
+    with open(os.path.join(tmp_path, 'b.json'), 'w') as file:
+        file.write('{"config": {"str": 1, "int": "ABC"}}')
+    with open(os.path.join(tmp_path, 'c.json'), 'w') as file:
+        file.write('{"config": ')
+    with open(os.path.join(tmp_path, 'd.json'), 'w') as file:
+        file.write('{"config": "ABC"}')
+
+    # Validate
+    df = config.validate_files(
+        path=tmp_path,
+        dtypes=DTYPES_FIXTURE,
+        max_workers=2,
+        processes=processes
+    )
+
+    assert list(df['File']) == [
+        os.path.join(tmp_path, file_name)
+        for file_name in ['a.json', 'b.json', 'c.json', 'd.json']
+    ]
+    assert list(df['Status']) == [
+        'ok',
+        'dtype error',
+        'parse error',
+        'structure error'
+    ]
+    assert list(df['Errors']) == [0, 2, 1, 1]
+    assert df['Error'][1] == {
+        "config": {
+            "str": "Invalid dtype {int}. Expected {str}.",
+            "int": "Invalid dtype {str}. Expected {int}."
+        }
+    }
+
+
+def test_validate_files_dataclass_success(tmp_path):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'a.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+
+    # Validate with a schema that generated a dataclass
+    schema = config.Schema(dtypes={"config": {"int": "int"}})
+    schema.make_dataclass(name='Config')
+    df = config.validate_files(
+        path=tmp_path,
+        dtypes=schema,
+        max_workers=1,
+        processes=True
+    )
+
+    assert list(df['Status']) == ['ok']
+
+
+def test_validate_files_read_error_success(
+    tmp_path,
+    DTYPES_FIXTURE: config.Handler
+):
+
+    # Output content to the config-files
+    with open(os.path.join(tmp_path, 'a.json'), 'w') as file:
+        file.write('{"config": {"str": "ABC", "int": 1}}')
+    with open(os.path.join(tmp_path, 'b.json'), 'wb') as file:
+        file.write(b'{"config": {"str": "\xff", "int": 1}}')
+
+    # Validate
+    df = config.validate_files(path=tmp_path, dtypes=DTYPES_FIXTURE)
+
+    assert list(df['Status']) == ['ok', 'parse error']
+    assert list(df['Errors']) == [0, 1]
+
+    # Validate a config-file deleted after it was retrieved
+    report = config._validate_file(
+        file_path=os.path.join(tmp_path, 'c.json'),
+        schema=config.Schema(dtypes=DTYPES_FIXTURE)
+    )
+
+    assert report['Status'] == 'read error'
+    assert report['Errors'] == 1
+
+
+def test_write_atomic_success(tmp_path):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"config": {"int": 1}})
+    os.chmod(os.path.join(tmp_path, 'config_temp.json'), 0o640)
+
+    # Write
+    temp.data['config']['int'] = 2
+    temp.write(fsync=True)
+
+    assert os.listdir(tmp_path) == ['config_temp.json']
+    assert oct(
+        os.stat(os.path.join(tmp_path, 'config_temp.json')).st_mode & 0o777
+    ) == oct(0o640)
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"config": {"int": 2}}
+
+
+def test_write_atomic_umask_success(tmp_path):
+
+    # Set the umask after import
+    umask = os.umask(0o077)
+    try:
+        temp = config.Handler(
+            path=tmp_path,
+            file_name='config_temp.json',
+            create=True
+        )
+        temp.from_dict(dict_object={"config": {"int": 1}})
+    finally:
+        os.umask(umask)
+
+    assert oct(
+        os.stat(os.path.join(tmp_path, 'config_temp.json')).st_mode & 0o777
+    ) == oct(0o600)
+    assert os.listdir(tmp_path) == ['config_temp.json']
+
+
+def test_write_unchanged_success(tmp_path):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"config": {"int": 1}})
+    inode = os.stat(os.path.join(tmp_path, 'config_temp.json')).st_ino
+
+    # Write the same content
+    temp.from_dict(dict_object={"config": {"int": 1}})
+    assert os.stat(
+        os.path.join(tmp_path, 'config_temp.json')
+    ).st_ino == inode
+
+    # Write the same content after the config-file changed
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 10}}')
+    temp.from_dict(dict_object={"config": {"int": 1}})
+
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"config": {"int": 1}}
+
+
+def test_read_sidecar_success(tmp_path, monkeypatch):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+
+    # Read and build the sidecar-file
+    config.clear_cache()
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    )
+    assert temp.data == {"config": {"int": 1}}
+    assert os.path.isfile(os.path.join(tmp_path, '.config_temp.json.cache'))
+
+    # Read from the fresh sidecar-file without parsing
+    config.clear_cache()
+    monkeypatch.setattr(config.utils, 'json_loads', None)
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    ).data == {"config": {"int": 1}}
+
+    # Read from the sidecar-file after the config-file was touched
+    config.clear_cache()
+    os.utime(os.path.join(tmp_path, 'config_temp.json'), ns=(0, 0))
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    ).data == {"config": {"int": 1}}
+    monkeypatch.undo()
+
+    # Rebuild the stale sidecar-file
+    config.clear_cache()
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 2}}')
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    ).data == {"config": {"int": 2}}
+
+    config.clear_cache()
+    monkeypatch.setattr(config.utils, 'json_loads', None)
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    ).data == {"config": {"int": 2}}
+
+
+def test_read_sidecar_version_success(tmp_path, monkeypatch):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    config.clear_cache()
+    config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    )
+
+    # Ignore a sidecar-file written by another version
+    config.clear_cache()
+    monkeypatch.setattr(config, '_SIDECAR_VERSION', ('0.0.0', '', 0))
+    assert config._return_sidecar(
+        file_path=os.path.join(tmp_path, 'config_temp.json'),
+        stat_key=config._return_stat_key(
+            file_path=os.path.join(tmp_path, 'config_temp.json')
+        )
+    ) is None
+
+    # Ignore a corrupt sidecar-file
+    with open(os.path.join(tmp_path, '.config_temp.json.cache'), 'wb') as file:
+        file.write(b'\x00')
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        sidecar=True
+    ).data == {"config": {"int": 1}}
+
+
+def test_read_lazy_success(tmp_path):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write(
+            '{"config": {"str": "{\\"}", "list": [1, {"int": 2}]},'
+            ' "other": {"bool": true}, "scalar": 1}'
+        )
+
+    # Read lazily
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        lazy=True
+    )
+    assert isinstance(temp.data, config.LazyDict)
+    assert list(temp.data) == ['config', 'other', 'scalar']
+    assert not temp.data.is_loaded('config')
+
+    # Access a section
+    assert temp.data['config'] == {"str": '{"}', "list": [1, {"int": 2}]}
+    assert temp.data.is_loaded('config')
+    assert not temp.data.is_loaded('other')
+    assert temp.data['scalar'] == 1
+
+    # Write
+    temp.data['other']['bool'] = False
+    temp.write()
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {
+        "config": {"str": '{"}', "list": [1, {"int": 2}]},
+        "other": {"bool": False},
+        "scalar": 1
+    }
+    assert temp.to_dict() == config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        lazy=True
+    ).data
+
+
+def test_read_lazy_cache_success(tmp_path, monkeypatch):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1, "list": [[1], {}]}}')
+
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        lazy=True
+    )
+
+    # Count the indexing
+    indexes = []
+    return_section_index = config._return_section_index
+
+    def counted(document):
+        indexes.append(document)
+        return return_section_index(document=document)
+
+    monkeypatch.setattr(config, '_return_section_index', counted)
+
+    # Re-read the unchanged config-file
+    data = temp.read()
+    assert isinstance(data, config.LazyDict)
+    assert data is not temp.data
+    data['config']['int'] = 2
+    assert temp.data['config'] == {"int": 1, "list": [[1], {}]}
+    assert indexes == []
+
+    # Re-read the modified config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 10, "list": [[1], {}]}}')
+
+    assert temp.read()['config']['int'] == 10
+    assert len(indexes) == 1
+
+
+def test_read_lazy_typeerror(tmp_path):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}, "other": {"int": 1,}}')
+
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        lazy=True
+    )
+    assert temp.data['config'] == {"int": 1}
+    with pytest.raises(config.errors.config.TypeError):
+        temp.data['other']
+
+    # Read in full when the config-file cannot be indexed
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1},}')
+    with pytest.raises(config.errors.config.TypeError):
+        config.Handler(
+            path=tmp_path,
+            file_name='config_temp.json',
+            lazy=True
+        )
+
+
+def test_convert_dtype_errors_to_df_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    df = temp._convert_dtype_errors_to_df(
+        dict_object={
+            "config": {"int": "Invalid dtype {str}. Expected {int}."},
+            "valid": {},
+            "other": {
+                "-N/A-": "No corresponding section found in {dtypes}.",
+                "str": "No dtype found in {dtypes}."
+            }
+        }
+    )
+
+    assert list(df.columns) == ['Section', 'Key', 'Error']
+    assert df.values.tolist() == [
+        ["config", "int", "Invalid dtype {str}. Expected {int}."],
+        ["other", "-N/A-", "No corresponding section found in {dtypes}."],
+        ["other", "str", "No dtype found in {dtypes}."]
+    ]
+
+
+def test_layered_success(tmp_path):
+
+    # Output content to the config-files
+    for file_name, content in [
+        ('base.json', '{"config": {"int": 1, "str": "A"}, "db": {"port": 1}}'),
+        ('env.json', '{"config": {"int": 2}, "db": {"host": "h"}}'),
+        ('job.json', '{"config": {"str": "B"}}')
+    ]:
+        with open(os.path.join(tmp_path, file_name), 'w') as file:
+            file.write(content)
+
+    base, env, job = [
+        config.Handler(path=tmp_path, file_name=file_name)
+        for file_name in ['base.json', 'env.json', 'job.json']
+    ]
+    layered = config.LayeredHandler(layers=[base, env, job])
+
+    assert layered.data == {
+        "config": {"int": 2, "str": "B"},
+        "db": {"port": 1, "host": "h"}
+    }
+    assert base.data == {"config": {"int": 1, "str": "A"}, "db": {"port": 1}}
+    assert layered.origin('config', 'int') is env
+    assert layered.origin('config', 'str') is job
+    assert layered.origin('db', 'port') is base
+    with pytest.raises(KeyError):
+        layered.origin('db', 'user')
+
+    # Re-merge from the first changed layer
+    merges = list(layered._MERGES)
+    assert layered.read() is layered.data
+    assert layered._MERGES == merges
+
+    with open(os.path.join(tmp_path, 'env.json'), 'w') as file:
+        file.write('{"config": {"int": 3}, "db": {"port": {"int": 5}}}')
+    layered.read()
+
+    assert layered._MERGES[0] is merges[0]
+    assert layered.data == {
+        "config": {"int": 3, "str": "B"},
+        "db": {"port": {"int": 5}}
+    }
+    assert layered.origin('db', 'port', 'int') is env
+
+
+def test_override_from_env_success(tmp_path, monkeypatch):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1, "list": ["A"], "str": "A"}}')
+
+    monkeypatch.setenv('APP__CONFIG__INT', '2')
+    monkeypatch.setenv('APP__Config__List', '["B", "C"]')
+    monkeypatch.setenv('OTHER__CONFIG__INT', '3')
+
+    temp = config.Handler(path=tmp_path, file_name='config_temp.json')
+    assert temp.override_from_env(prefix='app') == {
+        "config": {"int": 2, "list": ["B", "C"]}
+    }
+    assert temp.data == {"config": {"int": 2, "list": ["B", "C"], "str": "A"}}
+
+    # Re-apply the compiled overrides on read without re-parsing
+    monkeypatch.setenv('APP__CONFIG__INT', '4')
+    assert temp.read()['config']['int'] == 2
+    assert temp.data['config']['int'] == 2
+
+    # Convert to the dtypes of the schema
+    monkeypatch.delenv('APP__Config__List')
+    temp.override_from_env(
+        prefix='APP',
+        dtypes={"config": {"int": "float", "list": "list", "str": "str"}}
+    )
+    assert temp.data['config']['int'] == 4.0
+
+
+def test_override_from_env_write_success(tmp_path, monkeypatch):
+
+    # Output content to the config-file
+    temp = config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json',
+        create=True
+    )
+    temp.from_dict(dict_object={"config": {"int": 1, "str": "A"}})
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'r') as file:
+        document = file.read()
+
+    monkeypatch.setenv('APP__CONFIG__INT', '2')
+    monkeypatch.setenv('APP__CONFIG__FLOAT', '1.5')
+    temp.override_from_env(
+        prefix='APP',
+        dtypes={"config": {"float": "float", "int": "int", "str": "str"}}
+    )
+    temp.write()
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'r') as file:
+        assert file.read() == document
+
+    # Retain the overrides across updates of the config data
+    temp.from_dict(dict_object={"config": {"int": 3, "str": "B"}})
+    assert temp.data == {"config": {"int": 2, "float": 1.5, "str": "B"}}
+    monkeypatch.delenv('APP__CONFIG__INT')
+    monkeypatch.delenv('APP__CONFIG__FLOAT')
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"config": {"int": 3, "str": "B"}}
+
+    # Write changed values
+    temp.data['config']['int'] = 4
+    temp.write()
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"config": {"int": 4, "str": "B"}}
+
+
+@pytest.mark.parametrize('dtype, value, expected', [
+    ('int | None', '5', 5),
+    ('Optional[int]', '5', 5),
+    ('int | None', 'None', None),
+    ('str | int', '5', '5'),
+    ('list[int]', '[1, 2]', [1, 2]),
+    ('dict[str, float]', '{"a": 1.5}', {"a": 1.5})
+])
+def test_override_from_env_generic_success(
+    tmp_path,
+    monkeypatch,
+    dtype: str,
+    value: str,
+    expected
+):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(dict_object={"db": {"port": None}})
+
+    monkeypatch.setenv('APP__DB__PORT', value)
+    assert temp.override_from_env(
+        prefix='APP',
+        dtypes={"db": {"port": dtype}}
+    ) == {"db": {"port": expected}}
+
+
+@pytest.mark.parametrize('dtype, value', [
+    ('int | None', 'A'),
+    ('list[int]', '[1, "A"]'),
+    ('bool', '5')
+])
+def test_override_from_env_generic_validationerror(
+    tmp_path,
+    monkeypatch,
+    dtype: str,
+    value: str
+):
+    import re
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(dict_object={"db": {"port": None}})
+
+    monkeypatch.setenv('APP__DB__PORT', value)
+    with pytest.raises(
+        config.errors.config.ValidationError,
+        match=re.escape('Expected {%s}' % (dtype))
+    ):
+        temp.override_from_env(prefix='APP', dtypes={"db": {"port": dtype}})
+
+
+def test_override_from_env_validationerror(tmp_path, monkeypatch):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    temp = config.Handler(path=tmp_path, file_name='config_temp.json')
+
+    monkeypatch.setenv('APP__CONFIG__INT', 'A')
+    with pytest.raises(config.errors.config.ValidationError):
+        temp.override_from_env(prefix='APP')
+
+    monkeypatch.setenv('APP__CONFIG__INT', '1')
+    monkeypatch.setenv('APP__CONFIG__MISSING', '1')
+    with pytest.raises(config.errors.config.ValidationError):
+        temp.override_from_env(prefix='APP')
+
+
+def test_publish_success(tmp_path):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}, "other": {"list": [1, 2]}}')
+    temp = config.Handler(path=tmp_path, file_name='config_temp.json')
+
+    # Publish and attach
+    name = temp.publish()
+    shared = config.SharedHandler(name=name)
+    assert shared.version == 1
+    assert shared.data['config'] == {"int": 1}
+    assert not shared.data.is_loaded('other')
+    assert shared.to_dict() == temp.data
+
+    # Notice a new version
+    assert shared.read() is shared.data
+    temp.data['config']['int'] = 2
+    assert temp.publish() == name
+    assert shared.read()['config'] == {"int": 2}
+    assert shared.version == 2
+    shared.close()
+
+    # Unpublish
+    temp.unpublish()
+    with pytest.raises(config.errors.config.FileNotFoundError):
+        config.SharedHandler(name=name)
+
+
+def test_diff_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(
+        dict_object={
+            "config": {"int": 1, "float": 1.0, "list": [1]},
+            "old": {"a/b": 1}
+        }
+    )
+    other = {
+        "config": {"int": 1, "float": 1, "list": [1, 2], "str": "A"},
+        "new": {"bool": True}
+    }
+
+    operations = temp.diff(other=other)
+    assert operations == [
+        {"op": "remove", "path": "/old"},
+        {"op": "replace", "path": "/config/float", "value": 1},
+        {"op": "replace", "path": "/config/list", "value": [1, 2]},
+        {"op": "add", "path": "/config/str", "value": "A"},
+        {"op": "add", "path": "/new", "value": {"bool": True}}
+    ]
+
+    # Apply the diff
+    temp.apply_patch(operations=operations)
+    assert temp.diff(other=other) == []
+    assert config.Handler(path=tmp_path).data == other
+
+
+def test_apply_patch_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(
+        dict_object={
+            "config": {"int": 1, "list": ["A", "B"], "str": "A"},
+            "other": {"str": "A"}
+        }
+    )
+    other = temp.data['other']
+
+    temp.apply_patch(
+        operations=[
+            {"op": "test", "path": "/config/int", "value": 1},
+            {"op": "replace", "path": "/config/int", "value": 2},
+            {"op": "add", "path": "/config/list/-", "value": "C"},
+            {"op": "remove", "path": "/config/list/0"},
+            {"op": "copy", "from": "/config/str", "path": "/config/copy"},
+            {"op": "move", "from": "/config/str", "path": "/config/moved"}
+        ],
+        dtypes={
+            "config": {
+                "int": "int",
+                "list": "list",
+                "copy": "str",
+                "moved": "str"
+            }
+        }
+    )
+
+    assert temp.data == {
+        "config": {"int": 2, "list": ["B", "C"], "copy": "A", "moved": "A"},
+        "other": {"str": "A"}
+    }
+    assert temp.data['other'] is other
+    assert config.Handler(path=tmp_path).data == temp.data
+
+
+def test_apply_patch_validationerror(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(dict_object={"config": {"int": 1, "str": "A"}})
+
+    # Invalid operations
+    for operation in [
+        {"op": "test", "path": "/config/int", "value": 2},
+        {"op": "remove", "path": "/config/missing"},
+        {"op": "replace", "path": "/missing/int", "value": 2},
+        {"op": "add", "path": "config", "value": 2},
+        {"op": "move", "from": "/config", "path": "/config/child"},
+        {"op": "invalid", "path": "/config/int"}
+    ]:
+        with pytest.raises(config.errors.config.ValidationError):
+            temp.apply_patch(operations=[operation])
+
+    # Invalid dtypes of the changed configuration values
+    with pytest.raises(config.errors.config.ValidationError):
+        temp.apply_patch(
+            operations=[
+                {"op": "replace", "path": "/config/int", "value": "2"}
+            ],
+            dtypes={"config": {"int": "int"}}
+        )
+    assert temp.validation_errors == {
+        "config": {"int": "Invalid dtype {str}. Expected {int}."}
+    }
+    assert temp.data == {"config": {"int": 1, "str": "A"}}
+
+
+def test_get_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(
+        dict_object={
+            "config": {"int": "1", "list": ["A", {"float": 1}], "none": None}
+        }
+    )
+
+    assert temp.get('config.int') == "1"
+    assert temp.get('config.int', dtype='int') == 1
+    assert temp.get(('config', 'list', 1, 'float'), dtype='float') == 1.0
+    assert temp.get('config.list.0') == "A"
+    assert temp.get('config.none', dtype='none') is None
+    assert temp.get('config.missing', default=2) == 2
+    assert temp.get('config.list.5.int', default=None) is None
+    with pytest.raises(KeyError):
+        temp.get('config.missing')
+    with pytest.raises(config.errors.config.TypeError):
+        temp.get('config.list.0', dtype='int')
+
+
+def test_accessor_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(dict_object={"config": {"int": "1", "list": "[1, 2]"}})
+
+    getter = temp.accessor('config.list', dtype='list')
+    assert getter() == [1, 2]
+    assert getter() is getter()
+
+    # Clear the cached config values when changed or re-loaded
+    temp.data['config']['list'] = "[3]"
+    assert getter() == [3]
+
+    with open(os.path.join(tmp_path, 'config.json'), 'w') as file:
+        file.write('{"config": {"int": "2", "list": "[4]"}}')
+    temp.read()
+    assert getter() == [4]
+    assert temp.accessor('config.int', dtype='int')() == 2
+
+
+def test_to_dataclass_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(
+        dict_object={
+            "config": {"int": 1, "list": ["A"]},
+            "db_settings": {"host": "localhost"}
+        }
+    )
+    schema = config.Schema(
+        dtypes={
+            "config": {"int": "int", "list": "list"},
+            "db_settings": {"host": "str"}
+        }
+    )
+
+    bound = temp.to_dataclass(dtypes=schema)
+    assert bound.config.int == 1
+    assert bound.config.list == ["A"]
+    assert bound.db_settings.host == "localhost"
+    assert type(bound.db_settings).__name__ == 'DbSettings'
+    assert type(bound) is schema.make_dataclass()
+    assert not hasattr(bound.config, '__dict__')
+
+    # Immutable
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        bound.config.int = 2
+    with pytest.raises(TypeError):
+        bound.config.list[0] = "B"
+
+
+def test_to_dataclass_dict_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(dict_object={"config": {"int": 1}})
+
+    # Bind twice with equal dtypes
+    first = temp.to_dataclass(dtypes={"config": {"int": "int"}})
+    second = temp.to_dataclass(dtypes={"config": {"int": "int"}})
+    assert type(first) is type(second)
+    assert first == second
+
+    # Bind with other dtypes
+    temp.from_dict(dict_object={"config": {"int": 1, "str": "A"}})
+    other = temp.to_dataclass(dtypes={"config": {"int": "int", "str": "str"}})
+    assert type(other) is not type(first)
+
+
+def test_to_dataclass_validationerror(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(dict_object={"config": {"int": 1}})
+
+    # Missing configuration values
+    with pytest.raises(config.errors.config.ValidationError):
+        temp.to_dataclass(
+            dtypes={"config": {"int": "int", "str": "str"}}
+        )
+
+    # Invalid field names
+    with pytest.raises(config.errors.config.ValidationError):
+        config.Schema(
+            dtypes={"config": {"class": "int"}}
+        ).make_dataclass()
+
+
+def test_validate_generic_dtypes_success(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(
+        dict_object={
+            "config": {
+                "thresholds": [0.5] * 1000,
+                "counts": {"A": 1, "B": None},
+                "optional": None,
+                "nested": {"int": 1, "deeper": {"list": ["A"]}}
+            }
+        }
+    )
+
+    assert temp.validate(
+        dtypes={
+            "config": {
+                "thresholds": "list[float]",
+                "counts": "dict[str, int | None]",
+                "optional": "Optional[int]",
+                "nested": {"int": "int", "deeper": {"list": "list[str]"}}
+            }
+        }
+    )
+
+
+def test_validate_generic_dtypes_validationerror(tmp_path):
+
+    temp = config.Handler(path=tmp_path, create=True)
+    temp.from_dict(
+        dict_object={
+            "config": {
+                "thresholds": [0.5, 1, "A"],
+                "counts": {"A": 1.0},
+                "union": [1],
+                "nested": {"int": "1", "missing": 1}
+            }
+        }
+    )
+
+    with pytest.raises(config.errors.config.ValidationError):
+        temp.validate(
+            dtypes={
+                "config": {
+                    "thresholds": "list[float]",
+                    "counts": "dict[str, int]",
+                    "union": "int | str",
+                    "nested": {"int": "int"}
+                }
+            }
+        )
+    assert temp.validation_errors == {
+        "config": {
+            "thresholds.1": "Invalid dtype {int}. Expected {float}.",
+            "thresholds.2": "Invalid dtype {str}. Expected {float}.",
+            "counts.A": "Invalid dtype {float}. Expected {int}.",
+            "union": "Invalid dtype {list}. Expected {int | str}.",
+            "nested.int": "Invalid dtype {str}. Expected {int}.",
+            "nested.missing": "No dtype found in {dtypes}."
+        }
+    }
+
+    # Invalid dtypes
+    with pytest.raises(config.errors.config.ValidationError):
+        config.Schema(dtypes={"config": {"list": "list[float"}})
+
+
+def test_write_optimistic_success(tmp_path):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    first = config.Handler(path=tmp_path, file_name='config_temp.json')
+    second = config.Handler(path=tmp_path, file_name='config_temp.json')
+
+    # Write
+    first.data['config']['int'] = 2
+    first.write(optimistic=True)
+    assert os.path.isfile(os.path.join(tmp_path, '.config_temp.json.lock'))
+
+    # Write after re-reading
+    second.read()
+    second.from_dict(
+        dict_object={"config": {"int": 3}},
+        optimistic=True
+    )
+
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"config": {"int": 3}}
+
+
+def test_write_optimistic_conflicterror(tmp_path):
+
+    # Output content to the config-file
+    with open(os.path.join(tmp_path, 'config_temp.json'), 'w') as file:
+        file.write('{"config": {"int": 1}}')
+    first = config.Handler(path=tmp_path, file_name='config_temp.json')
+    second = config.Handler(path=tmp_path, file_name='config_temp.json')
+
+    first.from_dict(dict_object={"config": {"int": 2}}, optimistic=True)
+
+    # Fail the stale write
+    with pytest.raises(config.errors.config.ConflictError):
+        second.apply_patch(
+            operations=[
+                {"op": "replace", "path": "/config/int", "value": 3}
+            ],
+            optimistic=True
+        )
+    assert config.Handler(
+        path=tmp_path,
+        file_name='config_temp.json'
+    ).data == {"config": {"int": 2}}
+    assert [
+        file_name for file_name in os.listdir(tmp_path)
+        if file_name.endswith('.tmp')
+    ] == []
+
+    # Retain the config data of the stale writer
+    assert second.data == {"config": {"int": 1}}
+    with pytest.raises(config.errors.config.ConflictError):
+        second.from_dict(
+            dict_object={"config": {"int": 3}},
+            optimistic=True
+        )
+    assert second.data == {"config": {"int": 1}}
+
+    # Retry after re-reading
+    second.read()
+    second.apply_patch(
+        operations=[{"op": "replace", "path": "/config/int", "value": 3}],
+        optimistic=True
+    )
+    assert first.read() == {"config": {"int": 3}}
@@ -14,7 +14,7 @@ from io import StringIO
 import pandas as pd
 import logging as clogging
 import pytest
-from pytensils import logging, errors
+from pytensils import logging, errors, config
 
 PATH = os.path.join(
     os.path.dirname(__file__),
@@ -463,6 +463,31 @@ def test_logging_close_on_exception_validationerror():
         raise_validationerror()
 
 
+def test_logging_close_on_exception_conflicterror():
+    with pytest.raises(errors.config.ConflictError):
+
+        # Initialize logging
+        Logging = logging.Handler(
+            path=PATH,
+            file_name='closes-on-exception-conflicterror.log',
+            description=''.join([
+                'Generates close-on-exception content for',
+                ' `pytenstils.logging` functionality.'
+            ]),
+            create=True,
+            debug_console=False
+        )
+
+        @Logging.close_on_exception
+        def raise_conflicterror():
+            errors.config.raise_exception(
+                msg='',
+                exception=errors.config.ConflictError()
+            )
+
+        raise_conflicterror()
+
+
 def test_logging_close_on_exception_notimplementederror():
     with pytest.raises(NotImplementedError):
 
@@ -486,3 +511,457 @@ def test_logging_close_on_exception_notimplementederror():
             )
 
         raise_notimplementederror()
+
+
+def test_progress_every_n_success(tmp_path):
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='progress.log',
+        create=True
+    )
+
+    # Track
+    with Logging.progress(
+        total=10,
+        every_seconds=None,
+        every_n=4,
+        description='Rows'
+    ) as progress:
+        for _ in range(10):
+            progress.update()
+
+    with open(os.path.join(tmp_path, 'progress.log'), 'r') as log:
+        lines = [line for line in log.readlines() if 'Rows' in line]
+
+    assert len(lines) == 3
+    assert 'INFO: Rows: 4 / 10 (40.0%)' in lines[0]
+    assert 'INFO: Rows: 8 / 10 (80.0%)' in lines[1]
+    assert 'INFO: Rows: completed 10 / 10' in lines[2]
+
+
+def test_progress_iterable_success(tmp_path):
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='progress.log',
+        create=True
+    )
+
+    # Track
+    items = [
+        item for item in Logging.progress(
+            iterable=range(1000),
+            every_seconds=3600
+        )
+    ]
+
+    with open(os.path.join(tmp_path, 'progress.log'), 'r') as log:
+        lines = [line for line in log.readlines() if 'Progress' in line]
+
+    assert items == list(range(1000))
+    assert len(lines) == 1
+    assert 'INFO: Progress: completed 1,000 / 1,000' in lines[0]
+
+
+def test_progress_iterable_break_success(tmp_path):
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='progress.log',
+        create=True
+    )
+
+    # Track
+    for item in Logging.progress(iterable=range(1000), every_seconds=3600):
+        if item == 9:
+            break
+
+    with open(os.path.join(tmp_path, 'progress.log'), 'r') as log:
+        lines = [line for line in log.readlines() if 'Progress' in line]
+
+    assert len(lines) == 1
+    assert 'INFO: Progress: completed 9 / 1,000' in lines[0]
+
+
+def test_progress_slowdown_success(tmp_path):
+    import time
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='progress.log',
+        create=True
+    )
+
+    # Track a loop that slows down
+    with Logging.progress(every_seconds=0.2, description='Rows') as progress:
+        end = time.perf_counter() + 0.3
+        while time.perf_counter() < end:
+            progress.update()
+        fast = progress.count
+        for _ in range(20):
+            time.sleep(0.05)
+            progress.update()
+
+    with open(os.path.join(tmp_path, 'progress.log'), 'r') as log:
+        lines = [
+            line for line in log.readlines()
+            if 'Rows' in line and 'completed' not in line
+        ]
+
+    assert len([
+        line for line in lines
+        if int(line.split('Rows: ')[1].split(' ')[0].replace(',', '')) > fast
+    ]) >= 2
+
+
+def test_progress_valueerror(tmp_path):
+    with pytest.raises(ValueError):
+
+        # Initialize logging
+        Logging = logging.Handler(
+            path=tmp_path,
+            file_name='progress.log',
+            create=True
+        )
+
+        Logging.progress(every_seconds=None, every_n=None)
+
+
+def test_merge_success(tmp_path):
+
+    # Initialize logging
+    A = logging.Handler(path=tmp_path, file_name='a.log', create=True)
+    B = logging.Handler(path=tmp_path, file_name='b.log', create=True)
+
+    # Write
+    A.write_header(header='Task')
+    A.write(content='Task (A).')
+    B.write_header(header='Task')
+    B.write(content='Task (B).')
+
+    # Close
+    A.close()
+    B.close()
+
+    # Merge
+    merged = logging.merge(
+        paths=[
+            os.path.join(tmp_path, 'a.log'),
+            os.path.join(tmp_path, 'b.log')
+        ],
+        path=tmp_path
+    )
+
+    with open(merged, 'r') as log:
+        lines = log.readlines()
+
+    headers = [
+        line.strip() for index, line in enumerate(lines[:-1])
+        if logging._is_header(line=line, underline=lines[index+1])
+    ]
+
+    assert headers == [
+        '[a] Run information',
+        '[a] Task',
+        '[b] Run information',
+        '[b] Task',
+        '[a] Run time',
+        '[b] Run time'
+    ]
+    assert '    Task (A).\n' in lines
+    assert '    Task (B).\n' in lines
+
+
+def test_merge_stream_success(tmp_path):
+
+    # Output a log-file without headers
+    with open(os.path.join(tmp_path, 'a.log'), 'w') as log:
+        log.writelines(
+            ['    INFO: Message (%s).\n' % (i) for i in range(20000)]
+        )
+
+    # Retrieve the blocks
+    with open(os.path.join(tmp_path, 'a.log'), 'r') as log:
+        blocks = [
+            (len(head), sum(1 for _ in body))
+            for head, body in logging._return_blocks(log=log)
+        ]
+
+    assert blocks == [(logging._HEAD_SIZE, 20000 - logging._HEAD_SIZE)]
+
+    # Merge
+    merged = logging.merge(
+        paths=[os.path.join(tmp_path, 'a.log')],
+        path=tmp_path
+    )
+
+    with open(merged, 'r') as log:
+        assert sum(1 for _ in log) == 20000
+
+
+def test_merge_valueerror(tmp_path):
+    with pytest.raises(ValueError):
+
+        # Initialize logging
+        _ = logging.Handler(path=tmp_path, file_name='a.log', create=True)
+
+        logging.merge(
+            paths=[os.path.join(tmp_path, 'a.log')],
+            path=tmp_path,
+            tags=['a', 'b']
+        )
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_summarize_success(tmp_path, max_workers: int):
+
+    # Initialize logging
+    A = logging.Handler(
+        path=tmp_path,
+        file_name='a.log',
+        metadata={'Environment': 'test'},
+        create=True
+    )
+    B = logging.Handler(path=tmp_path, file_name='b.log', create=True)
+
+    # Write
+    A.write(content='This is an error string.', level='ERROR')
+    A.write(content='This is an error string.', level='ERROR')
+    B.write(content='This is a warning string.', level='WARNING')
+
+    # Close
+    A.close()
+
+    @B.close_on_exception
+    def divide_by_zero():
+        return 1 / 0
+
+    with pytest.raises(ZeroDivisionError):
+        divide_by_zero()
+
+    # Summarize
+    df = logging.summarize(path=tmp_path, max_workers=max_workers)
+
+    assert list(df['File']) == [
+        os.path.join(tmp_path, 'a.log'),
+        os.path.join(tmp_path, 'b.log')
+    ]
+    assert list(df['Critical']) == [0, 1]
+    assert list(df['Error']) == [2, 0]
+    assert list(df['Warning']) == [0, 1]
+    assert list(df['Exception'].fillna('')) == ['', 'ZeroDivisionError']
+    assert list(df['Environment'].fillna('')) == ['test', '']
+    assert (df['End time'] >= df['Start time']).all()
+    assert (df['Run time'] >= pd.Timedelta(0)).all()
+
+
+def test_registry_success(tmp_path):
+
+    # Initialize the registry
+    registry = logging.Registry(path=tmp_path, batch_size=2)
+
+    # Initialize logging
+    A = logging.Handler(
+        path=tmp_path,
+        file_name='a.log',
+        metadata={'Environment': 'test'},
+        registry=registry
+    )
+    B = logging.Handler(path=tmp_path, file_name='b.log', registry=registry)
+
+    # Write
+    A.write(content='This is an error string.', level='ERROR')
+    A.write(content='This is a warning string.', level='WARNING')
+
+    # Close
+    A.close()
+
+    @B.close_on_exception
+    def divide_by_zero():
+        return 1 / 0
+
+    with pytest.raises(ZeroDivisionError):
+        divide_by_zero()
+
+    # Query
+    df = logging.Registry(path=tmp_path).query(
+        sql='SELECT * FROM runs ORDER BY log_path'
+    )
+
+    assert list(df['log_path']) == [
+        os.path.join(tmp_path, 'a.log'),
+        os.path.join(tmp_path, 'b.log')
+    ]
+    assert list(df['status']) == ['succeeded', 'failed']
+    assert list(df['error']) == [1, 0]
+    assert list(df['warning']) == [1, 0]
+    assert list(df['critical']) == [0, 1]
+    assert list(df['exception'].fillna('')) == ['', 'ZeroDivisionError']
+    assert df['metadata'][0] == '{"Environment": "test"}'
+    assert (df['run_time'] >= 0).all()
+
+
+def test_registry_close_on_exception_validationerror(tmp_path):
+
+    # Initialize the registry
+    registry = logging.Registry(path=tmp_path)
+
+    # Initialize logging
+    Logging = logging.Handler(path=tmp_path, registry=registry)
+
+    @Logging.close_on_exception
+    def raise_validationerror():
+        Logging.close()
+        errors.config.raise_exception(
+            msg='',
+            exception=errors.config.ValidationError()
+        )
+
+    with pytest.raises(errors.config.ValidationError):
+        raise_validationerror()
+
+    df = registry.query()
+
+    assert len(df) == 1
+    assert df['exception'][0] == 'ValidationError'
+    assert df['status'][0] == 'failed'
+
+
+def test_registry_close_on_exception_unclosed_success(tmp_path):
+
+    # Initialize the registry
+    registry = logging.Registry(path=tmp_path)
+
+    # Initialize logging
+    Logging = logging.Handler(path=tmp_path, registry=registry)
+
+    @Logging.close_on_exception
+    def raise_filenotfounderror():
+        config.Handler(path=tmp_path, file_name='config-does-not-exist.json')
+
+    with pytest.raises(errors.config.FileNotFoundError):
+        raise_filenotfounderror()
+
+    df = registry.query()
+
+    assert len(df) == 1
+    assert df['exception'][0] == 'FileNotFoundError'
+    assert df['status'][0] == 'failed'
+
+    # Leave the log-file unclosed
+    with open(os.path.join(tmp_path, Logging.file_name), 'r') as log:
+        assert 'Run time' not in log.read()
+
+
+def test_registry_max_delay_success(tmp_path):
+    import time
+
+    # Initialize the registry
+    registry = logging.Registry(path=tmp_path, max_delay=0.2)
+
+    # Initialize logging
+    Logging = logging.Handler(path=tmp_path, registry=registry)
+    Logging.close()
+
+    # Write the buffered run within the background timer
+    time.sleep(0.6)
+    assert len(logging.Registry(path=tmp_path).query()) == 1
+
+
+def test_registry_flush_on_exit_warning(tmp_path, monkeypatch, caplog):
+
+    # Initialize the registry
+    registry = logging.Registry(path=tmp_path, max_delay=60)
+
+    # Initialize logging
+    Logging = logging.Handler(path=tmp_path, registry=registry)
+    Logging.close()
+
+    # Fail the write on exit
+    monkeypatch.setattr(registry, 'flush', lambda timeout=None: False)
+    monkeypatch.setattr(logging.pytensils, 'propagate', True)
+    registry._flush_on_exit()
+
+    assert '1 run(s) could not be written' in caplog.text
+    assert registry._TIMER is None
+
+
+def test_registry_oserror(tmp_path):
+    with pytest.raises(OSError):
+        logging.Registry(path=os.path.join(tmp_path, 'path-does-not-exist'))
+
+
+def test_write_iterator_success(tmp_path):
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='iterator.log',
+        create=True
+    )
+
+    # Write
+    Logging.write(content=['A', 'B', 'C'])
+    Logging.write(content=(item for item in ['A', 'B', 'C']))
+
+    with open(os.path.join(tmp_path, 'iterator.log'), 'r') as log:
+        lines = log.readlines()
+
+    assert lines[-4:] == lines[-8:-4]
+    assert lines[-3:] == ['        - A\n', '        - B\n', '        - C\n']
+
+
+def test_write_ndarray_success(tmp_path):
+    import numpy as np
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='ndarray.log',
+        create=True
+    )
+
+    # Write
+    Logging.write(content=np.arange(10000))
+
+    with open(os.path.join(tmp_path, 'ndarray.log'), 'r') as log:
+        lines = log.readlines()
+
+    assert lines[-1] == '        [   0    1    2 ... 9997 9998 9999]\n'
+
+
+def test_write_interchange_success(tmp_path):
+
+    class Interchange():
+        def __init__(self, df: pd.DataFrame):
+            self.df = df
+
+        def __dataframe__(self, *args, **kwargs):
+            return self.df.__dataframe__(*args, **kwargs)
+
+    # Initialize logging
+    Logging = logging.Handler(
+        path=tmp_path,
+        file_name='interchange.log',
+        create=True
+    )
+
+    # Write
+    df = pd.DataFrame(
+        {
+            "Calories": [420, 380, 390],
+            "Duration": [50, 40, 45]
+        }
+    )
+    Logging.write(content=df)
+    Logging.write(content=Interchange(df=df))
+
+    with open(os.path.join(tmp_path, 'interchange.log'), 'r') as log:
+        lines = log.readlines()
+
+    assert lines[-6:] == lines[-12:-6]
@@ -10,6 +10,7 @@ Tests methods within `pytensils.utils`.
 """
 
 import os
+import json
 import pytest
 from pytensils import utils
 
@@ -115,3 +116,38 @@ def test_as_type_failure_typeerror_general():
             value='ABC',
             return_dtype='int'
         )
+
+
+@pytest.mark.parametrize('backend', ['json', 'orjson'])
+@pytest.mark.parametrize('obj', [
+    {"config": {"str": "ABC", "int": 1, "float": 9.9, "list": [1, [], {}]}},
+    {"config": {"str": "ÄBC", "float": 1e-05, "large": 1e16}},
+    {"config": {"nan": float('nan'), "int": 2**70}},
+    {1: {"tuple": ("A", "B")}},
+    {"a": {"b": "x\x7fy"}},
+    []
+])
+def test_json_dumps_success(monkeypatch, backend: str, obj):
+    if backend == 'orjson':
+        pytest.importorskip('orjson')
+    monkeypatch.setattr(utils, 'JSON_BACKEND', backend)
+    assert utils.json_dumps(obj, indent=4) == json.dumps(obj, indent=4)
+
+
+@pytest.mark.parametrize('backend', ['json', 'orjson'])
+def test_json_loads_success(monkeypatch, backend: str):
+    if backend == 'orjson':
+        pytest.importorskip('orjson')
+    monkeypatch.setattr(utils, 'JSON_BACKEND', backend)
+    assert utils.json_loads('{"A": [1, 9.9, "a"]}') == {"A": [1, 9.9, "a"]}
+    assert utils.json_loads(b'{"A": 1180591620717411303424}') == {
+        "A": 2**70
+    }
+    with pytest.raises(json.JSONDecodeError):
+        utils.json_loads('{"A": ')
+
+
+def test_json_loads_nameerror(monkeypatch):
+    monkeypatch.setattr(utils, 'JSON_BACKEND', 'unknown')
+    with pytest.raises(NameError):
+        utils.json_loads('{}')